@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+"""Peak memory of ``Plots.get_data`` against the three copies encoding.
+
+Run with ``python benchmarks/bench_get_data_memory.py`` with Flask-Plots
+installed, for example with ``pip install -e .``.
+"""
+
+import base64
+import io
+import tracemalloc
+
+from flask import Flask
+
+from flask_plots import Plots
+
+from matplotlib.figure import Figure
+
+import numpy as np
+
+
+class NullWriter(io.RawIOBase):
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return memoryview(data).nbytes
+
+
+def save_null(fig, fmt):
+    fig.savefig(NullWriter(), format=fmt)
+
+
+def make_heatmap():
+    fig = Figure(figsize=(38.4, 21.6), dpi=100)
+    ax = fig.add_axes([0, 0, 1, 1])
+    data = np.random.default_rng(0).random((2160, 3840))
+    ax.imshow(data, cmap="inferno", interpolation="none")
+    return fig
+
+
+def make_scatter():
+    fig = Figure()
+    ax = fig.subplots()
+    ax.scatter(*np.random.default_rng(0).random((2, 100_000)))
+    return fig
+
+
+def get_data_copies(fig, fmt="png", decode="ascii"):
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt)
+    return base64.b64encode(buf.getbuffer()).decode(decode)
+
+
+def peak(func, *args):
+    tracemalloc.start()
+    func(*args)
+    _, peak_size = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_size / 2**20
+
+
+def main():
+    plots = Plots(Flask(__name__))
+    for fmt, factory in [("png", make_heatmap), ("svg", make_scatter)]:
+        fig = factory()
+        size = len(plots.get_data(fig, fmt)) / 2**20
+        render = peak(save_null, fig, fmt)
+        print(
+            f"{fmt}: {size:.1f} MiB of base64, savefig alone peaks at "
+            f"{render:.1f} MiB"
+        )
+        for name, func in [
+            ("BytesIO + b64encode + decode", get_data_copies),
+            ("Plots.get_data", plots.get_data),
+        ]:
+            total = peak(func, fig, fmt)
+            print(
+                f"{name:>30}: peak {total:7.1f} MiB "
+                f"(+{total - render:.1f} MiB over savefig)"
+            )
+
+
+if __name__ == "__main__":
+    main()
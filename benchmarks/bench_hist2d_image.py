@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+"""Render time and size of ``Plots.hist2d`` as a mesh and as a image.
+
+Run with ``python benchmarks/bench_hist2d_image.py [bins] [points]`` with
+Flask-Plots installed, for example with ``pip install -e .``. The default
+is 1000x1000 bins of 1 million points.
+"""
+
+import io
+import sys
+import time
+
+from flask import Flask
+
+from flask_plots import Plots
+
+from matplotlib.figure import Figure
+
+import numpy as np
+
+
+def render(plots, x, y, bins, image, fmt):
+    fig = Figure()
+    plots.hist2d(fig, x, y, hist2d_kws={"bins": bins}, image=image)
+    buf = io.BytesIO()
+    start = time.perf_counter()
+    fig.savefig(buf, format=fmt)
+    return time.perf_counter() - start, buf.tell()
+
+
+def main(bins=1000, points=1_000_000):
+    app = Flask(__name__)
+    plots = Plots(app)
+    x, y = np.random.default_rng(0).normal(size=(2, points))
+    print(f"{bins}x{bins} bins, {points:,} points")
+    for fmt in ["png", "svg", "pdf"]:
+        for image in [False, True]:
+            with app.app_context():
+                elapsed, size = render(plots, x, y, bins, image, fmt)
+            name = "image" if image else "mesh"
+            print(f"{fmt:>4} {name:>5}: {elapsed:6.2f} s {size / 1e6:8.2f} MB")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+"""Scaling of the ``ParallelBinner`` from one to all the cores.
+
+Run with ``python benchmarks/bench_parallel_binning.py [points]`` with
+Flask-Plots installed, for example with ``pip install -e .``. The default
+is 10 million points, 100 million points need about 2 GiB of memory.
+"""
+
+import os
+import sys
+import time
+
+from flask_plots import HexbinAccumulator, Hist2dAccumulator, ParallelBinner
+from flask_plots.accumulators import BIN_CHUNK_SIZE, iter_chunks
+
+import numpy as np
+
+
+def serial_bin(acc, x, y):
+    for chunk in iter_chunks(BIN_CHUNK_SIZE, x, y):
+        acc.add(*chunk)
+    return acc
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(points=10_000_000):
+    x, y = np.random.default_rng(0).normal(size=(2, points))
+    edges = np.linspace(-5, 5, 257)
+    cases = [
+        ("hist2d", lambda: Hist2dAccumulator([edges, edges])),
+        ("hexbin", lambda: HexbinAccumulator((-5, 5, -5, 5), gridsize=100)),
+    ]
+    print(f"{points:,} points, {os.cpu_count()} cores")
+    for name, make in cases:
+        serial, expected = timed(serial_bin, make(), x, y)
+        print(f"{name}: serial {serial:.2f} s")
+        workers = 1
+        while workers <= os.cpu_count():
+            binner = ParallelBinner(workers, threshold=0)
+            # Start the processes before timing.
+            binner.fill(make(), x[:10], y[:10])
+            elapsed, acc = timed(binner.fill, make(), x, y)
+            binner.shutdown()
+            assert np.array_equal(acc.counts, expected.counts)
+            print(
+                f"{workers:>8} workers: {elapsed:.2f} s "
+                f"(x{serial / elapsed:.1f})"
+            )
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
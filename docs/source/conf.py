@@ -32,7 +32,7 @@ copyright = f"{datetime.date.today().year}, Ferreira Juan David"
 author = 'Ferreira Juan David'
 
 # The full version, including alpha/beta/rc tags
-release = '0.0.1'
+release = '0.0.2'
 
 
 # -- General configuration ---------------------------------------------------
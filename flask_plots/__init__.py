@@ -20,7 +20,7 @@ Implementation of Plots in Flask.
 # META
 # ============================================================================
 
-__version__ = "0.0.1"
+__version__ = "0.0.2"
 
 # =============================================================================
 # IMPORTS
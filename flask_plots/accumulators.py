@@ -0,0 +1,452 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+#
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-Plots.
+
+Accumulators that bin data by chunks, keeping only the counts.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import math
+import os
+
+import matplotlib as mpl
+import matplotlib.transforms as mtransforms
+
+import numpy as np
+
+#: Number of values binned at once for the out-of-core data.
+BIN_CHUNK_SIZE = 2**20
+
+#: Parameters of ``ax.pcolormesh`` that ``ax.imshow`` draws the same way.
+IMAGE_KWS = frozenset(
+    ["cmap", "norm", "vmin", "vmax", "alpha", "zorder", "label", "rasterized"]
+)
+
+# ``nonsingular`` is private since Matplotlib 3.11.
+_nonsingular = getattr(mtransforms, "_nonsingular", None) or getattr(
+    mtransforms, "nonsingular"
+)
+
+# =============================================================================
+# OUT-OF-CORE DATA
+# =============================================================================
+
+
+def out_of_core(x):
+    """Return *x* as a memory-mapped array, or ``None`` if it's in memory.
+
+    Parameters
+    ----------
+    x : object
+        A ``numpy.memmap`` or the path of a ``.npy`` file, anything else
+        is in memory.
+
+    .. versionadded:: 0.0.2
+    """
+    if isinstance(x, (str, os.PathLike)):
+        return np.load(x, mmap_mode="r")
+    if isinstance(x, np.memmap):
+        return x
+    return None
+
+
+def iter_chunks(chunk_size, *arrays):
+    """Yield the same slice of the arrays, ``None`` arrays stay ``None``."""
+    for start in range(0, len(arrays[0]), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        yield tuple(
+            None if a is None else np.asarray(a[chunk]) for a in arrays
+        )
+
+
+def chunked_range(x, chunk_size=BIN_CHUNK_SIZE):
+    """Return the minimum and the maximum of *x*, reading it by chunks.
+
+    Empty arrays have the range ``(0, 1)``, like ``np.histogram``.
+    """
+    low, high = None, None
+    for (chunk,) in iter_chunks(chunk_size, x):
+        if len(chunk):
+            low = chunk.min() if low is None else min(low, chunk.min())
+            high = chunk.max() if high is None else max(high, chunk.max())
+    return (0, 1) if low is None else (low, high)
+
+
+# =============================================================================
+# HISTOGRAMS
+# =============================================================================
+
+
+def _edges(bins, limits):
+    """Return the bin edges of ``bins``, an int or the edges."""
+    if np.iterable(bins):
+        return np.asarray(bins, float)
+    if limits is None:
+        raise ValueError("The limits are required when bins is an int")
+    return np.linspace(limits[0], limits[1], bins + 1)
+
+
+class HistAccumulator(object):
+    """Histogram with fixed bins, filled chunk by chunk.
+
+    Pass it as ``x`` to ``Plots.hist`` to draw it.
+
+    Parameters
+    ----------
+    bins : int or array-like
+        The number of bins, or the bin edges.
+
+    limits : (float, float) or None, default: None
+        The lower and upper range of the bins, the ``range`` of
+        ``ax.hist``, required when *bins* is an int.
+
+    .. versionadded:: 0.0.2
+    """
+
+    def __init__(self, bins, limits=None):
+        self.edges = _edges(bins, limits)
+        self.counts = np.zeros(len(self.edges) - 1)
+
+    @classmethod
+    def from_array(
+        cls, x, bins=None, limits=None, weights=None, chunk_size=BIN_CHUNK_SIZE
+    ):
+        """Bin a 1D array by chunks, with the same bins than ``ax.hist``.
+
+        When *bins* is an int and *limits* is ``None``, the range is
+        computed in a first pass over the data.
+        """
+        bins = mpl.rcParams["hist.bins"] if bins is None else bins
+        if isinstance(bins, str):
+            raise ValueError("Out-of-core histograms need an int or the edges")
+        if not np.iterable(bins):
+            if limits is None:
+                limits = chunked_range(x, chunk_size)
+            bins = np.histogram_bin_edges(np.empty(0, x.dtype), bins, limits)
+        acc = cls(bins)
+        for chunk, weight in iter_chunks(chunk_size, x, weights):
+            acc.add(chunk, weight)
+        return acc
+
+    def add(self, x, weights=None):
+        """Add a chunk of data, return the accumulator."""
+        self.counts += np.histogram(x, self.edges, weights=weights)[0]
+        return self
+
+    def merge(self, other):
+        """Add the counts of a accumulator with the same bins."""
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Can't merge histograms with different bins")
+        self.counts += other.counts
+        return self
+
+    def draw(self, ax, **kwargs):
+        """Draw the histogram with ``ax.hist``."""
+        return ax.hist(
+            self.edges[:-1], bins=self.edges, weights=self.counts, **kwargs
+        )
+
+
+class Hist2dAccumulator(object):
+    """2D histogram with fixed bins, filled chunk by chunk.
+
+    Pass it as ``x`` to ``Plots.hist2d`` to draw it.
+
+    Parameters
+    ----------
+    bins : int or array-like or [int, int] or [array, array]
+        The number of bins, or the bin edges, for both dimensions or for
+        each one.
+
+    limits : array-like shape(2, 2) or None, default: None
+        ``[[xmin, xmax], [ymin, ymax]]``, the ``range`` of ``ax.hist2d``,
+        required when the bins are ints.
+
+    .. versionadded:: 0.0.2
+    """
+
+    def __init__(self, bins, limits=None):
+        if not np.iterable(bins) or np.ndim(bins[0]) == 0 and len(bins) > 2:
+            bins = [bins, bins]
+        limits = [None, None] if limits is None else limits
+        self.xedges = _edges(bins[0], limits[0])
+        self.yedges = _edges(bins[1], limits[1])
+        self.counts = np.zeros((len(self.xedges) - 1, len(self.yedges) - 1))
+
+    @classmethod
+    def for_data(cls, x, y, bins=10, limits=None, chunk_size=BIN_CHUNK_SIZE):
+        """Return a empty accumulator, with the same bins than ``ax.hist2d``.
+
+        When the bins of a dimension are an int and its limits are
+        ``None``, the range is computed in a pass by chunks over the data.
+        """
+        if not np.iterable(bins) or np.ndim(bins[0]) == 0 and len(bins) > 2:
+            bins = [bins, bins]
+        limits = [None, None] if limits is None else limits
+        edges = []
+        for data, n, lims in zip((x, y), bins, limits):
+            if not np.iterable(n):
+                if lims is None:
+                    lims = tuple(map(float, chunked_range(data, chunk_size)))
+                n = np.histogram_bin_edges(np.empty(0), n, lims)
+            edges.append(n)
+        return cls(edges)
+
+    @classmethod
+    def from_array(
+        cls,
+        x,
+        y,
+        bins=10,
+        limits=None,
+        weights=None,
+        chunk_size=BIN_CHUNK_SIZE,
+    ):
+        """Bin two 1D arrays by chunks, see :meth:`for_data`."""
+        acc = cls.for_data(x, y, bins, limits, chunk_size)
+        for xs, ys, weight in iter_chunks(chunk_size, x, y, weights):
+            acc.add(xs, ys, weight)
+        return acc
+
+    def add(self, x, y, weights=None):
+        """Add a chunk of data, return the accumulator."""
+        self.counts += np.histogram2d(
+            x, y, [self.xedges, self.yedges], weights=weights
+        )[0]
+        return self
+
+    def merge(self, other):
+        """Add the counts of a accumulator with the same bins."""
+        if not (
+            np.array_equal(self.xedges, other.xedges)
+            and np.array_equal(self.yedges, other.yedges)
+        ):
+            raise ValueError("Can't merge histograms with different bins")
+        self.counts += other.counts
+        return self
+
+    def draw(self, ax, image=False, **kwargs):
+        """Draw the histogram with ``ax.hist2d``, or :func:`hist2d_image`."""
+        if image:
+            counts = self.counts
+            if kwargs.pop("density", False):
+                # The density of ``np.histogram2d``.
+                areas = np.outer(np.diff(self.xedges), np.diff(self.yedges))
+                counts = counts / counts.sum() / areas
+            return hist2d_image(ax, counts, self.xedges, self.yedges, **kwargs)
+        x, y = np.meshgrid(self.xedges[:-1], self.yedges[:-1], indexing="ij")
+        return ax.hist2d(
+            x.ravel(),
+            y.ravel(),
+            bins=[self.xedges, self.yedges],
+            weights=self.counts.ravel(),
+            **kwargs,
+        )
+
+
+def _uniform(edges):
+    """Return ``True`` if the bins are all of the same width."""
+    widths = np.diff(edges)
+    return np.allclose(widths, widths.mean(), rtol=1e-6, atol=0)
+
+
+def hist2d_image(ax, counts, xedges, yedges, cmin=None, cmax=None, **kwargs):
+    """
+    Draw the counts of a 2D histogram as a single image.
+
+    A ``AxesImage`` is much faster to draw, and much smaller in vector
+    outputs, than the ``QuadMesh`` of ``ax.hist2d``, with the same colors,
+    extent and limits. Irregular bins, log scales and parameters that
+    ``ax.imshow`` doesn't have are drawn with ``ax.pcolormesh`` instead.
+
+    Parameters
+    ----------
+    ax : matplotlib.Figure.Axis
+        A matplotlib axis.
+
+    counts : array-like, shape (nx, ny)
+        The values of the bins, as returned by ``numpy.histogram2d``.
+
+    xedges, yedges : array-like, shape (nx + 1, ) and (ny + 1, )
+        The bin edges.
+
+    cmin, cmax : float or None, default: None
+        The bins below *cmin* or above *cmax* are not drawn.
+
+    **kwargs
+        The parameters of ``ax.pcolormesh``.
+
+    Returns
+    -------
+    counts, xedges, yedges, artist
+        Like ``ax.hist2d``, the artist is a ``AxesImage`` or a
+        ``QuadMesh``.
+
+    .. versionadded:: 0.0.2
+    """
+    counts = np.array(counts, float)
+    if cmin is not None:
+        counts[counts < cmin] = np.nan
+    if cmax is not None:
+        counts[counts > cmax] = np.nan
+    if (
+        IMAGE_KWS.issuperset(kwargs)
+        and ax.get_xscale() == ax.get_yscale() == "linear"
+        and _uniform(xedges)
+        and _uniform(yedges)
+    ):
+        artist = ax.imshow(
+            counts.T,
+            origin="lower",
+            extent=(xedges[0], xedges[-1], yedges[0], yedges[-1]),
+            aspect=ax.get_aspect(),
+            interpolation="nearest",
+            **kwargs,
+        )
+    else:
+        artist = ax.pcolormesh(xedges, yedges, counts.T, **kwargs)
+    return counts, xedges, yedges, artist
+
+
+# =============================================================================
+# HEXBIN
+# =============================================================================
+
+
+class HexbinAccumulator(object):
+    """Hexagonal binning on a fixed grid, filled chunk by chunk.
+
+    The hexagons are the ones of ``ax.hexbin`` with the same *gridsize*
+    and *extent*. Pass it as ``x`` to ``Plots.hexbin`` to draw it.
+
+    Parameters
+    ----------
+    gridsize : int or (int, int), default: 100
+        The number of hexagons in the x-direction, or in both directions.
+
+    extent : (float, float, float, float)
+        The limits ``(xmin, xmax, ymin, ymax)`` of the grid.
+
+    .. versionadded:: 0.0.2
+    """
+
+    def __init__(self, extent, gridsize=100):
+        if np.iterable(gridsize):
+            nx, ny = gridsize
+        else:
+            nx, ny = gridsize, int(gridsize / math.sqrt(3))
+        xmin, xmax, ymin, ymax = extent
+        if xmin > xmax or ymin > ymax:
+            raise ValueError("In extent, the max must be greater than the min")
+        self.gridsize = gridsize
+        self.extent = tuple(extent)
+        self._shape = (nx, ny)
+        # Same padding than ``ax.hexbin`` to avoid roundoff errors.
+        padding = 1.0e-9 * (xmax - xmin)
+        xmin, xmax = xmin - padding, xmax + padding
+        self._origin = (xmin, ymin)
+        self._step = ((xmax - xmin) / nx, (ymax - ymin) / ny)
+        self.counts = np.zeros((nx + 1) * (ny + 1) + nx * ny)
+
+    @classmethod
+    def for_data(
+        cls, x, y, gridsize=100, extent=None, chunk_size=BIN_CHUNK_SIZE
+    ):
+        """Return a empty accumulator, with the grid of ``ax.hexbin``.
+
+        When *extent* is ``None``, it is computed in a pass by chunks over
+        the data.
+        """
+        if extent is None:
+            xmin, xmax = chunked_range(x, chunk_size)
+            ymin, ymax = chunked_range(y, chunk_size)
+            extent = _nonsingular(xmin, xmax, expander=0.1) + _nonsingular(
+                ymin, ymax, expander=0.1
+            )
+        return cls(extent, gridsize)
+
+    @classmethod
+    def from_array(
+        cls, x, y, gridsize=100, extent=None, chunk_size=BIN_CHUNK_SIZE
+    ):
+        """Bin two 1D arrays by chunks, see :meth:`for_data`."""
+        acc = cls.for_data(x, y, gridsize, extent, chunk_size)
+        for xs, ys in iter_chunks(chunk_size, x, y):
+            acc.add(xs, ys)
+        return acc
+
+    def add(self, x, y):
+        """Add a chunk of data, return the accumulator."""
+        nx, ny = self._shape
+        nx1, ny1 = nx + 1, ny + 1
+        ix = (np.asarray(x, float) - self._origin[0]) / self._step[0]
+        iy = (np.asarray(y, float) - self._origin[1]) / self._step[1]
+        ix1, iy1 = np.round(ix).astype(int), np.round(iy).astype(int)
+        ix2, iy2 = np.floor(ix).astype(int), np.floor(iy).astype(int)
+        i1 = np.where(
+            (0 <= ix1) & (ix1 < nx1) & (0 <= iy1) & (iy1 < ny1),
+            ix1 * ny1 + iy1 + 1,
+            0,
+        )
+        i2 = np.where(
+            (0 <= ix2) & (ix2 < nx) & (0 <= iy2) & (iy2 < ny),
+            ix2 * ny + iy2 + 1,
+            0,
+        )
+        d1 = (ix - ix1) ** 2 + 3.0 * (iy - iy1) ** 2
+        d2 = (ix - ix2 - 0.5) ** 2 + 3.0 * (iy - iy2 - 0.5) ** 2
+        bdist = d1 < d2
+        # [1:] drops the out-of-range points.
+        counts1 = np.bincount(i1[bdist], minlength=1 + nx1 * ny1)[1:]
+        counts2 = np.bincount(i2[~bdist], minlength=1 + nx * ny)[1:]
+        self.counts += np.concatenate([counts1, counts2])
+        return self
+
+    def merge(self, other):
+        """Add the counts of a accumulator with the same grid."""
+        if (self._shape, self.extent) != (other._shape, other.extent):
+            raise ValueError("Can't merge hexbins with different grids")
+        self.counts += other.counts
+        return self
+
+    def centers(self):
+        """Return the ``(x, y)`` centers of the hexagons."""
+        nx, ny = self._shape
+        x1, y1 = np.meshgrid(np.arange(nx + 1), np.arange(ny + 1))
+        x2, y2 = np.meshgrid(np.arange(nx) + 0.5, np.arange(ny) + 0.5)
+        x = np.concatenate([x1.T.ravel(), x2.T.ravel()])
+        y = np.concatenate([y1.T.ravel(), y2.T.ravel()])
+        return (
+            x * self._step[0] + self._origin[0],
+            y * self._step[1] + self._origin[1],
+        )
+
+    def draw(self, ax, mincnt=None, **kwargs):
+        """Draw the hexagons with ``ax.hexbin``."""
+        x, y = self.centers()
+        shown = self.counts >= (0 if mincnt is None else mincnt)
+        return ax.hexbin(
+            x[shown],
+            y[shown],
+            C=self.counts[shown],
+            reduce_C_function=np.sum,
+            gridsize=self.gridsize,
+            extent=self.extent,
+            **kwargs,
+        )
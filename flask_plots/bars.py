@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+#
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-Plots.
+
+Many bars drawn as a single collection, and the top-N categories.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from matplotlib.collections import PolyCollection
+
+import numpy as np
+
+# =============================================================================
+# BARS
+# =============================================================================
+
+
+def top_categories(x, height, top, others="others"):
+    """
+    Keep the *top* highest bars and sum the others in a single bar.
+
+    Parameters
+    ----------
+    x : array-like, shape (n, )
+        The categories of the bars.
+
+    height : float or array-like, shape (n, )
+        The heights of the bars.
+
+    top : int
+        The number of bars kept.
+
+    others : str, default: "others"
+        The category of the bar of the other heights.
+
+    Returns
+    -------
+    labels : list of str
+        The kept categories, from the highest, and *others*.
+
+    heights : numpy.ndarray
+        The heights of the bars.
+
+    .. versionadded:: 0.0.2
+    """
+    x = np.asarray(x)
+    height = np.broadcast_to(np.asarray(height, float), x.shape)
+    order = np.argsort(-height, kind="stable")
+    kept, rest = order[:top], order[top:]
+    labels = [str(category) for category in x[kept]]
+    heights = height[kept]
+    if len(rest):
+        labels.append(others)
+        heights = np.r_[heights, height[rest].sum()]
+    return labels, heights
+
+
+def bar_collection(
+    ax, x, height, width=0.8, bottom=0, align="center", color=None, **kwargs
+):
+    """
+    Draw vertical bars as a single ``PolyCollection``.
+
+    The bars, colors, limits and sticky edges are the ones of ``ax.bar``,
+    without a ``Rectangle`` per bar.
+
+    Parameters
+    ----------
+    ax : matplotlib.Figure.Axis
+        A matplotlib axis.
+
+    x, height, width, bottom, align
+        The bars of ``ax.bar``.
+
+    color : color or list of color, optional
+        The face colors, the next color of the axis by default.
+
+    **kwargs
+        The parameters of ``PolyCollection``, like *edgecolor*,
+        *linewidth*, *alpha* or *label*.
+
+    Returns
+    -------
+    collection : matplotlib.collections.PolyCollection
+        The bars.
+
+    .. versionadded:: 0.0.2
+    """
+    if align not in ("center", "edge"):
+        raise ValueError(f"align must be 'center' or 'edge', not {align!r}")
+    ax.xaxis.update_units(x)
+    x = np.asarray(ax.convert_xunits(x), float)
+    x, height, width, bottom = np.broadcast_arrays(
+        np.atleast_1d(x), height, width, bottom
+    )
+    left = x - width / 2 if align == "center" else x
+    right, top = left + width, bottom + height
+    verts = np.stack(
+        [
+            np.column_stack([left, bottom]),
+            np.column_stack([right, bottom]),
+            np.column_stack([right, top]),
+            np.column_stack([left, top]),
+        ],
+        axis=1,
+    )
+    color = kwargs.pop("facecolor", color)
+    if color is None:
+        color = ax._get_patches_for_fill.get_next_color()
+    collection = PolyCollection(verts, facecolors=color, **kwargs)
+    collection.sticky_edges.y[:] = np.unique(bottom)
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+#
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-Plots.
+
+Render cache and figure fingerprints.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import collections
+import hashlib
+import pickle
+import threading
+import time
+
+import matplotlib as mpl
+from matplotlib.cbook import CallbackRegistry
+from matplotlib.transforms import TransformNode
+
+import numpy as np
+
+# =============================================================================
+# FINGERPRINT
+# =============================================================================
+
+# Transform state that depends on object identity or on whether the figure
+# was already drawn, not on what the figure shows.
+_VOLATILE_TRANSFORM_STATE = ("_parents", "_invalid")
+
+
+class _FingerprintPickler(pickle.Pickler):
+    """Pickler that drops the volatile state of the transforms."""
+
+    def reducer_override(self, obj):
+        """Strip the identity based state of ``TransformNode`` objects.
+
+        The callback registries are left out, pickling them increments
+        their connection counter.
+        """
+        if isinstance(obj, CallbackRegistry):
+            return (CallbackRegistry, ())
+        if not isinstance(obj, TransformNode):
+            return NotImplemented
+        rv = obj.__reduce_ex__(pickle.DEFAULT_PROTOCOL)
+        state = {
+            k: v
+            for k, v in rv[2].items()
+            if k not in _VOLATILE_TRANSFORM_STATE
+        }
+        return (rv[0], rv[1], state) + tuple(rv[3:])
+
+
+class _HashWriter(object):
+    """File-like object that feeds everything written into a hash."""
+
+    def __init__(self):
+        self.hash = hashlib.blake2b(digest_size=16)
+
+    def write(self, data):
+        self.hash.update(data)
+
+
+def fingerprint(fig):
+    """
+    Compute a content fingerprint of a figure.
+
+    Two figures built the same way, with the same artists and data, have
+    the same fingerprint.
+
+    Parameters
+    ----------
+    fig : matplotlib.Figure
+        A instance of Figure Object.
+
+    Returns
+    -------
+    fingerprint : str or None
+        A hex digest, or ``None`` if the figure can't be serialized
+        (for example when it holds a ``lambda`` formatter).
+    """
+    writer = _HashWriter()
+    try:
+        _FingerprintPickler(writer, pickle.DEFAULT_PROTOCOL).dump(fig)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    return writer.hash.hexdigest()
+
+
+def data_fingerprint(*values):
+    """
+    Compute a content fingerprint of data and parameters.
+
+    Parameters
+    ----------
+    *values : array-like, sequences of them or hashable parameters
+        The arrays, and the objects converted to arrays by ``np.asarray``
+        like the ``pandas`` series, are hashed with their type and shape,
+        the other values with their ``repr``.
+
+    Returns
+    -------
+    fingerprint : str
+        A hex digest.
+
+    .. versionadded:: 0.0.2
+    """
+    hash_ = hashlib.blake2b(digest_size=16)
+    stack = list(values)[::-1]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, np.ma.MaskedArray):
+            stack.extend([value.data, np.ma.getmaskarray(value)])
+        elif isinstance(value, np.ndarray) and value.dtype.hasobject:
+            stack.append(value.tolist())
+        elif isinstance(value, np.ndarray):
+            value = np.ascontiguousarray(value)
+            hash_.update(f"{value.dtype.str}{value.shape}".encode())
+            hash_.update(memoryview(value.reshape(-1)).cast("B"))
+        elif isinstance(value, (list, tuple)):
+            hash_.update(f"{type(value).__name__}{len(value)}".encode())
+            stack.extend(value[::-1])
+        elif isinstance(value, dict):
+            stack.append(sorted(value.items()))
+        elif hasattr(value, "__array__") or (
+            hasattr(value, "__len__") and not isinstance(value, (str, bytes))
+        ):
+            array = np.asarray(value)
+            if array.dtype.hasobject and array.ndim == 0:
+                hash_.update(repr(value).encode())
+            else:
+                stack.append(array)
+        else:
+            hash_.update(repr(value).encode())
+    return hash_.hexdigest()
+
+
+def savefig_fingerprint():
+    """Compute a fingerprint of the ``savefig.*`` rcParams in effect.
+
+    They change the output of ``savefig`` without changing the figure.
+    """
+    return data_fingerprint(
+        {k: v for k, v in mpl.rcParams.items() if k.startswith("savefig.")}
+    )
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+
+class RenderCache(object):
+    """Thread safe LRU cache bounded by the total size of its values.
+
+    Parameters
+    ----------
+    max_bytes : int
+        The maximum size of all the values stored in the cache.
+
+    ttl : float or None, default: None
+        Seconds after which a entry expires. ``None`` never expires.
+
+    .. versionadded:: 0.0.2
+    """
+
+    def __init__(self, max_bytes, ttl=None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.currsize = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of entries."""
+        return len(self._data)
+
+    def __contains__(self, key):
+        """Return ``True`` if ``key`` is stored and not expired."""
+        return self.get(key, count=False) is not None
+
+    def get(self, key, count=True):
+        """Return the value stored for ``key`` or ``None``."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and self._expired(entry):
+                self._pop(key)
+                entry = None
+            if entry is None:
+                self.misses += count
+                return None
+            self._data.move_to_end(key)
+            self.hits += count
+            return entry[0]
+
+    def put(self, key, value, size=None):
+        """Store ``value``, evicting the least recently used entries.
+
+        ``size`` defaults to ``len(value)``. Values bigger than the whole
+        cache are not stored.
+        """
+        size = len(value) if size is None else size
+        if size > self.max_bytes:
+            return
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            if key in self._data:
+                self._pop(key)
+            self._data[key] = (value, size, expires)
+            self.currsize += size
+            while self.currsize > self.max_bytes:
+                self._pop(next(iter(self._data)))
+
+    def clear(self):
+        """Remove all the entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.currsize = self.hits = self.misses = 0
+
+    def info(self):
+        """Return the statistics of the cache as a ``dict``."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._data),
+            "currsize": self.currsize,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _expired(self, entry):
+        return entry[2] is not None and entry[2] <= time.monotonic()
+
+    def _pop(self, key):
+        self.currsize -= self._data.pop(key)[1]
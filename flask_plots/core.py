@@ -26,10 +26,131 @@ Implementation of Matplotlib in Flask.
 # IMPORTS
 # =============================================================================
 
+import asyncio
 import base64
-import io
-
-from flask import Blueprint, current_app
+import concurrent.futures
+import contextlib
+import contextvars
+import datetime as dt
+import threading
+import time
+import weakref
+
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    has_app_context,
+    request,
+    stream_with_context,
+)
+
+import matplotlib as mpl
+from matplotlib.axes._base import _process_plot_format
+from matplotlib.contour import ContourSet
+
+import numpy as np
+
+from .accumulators import (
+    BIN_CHUNK_SIZE,
+    HexbinAccumulator,
+    Hist2dAccumulator,
+    HistAccumulator,
+    hist2d_image,
+    out_of_core,
+)
+from .bars import bar_collection, top_categories
+from .cache import (
+    RenderCache,
+    data_fingerprint,
+    fingerprint,
+    savefig_fingerprint,
+)
+from .decimate import (
+    event_rows,
+    eventplot_density,
+    lttb,
+    m4,
+    thin_points,
+)
+from .encoding import Base64Writer, CHUNK_SIZE, iter_base64
+from .engine import (
+    ProcessRenderEngine,
+    RenderResult,
+    rasterized_dense,
+    render_figure,
+)
+from .grids import downsample_grid
+from .kde import violin_stats
+from .live import LiveFigure, iter_events
+from .parallel import ParallelBinner
+from .pool import FigurePool, FigureTemplate
+from .sketches import QuantileSketch
+from .streamlines import (
+    HAS_STREAM_INTEGRATOR,
+    StreamTrajectories,
+    TRAJECTORY_KWS,
+)
+
+#: Parameters of ``eventplot`` that the density images can draw.
+EVENTPLOT_DENSITY_KWS = frozenset(
+    [
+        "orientation",
+        "lineoffsets",
+        "linelengths",
+        "linewidths",
+        "colors",
+        "alpha",
+    ]
+)
+
+#: Parameters of ``boxplot`` that need the data, not its statistics.
+BOXPLOT_RAW_KWS = frozenset(
+    ["bootstrap", "usermedians", "conf_intervals", "autorange"]
+)
+
+#: Parameters of ``bar`` that the single collection of bars can draw.
+BAR_COLLECTION_KWS = frozenset(
+    [
+        "width",
+        "bottom",
+        "align",
+        "color",
+        "facecolor",
+        "edgecolor",
+        "linewidth",
+        "alpha",
+        "label",
+        "zorder",
+    ]
+)
+
+#: ``True`` when a ``ContourSet`` is a single collection of paths, as of
+#: Matplotlib 3.8, which the cache of :meth:`Plots.contourf` needs.
+HAS_CONTOUR_PATHS = tuple(mpl.__version_info__[:2]) >= (3, 8)
+
+#: Parameters of ``contourf`` that change the contour paths, the others only
+#: style them and are left out of the cache key of :meth:`Plots.contourf`.
+CONTOUR_KWS = frozenset(["corner_mask", "algorithm", "nchunk", "locator"])
+
+#: MIME types of the formats that can be served by the ``plots`` blueprint.
+MIMETYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "svg": "image/svg+xml",
+    "pdf": "application/pdf",
+    "eps": "application/postscript",
+    "ps": "application/postscript",
+    "tif": "image/tiff",
+    "tiff": "image/tiff",
+    "webp": "image/webp",
+}
+
+#: Formats whose writers seek back in the file, they are rendered to a
+#: ``BytesIO`` before being encoded instead of through a ``Base64Writer``.
+SEEKING_FORMATS = frozenset(["tif", "tiff"])
 
 
 def raise_helper(message):  # pragma: no cover
@@ -37,6 +158,46 @@ def raise_helper(message):  # pragma: no cover
     raise RuntimeError(message)
 
 
+class _AppState(object):
+    """Settings and worker pools of the extension for one app."""
+
+    def __init__(self):
+        self.cache = None
+        self.engine = None
+        self.render_threads = None
+        self.batch_engine = None
+        self.figure_pool = None
+        self.executor = None
+        self.executor_lock = threading.Lock()
+        self.stream_slots = None
+        self.chunk_size = BIN_CHUNK_SIZE
+        self.binner = None
+        self.rasterize_threshold = None
+        self.hist2d_image = False
+        self.contourf_resample = False
+
+    def shutdown(self):
+        """Stop the worker pools of the app."""
+        with self.executor_lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown()
+        for engine in {self.engine, self.batch_engine, self.binner} - {None}:
+            engine.shutdown()
+
+
+def _state_property(name, doc):
+    """Return a property read from the state of the current app."""
+
+    def fget(self):
+        return getattr(self._app_state(), name)
+
+    def fset(self, value):
+        setattr(self._app_state(), name, value)
+
+    return property(fget, fset, doc=doc)
+
+
 class Plots(object):
     """Base extension class for different Plots versions.
 
@@ -44,17 +205,141 @@ class Plots(object):
     """
 
     static_folder = "plots"
+
+    cache = _state_property(
+        "cache", "The :class:`RenderCache` of the app, ``None`` if disabled."
+    )
+    engine = _state_property(
+        "engine", "The render engine of the app, ``None`` renders inline."
+    )
+    batch_engine = _state_property(
+        "batch_engine", "The process engine of :meth:`render_many`."
+    )
+    render_threads = _state_property(
+        "render_threads", "The size of the thread pool of :attr:`executor`."
+    )
+    figure_pool = _state_property(
+        "figure_pool", "The :class:`FigurePool` of :meth:`pooled_figure`."
+    )
+    binner = _state_property(
+        "binner", "The :class:`ParallelBinner`, ``None`` if disabled."
+    )
+    chunk_size = _state_property(
+        "chunk_size", "The number of points binned at once."
+    )
+    rasterize_threshold = _state_property(
+        "rasterize_threshold", "The size of the rasterized vector artists."
+    )
+    hist2d_image = _state_property(
+        "hist2d_image", "The default ``image`` of :meth:`hist2d`."
+    )
+    contourf_resample = _state_property(
+        "contourf_resample", "The default ``resample`` of :meth:`contourf`."
+    )
+
     # Generate the figure **without using pyplot**.
 
     def __init__(self, app=None):
+        self._state = _AppState()
+        self._states = weakref.WeakKeyDictionary()
+        self.figures = {}
+        self.templates = {}
+        self._modified = {}
+        self._drawn = weakref.WeakKeyDictionary()
+        self.streams = {}
         if app is not None:
             self.init_app(app)
 
     def init_app(self, app):
-        """Sample factory function for initialize the extension."""
+        """Sample factory function for initialize the extension.
+
+        The settings and worker pools read from the config belong to
+        ``app``, the extension uses the ones of ``current_app``, or of the
+        last initialized app outside of an app context.
+        """
+        state = _AppState()
         app.config.setdefault("PLOTS_CMAP", "Greys")
         app.config.setdefault("STATIC_FOLDER", "plots")
         app.config.setdefault("BAR_HEIGHT", 50)
+        app.config.setdefault("PLOTS_CACHE_ENABLED", False)
+        app.config.setdefault("PLOTS_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+        app.config.setdefault("PLOTS_CACHE_TTL", None)
+        app.config.setdefault("PLOTS_URL_PREFIX", "/plots")
+        app.config.setdefault("PLOTS_MAX_AGE", 0)
+        app.config.setdefault("PLOTS_STREAM_MAX", 8)
+        app.config.setdefault("PLOTS_STREAM_INTERVAL", 1.0)
+        app.config.setdefault("PLOTS_STREAM_MAX_FRAMES", None)
+        state.stream_slots = threading.BoundedSemaphore(
+            app.config["PLOTS_STREAM_MAX"]
+        )
+        app.config.setdefault("PLOTS_RENDER_ENGINE", "inline")
+        app.config.setdefault("PLOTS_RENDER_WORKERS", None)
+        app.config.setdefault("PLOTS_RENDER_MAX_TASKS_PER_CHILD", None)
+        app.config.setdefault("PLOTS_RENDER_THREADS", None)
+        app.config.setdefault("PLOTS_BATCH_EXECUTOR", "thread")
+        app.config.setdefault("PLOTS_FIGURE_POOL_SIZE", 8)
+        app.config.setdefault("PLOTS_FIGURE_POOL_FIGSIZE", None)
+        app.config.setdefault("PLOTS_FIGURE_POOL_DPI", None)
+        state.figure_pool = FigurePool(
+            app.config["PLOTS_FIGURE_POOL_SIZE"],
+            figsize=app.config["PLOTS_FIGURE_POOL_FIGSIZE"],
+            dpi=app.config["PLOTS_FIGURE_POOL_DPI"],
+        )
+        app.config.setdefault("PLOTS_FIGURE_TEMPLATES", {})
+        app.config.setdefault("PLOTS_CHUNK_SIZE", BIN_CHUNK_SIZE)
+        state.chunk_size = app.config["PLOTS_CHUNK_SIZE"]
+        app.config.setdefault("PLOTS_RASTERIZE_THRESHOLD", 10_000)
+        state.rasterize_threshold = app.config["PLOTS_RASTERIZE_THRESHOLD"]
+        app.config.setdefault("PLOTS_LINE_DECIMATE", "m4")
+        app.config.setdefault("PLOTS_EVENTPLOT_DENSITY", 4)
+        app.config.setdefault("PLOTS_HIST2D_IMAGE", False)
+        state.hist2d_image = app.config["PLOTS_HIST2D_IMAGE"]
+        app.config.setdefault("PLOTS_CONTOURF_RESAMPLE", False)
+        app.config.setdefault("PLOTS_QUIVER_REGRID_THRESHOLD", 10_000)
+        app.config.setdefault("PLOTS_QUIVER_SPACING", 20)
+        app.config.setdefault("PLOTS_BAR_COLLECTION_THRESHOLD", 1000)
+        state.contourf_resample = app.config["PLOTS_CONTOURF_RESAMPLE"]
+        app.config.setdefault("PLOTS_VIOLIN_FFT_THRESHOLD", 10_000)
+        app.config.setdefault("PLOTS_SCATTER_THIN", False)
+        app.config.setdefault("PLOTS_SCATTER_THIN_THRESHOLD", 1)
+        app.config.setdefault("PLOTS_PARALLEL_BINNING", False)
+        app.config.setdefault("PLOTS_PARALLEL_WORKERS", None)
+        app.config.setdefault("PLOTS_PARALLEL_THRESHOLD", 5_000_000)
+        if app.config["PLOTS_PARALLEL_BINNING"]:
+            state.binner = ParallelBinner(
+                app.config["PLOTS_PARALLEL_WORKERS"],
+                threshold=app.config["PLOTS_PARALLEL_THRESHOLD"],
+                chunk_size=state.chunk_size,
+            )
+        for name, builder in app.config["PLOTS_FIGURE_TEMPLATES"].items():
+            self.register_template(name, builder)
+        state.render_threads = app.config["PLOTS_RENDER_THREADS"]
+        if app.config["PLOTS_CACHE_ENABLED"]:
+            state.cache = RenderCache(
+                app.config["PLOTS_CACHE_MAX_BYTES"],
+                ttl=app.config["PLOTS_CACHE_TTL"],
+            )
+        if app.config["PLOTS_RENDER_ENGINE"] == "process":
+            state.engine = ProcessRenderEngine(
+                app.config["PLOTS_RENDER_WORKERS"],
+                app.config["PLOTS_RENDER_MAX_TASKS_PER_CHILD"],
+            )
+        elif app.config["PLOTS_RENDER_ENGINE"] != "inline":
+            raise ValueError(
+                "PLOTS_RENDER_ENGINE must be 'inline' or 'process', not "
+                f"{app.config['PLOTS_RENDER_ENGINE']!r}"
+            )
+        if app.config["PLOTS_BATCH_EXECUTOR"] == "process":
+            state.batch_engine = state.engine or ProcessRenderEngine(
+                app.config["PLOTS_RENDER_WORKERS"],
+                app.config["PLOTS_RENDER_MAX_TASKS_PER_CHILD"],
+            )
+        elif app.config["PLOTS_BATCH_EXECUTOR"] != "thread":
+            raise ValueError(
+                "PLOTS_BATCH_EXECUTOR must be 'thread' or 'process', not "
+                f"{app.config['PLOTS_BATCH_EXECUTOR']!r}"
+            )
+        self._states[app] = self._state = state
         if not hasattr(app, "extensions"):  # pragma: no cover
             app.extensions = {}
         app.extensions["plots"] = self
@@ -65,6 +350,16 @@ class Plots(object):
             static_url_path=f"{app.static_url_path}",
             template_folder="templates",
         )
+        blueprint.add_url_rule(
+            f"{app.config['PLOTS_URL_PREFIX']}/<name>.<fmt>",
+            "figure",
+            self._serve_figure,
+        )
+        blueprint.add_url_rule(
+            f"{app.config['PLOTS_URL_PREFIX']}/<name>/stream",
+            "stream",
+            self._serve_stream,
+        )
         app.register_blueprint(blueprint)
         app.jinja_env.globals["plots"] = self
         app.jinja_env.globals["raise"] = raise_helper
@@ -84,13 +379,516 @@ class Plots(object):
 
         decode : str, default: "ascii"
             A buffer decode.
+
+        Notes
+        -----
+        When ``app.config["PLOTS_CACHE_ENABLED"]`` is ``True`` the rendered
+        image is stored in ``plots.cache``, keyed by a fingerprint of the
+        figure and of the ``savefig.*`` rcParams, and reused for identical
+        figures or for the same figure rendered again unchanged. Otherwise
+        ``savefig`` writes straight into a :class:`Base64Writer` and the raw
+        image is never held in memory as a whole, except for the formats of
+        ``SEEKING_FORMATS`` like TIFF.
+
+        In vector formats, the lines and collections with more than
+        ``app.config["PLOTS_RASTERIZE_THRESHOLD"]`` elements are
+        rasterized, ``None`` keeps everything as vectors.
+        """
+        streamed = fmt not in SEEKING_FORMATS
+        if self.cache is None and self.engine is None and streamed:
+            writer = Base64Writer(decode)
+            with rasterized_dense(fig, fmt, self.rasterize_threshold):
+                fig.savefig(writer, format=fmt)
+            return writer.getvalue()
+        data = base64.b64encode(self.get_bytes(fig, fmt)).decode(decode)
+        return data
+
+    def iter_data(self, fig, fmt="png", decode="ascii", chunk_size=None):
+        """
+        Yield the data of :meth:`get_data` in chunks.
+
+        Suitable for a streamed response, only one chunk of the encoded
+        image is alive at a time.
+
+        Parameters
+        ----------
+        fig : matplotlib.Figure
+            A instance of Figure Object.
+
+        fmt : str, default: "png"
+            A extension type for the images.
+
+        decode : str, default: "ascii"
+            A buffer decode.
+
+        chunk_size : int or None (optional)
+            The size of the raw blocks encoded at once, defaults to
+            ``flask_plots.CHUNK_SIZE``.
+        """
+        chunk_size = CHUNK_SIZE if chunk_size is None else chunk_size
+        yield from iter_base64(self.get_bytes(fig, fmt), decode, chunk_size)
+
+    def get_bytes(self, fig, fmt="png"):
+        """
+        Render the figure to the raw bytes of the image.
+
+        Parameters
+        ----------
+        fig : matplotlib.Figure
+            A instance of Figure Object.
+
+        fmt : str, default: "png"
+            A extension type for the images.
+
+        Returns
+        -------
+        data : bytes
+            The image file contents.
+
+        Notes
+        -----
+        With ``app.config["PLOTS_RENDER_ENGINE"] = "process"`` the figure
+        is rendered in a pool of ``app.config["PLOTS_RENDER_WORKERS"]``
+        processes, stopped by :meth:`shutdown` when the interpreter exits.
+        """
+        digest = self._fingerprint(fig) if self.cache is not None else None
+        return self._render(fig, fmt, digest)
+
+    def _fingerprint(self, fig):
+        """Return the fingerprint of the figure as it was before a render.
+
+        Drawing a figure changes its state, and so its fingerprint, without
+        changing what it shows. :meth:`_render` remembers the fingerprint
+        of the figures it drew, so an unchanged figure keeps its key.
         """
-        buf = io.BytesIO()
-        fig.savefig(buf, format=fmt)
-        data = base64.b64encode(buf.getbuffer()).decode(decode)
+        digest = fingerprint(fig)
+        drawn = self._drawn.get(fig)
+        if drawn is not None and digest is not None and drawn[0] == digest:
+            return drawn[1]
+        return digest
+
+    def _render(self, fig, fmt, digest, engine=None):
+        """Render the figure, going through the cache when enabled."""
+        engine = self.engine if engine is None else engine
+        key = None
+        if self.cache is not None and digest is not None:
+            key = (digest, fmt, fig.dpi, savefig_fingerprint())
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        with rasterized_dense(fig, fmt, self.rasterize_threshold):
+            if engine is None:
+                data = render_figure(fig, fmt)
+            else:
+                data = engine.render(fig, fmt)
+        if key is not None:
+            self.cache.put(key, data)
+            self._drawn[fig] = (fingerprint(fig), digest)
         return data
 
+    @contextlib.contextmanager
+    def pooled_figure(self, nrows=1, ncols=1):
+        """
+        Borrow a clean figure from the figure pool.
+
+        The figure comes with its Agg canvas and a grid of axes, it goes
+        back to ``plots.figure_pool`` at the end of the ``with`` block, so
+        call :meth:`get_data` inside it. The pool keeps up to
+        ``app.config["PLOTS_FIGURE_POOL_SIZE"]`` idle figures.
+
+        Parameters
+        ----------
+        nrows, ncols : int, default: 1
+            Number of rows/columns of the subplot grid.
+
+        Examples
+        --------
+        >>> with plots.pooled_figure() as fig:
+        ...     ax = plots.bar(fig, ["Argentina", "Brasil"], [14, 40])
+        ...     data = plots.get_data(fig)
+        """
+        fig = self.figure_pool.acquire(nrows, ncols)
+        try:
+            yield fig
+        finally:
+            self.figure_pool.release(fig)
+
+    def register_template(self, name, builder):
+        """
+        Register a figure template, see :meth:`from_template`.
+
+        The templates of ``app.config["PLOTS_FIGURE_TEMPLATES"]``, a
+        ``dict`` of names and builders, are registered by
+        :meth:`init_app`.
+
+        Parameters
+        ----------
+        name : str
+            The name of the template.
+
+        builder : callable
+            A function without arguments that returns a
+            ``matplotlib.Figure`` with the parts shared by every request.
+            It runs once, on the first use of the template.
+        """
+        self.templates[name] = FigureTemplate(builder)
+        return builder
+
+    def figure_template(self, name=None):
+        """Register the decorated function with :meth:`register_template`."""
+
+        def decorator(builder):
+            return self.register_template(name or builder.__name__, builder)
+
+        return decorator
+
+    def from_template(self, name):
+        """
+        Return a new copy of the figure of a template.
+
+        Only the data artists are left to add with the plot methods,
+        the axes, titles and tick formatting are already in place.
+
+        Parameters
+        ----------
+        name : str
+            The name of the template.
+
+        Examples
+        --------
+        >>> @plots.figure_template("load")
+        ... def load():
+        ...     fig = Figure(figsize=(8, 4))
+        ...     ax = fig.subplots()
+        ...     ax.set_title("CPU load")
+        ...     ax.yaxis.set_major_formatter(PercentFormatter())
+        ...     return fig
+        >>> fig = plots.from_template("load")
+        >>> ax = plots.bar(fig, hosts, loads)
+        """
+        return self.templates[name].clone()
+
+    def live(self, fig, prop_cycle=None):
+        """
+        Return a :class:`LiveFigure` for a frequently refreshed figure.
+
+        The artists already on ``fig`` are rendered once as the
+        background, every frame only draws the artists added after.
+
+        Parameters
+        ----------
+        fig : matplotlib.Figure
+            A instance of Figure Object with the static parts, the limits
+            of the axes must be set.
+
+        prop_cycle : cycler.Cycler or None, default: None
+            The property cycle restored after every frame, ``None`` uses
+            ``rcParams["axes.prop_cycle"]``.
+
+        Examples
+        --------
+        >>> live = plots.live(fig)
+        >>> ax = plots.errorbar(live.figure, x, y, errorbar_kws={"yerr": e})
+        >>> data = live.get_data()
+        """
+        return LiveFigure(fig, prop_cycle)
+
+    def render_many(self, figures, fmt="png", decode="ascii"):
+        """
+        Render many figures at the same time.
+
+        The figures are rendered in :attr:`executor`, with
+        ``app.config["PLOTS_BATCH_EXECUTOR"] = "process"`` the threads
+        hand the figures to a pool of processes.
+
+        Parameters
+        ----------
+        figures : iterable of matplotlib.Figure
+            The figures to render.
+
+        fmt : str, default: "png"
+            A extension type for the images.
+
+        decode : str, default: "ascii"
+            A buffer decode.
+
+        Returns
+        -------
+        results : list of RenderResult
+            One result per figure, in the same order. A figure that fails
+            to render has its exception in ``error`` and doesn't stop the
+            others.
+        """
+        futures = [
+            self.executor.submit(
+                contextvars.copy_context().run,
+                self._timed_render,
+                fig,
+                fmt,
+                decode,
+            )
+            for fig in figures
+        ]
+        return [future.result() for future in futures]
+
+    def _timed_render(self, fig, fmt, decode):
+        """Render a figure of :meth:`render_many`."""
+        start = time.perf_counter()
+        try:
+            digest = self._fingerprint(fig) if self.cache is not None else None
+            data = self._render(fig, fmt, digest, self.batch_engine)
+            data = base64.b64encode(data).decode(decode)
+        except Exception as error:
+            return RenderResult(None, error, time.perf_counter() - start)
+        return RenderResult(data, None, time.perf_counter() - start)
+
+    async def get_bytes_async(self, fig, fmt="png"):
+        """
+        Render the figure without blocking the event loop.
+
+        The render runs in :attr:`executor`, so an ``async`` view can
+        ``asyncio.gather`` several figures at once. Cancelling the awaiting
+        task drops the render if it didn't start yet.
+
+        Parameters
+        ----------
+        fig : matplotlib.Figure
+            A instance of Figure Object.
+
+        fmt : str, default: "png"
+            A extension type for the images.
+
+        Returns
+        -------
+        data : bytes
+            The image file contents.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            contextvars.copy_context().run,
+            self.get_bytes,
+            fig,
+            fmt,
+        )
+
+    async def get_data_async(self, fig, fmt="png", decode="ascii"):
+        """
+        Create the data of :meth:`get_data` without blocking the event loop.
+
+        Parameters
+        ----------
+        fig : matplotlib.Figure
+            A instance of Figure Object.
+
+        fmt : str, default: "png"
+            A extension type for the images.
+
+        decode : str, default: "ascii"
+            A buffer decode.
+        """
+        data = await self.get_bytes_async(fig, fmt)
+        return base64.b64encode(data).decode(decode)
+
+    @property
+    def executor(self):
+        """
+        Thread pool used to render the figures off the calling thread.
+
+        The size is ``app.config["PLOTS_RENDER_THREADS"]``, ``None`` uses
+        the default of ``concurrent.futures.ThreadPoolExecutor``.
+        """
+        state = self._app_state()
+        with state.executor_lock:
+            if state.executor is None:
+                state.executor = concurrent.futures.ThreadPoolExecutor(
+                    state.render_threads, thread_name_prefix="plots"
+                )
+            return state.executor
+
+    def shutdown(self):
+        """Stop the worker pools, the process pools also stop at exit."""
+        for state in {self._state, *self._states.values()}:
+            state.shutdown()
+
+    def _app_state(self):
+        """Return the state of ``current_app`` or of the last app."""
+        if has_app_context():
+            app = current_app._get_current_object()
+            return self._states.get(app, self._state)
+        return self._state
+
+    def register_figure(self, name, func):
+        """
+        Register a figure factory served by the ``plots`` blueprint.
+
+        The image is available at ``/plots/<name>.<fmt>``, build it in the
+        templates with the ``render_img_url`` macro.
+
+        Parameters
+        ----------
+        name : str
+            The name of the figure in the url.
+
+        func : callable
+            A function without arguments that returns a
+            ``matplotlib.Figure``. Use ``flask.request`` to read the
+            query string.
+        """
+        self.figures[name] = func
+        return func
+
+    def figure(self, name=None):
+        """Register the decorated function with :meth:`register_figure`."""
+
+        def decorator(func):
+            return self.register_figure(name or func.__name__, func)
+
+        return decorator
+
+    def _serve_figure(self, name, fmt):
+        """View that returns a registered figure as a image."""
+        if name not in self.figures or fmt not in MIMETYPES:
+            abort(404)
+        fig = self.figures[name]()
+        digest = self._fingerprint(fig)
+        if digest is None:
+            return Response(
+                self._render(fig, fmt, None), mimetype=MIMETYPES[fmt]
+            )
+        etag = f"{digest}-{fmt}-{fig.dpi:g}"
+        last_modified = self._last_modified(name, fmt, etag)
+        if self._not_modified(etag, last_modified):
+            response = Response(status=304)
+        else:
+            response = Response(
+                self._render(fig, fmt, digest), mimetype=MIMETYPES[fmt]
+            )
+        response.set_etag(etag)
+        response.last_modified = last_modified
+        response.cache_control.max_age = current_app.config["PLOTS_MAX_AGE"]
+        return response
+
+    def register_stream(self, name, setup, update, fmt="png", interval=None):
+        """
+        Register a live figure streamed by the ``plots`` blueprint.
+
+        The frames are sent as Server-Sent Events by
+        ``/plots/<name>/stream``, show them in the templates with the
+        ``render_img_stream`` macro. Every stream builds its figure once
+        and redraws only the data artists, see :class:`LiveFigure`.
+        Frames identical to the previous one are replaced by a keepalive
+        comment, so the slot of a client that went away is released on the
+        next write. At most ``app.config["PLOTS_STREAM_MAX"]`` streams run
+        at the same time, the other requests get a ``503``.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stream in the url.
+
+        setup : callable
+            A function without arguments that returns a
+            ``matplotlib.Figure`` with the static parts.
+
+        update : callable
+            A function called with the figure before every frame to add
+            the data artists.
+
+        fmt : str, default: "png"
+            A raster extension type for the images.
+
+        interval : float or None (optional)
+            Seconds between two frames, defaults to
+            ``app.config["PLOTS_STREAM_INTERVAL"]``.
+        """
+        self.streams[name] = (setup, update, fmt, interval)
+
+    def _serve_stream(self, name):
+        """View that streams the frames of a registered live figure."""
+        if name not in self.streams:
+            abort(404)
+        slots = self._app_state().stream_slots
+        if not slots.acquire(blocking=False):
+            abort(503)
+        try:
+            setup, update, fmt, interval = self.streams[name]
+            config = current_app.config
+            events = iter_events(
+                LiveFigure(setup()),
+                update,
+                fmt=fmt,
+                interval=(
+                    config["PLOTS_STREAM_INTERVAL"]
+                    if interval is None
+                    else interval
+                ),
+                max_frames=config["PLOTS_STREAM_MAX_FRAMES"],
+            )
+            response = Response(
+                stream_with_context(events), mimetype="text/event-stream"
+            )
+        except BaseException:
+            slots.release()
+            raise
+        response.call_on_close(slots.release)
+        response.cache_control.no_cache = True
+        response.headers["X-Accel-Buffering"] = "no"
+        return response
+
+    def _last_modified(self, name, fmt, etag):
+        """Return when the image of a registered figure last changed."""
+        previous = self._modified.get((name, fmt))
+        if previous is not None and previous[0] == etag:
+            return previous[1]
+        now = dt.datetime.now(dt.timezone.utc).replace(microsecond=0)
+        self._modified[(name, fmt)] = (etag, now)
+        return now
+
+    def _not_modified(self, etag, last_modified):
+        """Evaluate the conditional headers of the current request."""
+        if request.if_none_match:
+            return request.if_none_match.contains(etag)
+        if request.if_modified_since:
+            return last_modified <= request.if_modified_since
+        return False
+
     # Statistics plots: Plots for statistical analysis.
+    def _bin(self, accumulator, x, y, kws, **defaults):
+        """
+        Bin out-of-core or large data without Matplotlib.
+
+        The data are binned by chunks when they are memory-mapped, and by
+        the ``ParallelBinner`` when they are large enough.
+
+        Returns
+        -------
+        x, y, kws
+            The accumulator, ``None`` and the remaining parameters of the
+            plot, or the arguments unchanged when Matplotlib bins the data.
+        """
+        xs, ys = out_of_core(x), out_of_core(y)
+        data = x if xs is None else xs
+        parallel = self.binner is not None and self.binner.accepts(data, kws)
+        if xs is None and ys is None and not parallel:
+            return x, y, kws
+        x, y = data, (y if ys is None else ys)
+        kws = dict(kws)
+        params = {key: kws.pop(key, value) for key, value in defaults.items()}
+        if "range" in params:  # Named ``limits`` in the accumulators.
+            params["limits"] = params.pop("range")
+        if parallel:
+            # The binner doesn't accept weights, they are always None here.
+            params.pop("weights", None)
+            acc = accumulator.for_data(
+                x, y, chunk_size=self.chunk_size, **params
+            )
+            return self.binner.fill(acc, x, y), None, kws
+        acc = accumulator.from_array(
+            x, y, chunk_size=self.chunk_size, **params
+        )
+        return acc, None, kws
+
     def hist(self, fig, x, ax=None, hist_kws=None):
         """
         Plot a histogram using Matplotlib.
@@ -100,9 +898,12 @@ class Plots(object):
         fig : matplotlib.Figure
             A instance of Figure Object.
 
-        x : (n,) array or sequence of (n,) arrays
+        x : (n,) array or sequence of (n,) arrays or HistAccumulator
             Input values, this takes either a single array or a sequence of
-            arrays which are not required to be of the same length.
+            arrays which are not required to be of the same length. A
+            ``HistAccumulator`` is drawn with its bins and counts. A
+            ``numpy.memmap`` or the path of a ``.npy`` file is binned by
+            chunks of ``PLOTS_CHUNK_SIZE`` values.
 
         ax : matplotlib.Figure.Axis, (optional)
             A matplotlib axis.
@@ -117,7 +918,20 @@ class Plots(object):
         """
         ax = fig.gca() if ax is None else ax
         hist_kws = {} if hist_kws is None else hist_kws
-        ax.hist(x, **hist_kws)
+        data = out_of_core(x)
+        if data is not None:
+            hist_kws = dict(hist_kws)
+            x = HistAccumulator.from_array(
+                data,
+                bins=hist_kws.pop("bins", None),
+                limits=hist_kws.pop("range", None),
+                weights=hist_kws.pop("weights", None),
+                chunk_size=self.chunk_size,
+            )
+        if isinstance(x, HistAccumulator):
+            x.draw(ax, **hist_kws)
+        else:
+            ax.hist(x, **hist_kws)
         return ax
 
     def errorbar(self, fig, x, y, ax=None, errorbar_kws=None):
@@ -149,6 +963,77 @@ class Plots(object):
         ax.errorbar(x, y, **errorbar_kws)
         return ax
 
+    def line(self, fig, x, y=None, ax=None, decimate=None, line_kws=None):
+        """
+        Plot long series as lines, decimated to the pixels of the axis.
+
+        Parameters
+        ----------
+        fig : matplotlib.Figure
+            A instance of Figure Object.
+
+        x, y : array-like
+            The sorted positions, shape (n, ), and the values, shape (n, )
+            or (n, k) for *k* series sharing *x*. With only *x*, it's the
+            values and the positions are ``range(n)``.
+
+        ax : matplotlib.Figure.Axis, (optional)
+            A matplotlib axis.
+
+        decimate : {"m4", "lttb"} or False or ``None`` (optional)
+            ``"m4"`` keeps the first, last, minimum and maximum samples of
+            every pixel column and draws the same pixels as the full
+            series. ``"lttb"`` keeps the samples that best preserve the
+            shape. ``False`` draws every sample, ``None`` uses
+            ``app.config["PLOTS_LINE_DECIMATE"]``. The lines with a
+            *marker* or *markevery* in *line_kws* are never decimated, their
+            markers show the samples.
+
+        line_kws : ``dict`` or ``None`` (optional)
+            The parameters to send to the data plot.
+
+        Returns
+        -------
+        ax : matplotlib.Figure.Axis
+            A matplotlib axis.
+        """
+        ax = fig.gca() if ax is None else ax
+        line_kws = {} if line_kws is None else line_kws
+        if y is None:
+            x, y = np.arange(len(x)), x
+        x, y = np.asarray(x), np.asarray(y)
+        if decimate is None:
+            decimate = current_app.config["PLOTS_LINE_DECIMATE"]
+        markers = "marker" in line_kws or "markevery" in line_kws
+        if decimate and not markers and len(x) > 4 * ax.bbox.width:
+            ax.xaxis.update_units(x)
+            positions = np.asarray(ax.convert_xunits(x), float)
+            if ax.get_autoscalex_on():
+                # Set now the limits of the line, to find its pixels.
+                ends = np.zeros((2, 2))
+                ends[:, 0] = positions[[0, -1]]
+                ax.update_datalim(ends, updatey=False)
+                ax.autoscale_view(scaley=False)
+            else:
+                # Keep a sample on each side, the line crosses the edges.
+                low, high = np.searchsorted(positions, sorted(ax.get_xlim()))
+                visible = slice(max(low - 1, 0), high + 1)
+                x, y, positions = x[visible], y[visible], positions[visible]
+            scale = ax.xaxis.get_transform()
+            start, stop = scale.transform(ax.get_xlim())
+            pixels = ax.bbox.x0 + ax.bbox.width * (
+                scale.transform(positions) - start
+            ) / (stop - start)
+            if decimate == "m4":
+                index = m4(np.floor(pixels).astype(np.int64), y)
+            elif decimate == "lttb":
+                index = lttb(pixels, y, 2 * int(ax.bbox.width))
+            else:
+                raise ValueError(f"Unknown decimation {decimate!r}")
+            x, y = x[index], y[index]
+        ax.plot(x, y, **line_kws)
+        return ax
+
     def violinplot(
         self, fig, dataset, positions, ax=None, violinplot_kws=None
     ):
@@ -160,8 +1045,9 @@ class Plots(object):
         fig : matplotlib.Figure
             A instance of Figure Object.
 
-        dataset : Array or a sequence of vectors.
-            The input data.
+        dataset : Array or a sequence of vectors or of statistics.
+            The input data. A sequence of the ``dict`` of statistics of
+            ``ax.violin`` is drawn without computing the densities.
 
         positions : array-like, default: [1, 2, ..., n]
             The positions of the violins. The ticks and limits are
@@ -177,11 +1063,50 @@ class Plots(object):
         -------
         ax : matplotlib.Figure.Axis
             A matplotlib axis.
+
+        Notes
+        -----
+        Datasets of more than ``app.config["PLOTS_VIOLIN_FFT_THRESHOLD"]``
+        samples are estimated with the binned FFT KDE of ``fft_kde``, with
+        the same bandwidth, ``None`` turns it off. When the render cache is
+        enabled, the statistics are cached by the fingerprint of the data.
         """
         ax = fig.gca() if ax is None else ax
         violinplot_kws = {} if violinplot_kws is None else violinplot_kws
-        vp = ax.violinplot(dataset, positions, **violinplot_kws)
-        return vp
+        if (
+            isinstance(dataset, (list, tuple))
+            and dataset
+            and all(isinstance(stats, dict) for stats in dataset)
+        ):
+            return ax.violin(dataset, positions, **violinplot_kws)
+        kws = dict(violinplot_kws)
+        stats_kws = {
+            key: kws.pop(key)
+            for key in ["points", "quantiles", "bw_method"]
+            if key in kws
+        }
+        threshold = current_app.config["PLOTS_VIOLIN_FFT_THRESHOLD"]
+        fft = (
+            threshold is not None
+            and not callable(stats_kws.get("bw_method"))
+            and sum(map(np.size, event_rows(dataset))) > threshold
+        )
+        if not fft and self.cache is None:
+            return ax.violinplot(dataset, positions, **violinplot_kws)
+        stats_kws["kde"] = "fft" if fft else "exact"
+        key = ("violin_stats", data_fingerprint(dataset, stats_kws))
+        vpstats = None if self.cache is None else self.cache.get(key)
+        if vpstats is None:
+            vpstats = violin_stats(dataset, **stats_kws)
+            if self.cache is not None:
+                size = sum(
+                    value.nbytes
+                    for stats in vpstats
+                    for value in stats.values()
+                    if isinstance(value, np.ndarray)
+                )
+                self.cache.put(key, vpstats, size=size)
+        return ax.violin(vpstats, positions, **kws)
 
     def eventplot(self, fig, positions, ax=None, eventplot_kws=None):
         """
@@ -212,13 +1137,35 @@ class Plots(object):
         -------
         ax : matplotlib.Figure.Axis
             A matplotlib axis.
+
+        Notes
+        -----
+        When a row has more than ``app.config["PLOTS_EVENTPLOT_DENSITY"]``
+        events per pixel, the rows are drawn as images of the density of
+        events per pixel instead of a line per event. Only *orientation*,
+        *lineoffsets*, *linelengths*, *linewidths*, *colors* and *alpha*
+        are allowed in *eventplot_kws* then, ``None`` turns it off.
         """
         ax = fig.gca() if ax is None else ax
         eventplot_kws = {} if eventplot_kws is None else eventplot_kws
-        ax.eventplot(positions, **eventplot_kws)
+        density = current_app.config["PLOTS_EVENTPLOT_DENSITY"]
+        vertical = eventplot_kws.get("orientation") == "vertical"
+        pixels = ax.bbox.height if vertical else ax.bbox.width
+        rows = event_rows(positions)
+        if (
+            density is not None
+            and EVENTPLOT_DENSITY_KWS.issuperset(eventplot_kws)
+            and all(np.issubdtype(row.dtype, np.number) for row in rows)
+            and max(map(len, rows)) > density * pixels
+        ):
+            kws = dict(eventplot_kws)
+            kws.pop("linewidths", None)
+            eventplot_density(ax, rows, **kws)
+        else:
+            ax.eventplot(positions, **eventplot_kws)
         return ax
 
-    def hist2d(self, fig, x, y, ax=None, hist2d_kws=None):
+    def hist2d(self, fig, x, y=None, ax=None, hist2d_kws=None, image=None):
         """
         Make a 2D histogram plot using Matplotlib.
 
@@ -228,7 +1175,9 @@ class Plots(object):
             A instance of Figure Object.
 
         x, y : array-like, shape (n, )
-            Input values
+            Input values. *x* can be a ``Hist2dAccumulator`` instead, then
+            *y* is not used. ``numpy.memmap`` or paths of ``.npy`` files
+            are binned by chunks of ``PLOTS_CHUNK_SIZE`` values.
 
         ax : matplotlib.Figure.Axis, (optional)
             A matplotlib axis.
@@ -236,6 +1185,11 @@ class Plots(object):
         hist2d_kws : ``dict`` or ``None`` (optional)
             The parameters to send to the data plot.
 
+        image : bool or ``None`` (optional)
+            Draw the bins as a single image, see ``hist2d_image``, instead
+            of a mesh. ``None`` uses ``PLOTS_HIST2D_IMAGE``. The image uses
+            the ``PLOTS_CMAP`` colormap unless *hist2d_kws* has a *cmap*.
+
         Returns
         -------
         ax : matplotlib.Figure.Axis
@@ -243,10 +1197,40 @@ class Plots(object):
         """
         ax = fig.gca() if ax is None else ax
         hist2d_kws = {} if hist2d_kws is None else hist2d_kws
-        ax.hist2d(x, y, **hist2d_kws)
+        image = self.hist2d_image if image is None else image
+        if not isinstance(x, Hist2dAccumulator):
+            x, y, hist2d_kws = self._bin(
+                Hist2dAccumulator,
+                x,
+                y,
+                hist2d_kws,
+                bins=10,
+                range=None,
+                weights=None,
+            )
+        if image:
+            hist2d_kws = {
+                "cmap": current_app.config["PLOTS_CMAP"],
+                **hist2d_kws,
+            }
+        if isinstance(x, Hist2dAccumulator):
+            x.draw(ax, image=image, **hist2d_kws)
+        elif image:
+            kws = dict(hist2d_kws)
+            counts, xedges, yedges = np.histogram2d(
+                x,
+                y,
+                bins=kws.pop("bins", 10),
+                range=kws.pop("range", None),
+                density=kws.pop("density", False),
+                weights=kws.pop("weights", None),
+            )
+            hist2d_image(ax, counts, xedges, yedges, **kws)
+        else:
+            ax.hist2d(x, y, **hist2d_kws)
         return ax
 
-    def hexbin(self, fig, x, y, ax=None, hexbin_kws=None):
+    def hexbin(self, fig, x, y=None, ax=None, hexbin_kws=None):
         """
         Make a 2D hexagonal binning plot of points *x*, *y* using Matplotlib.
 
@@ -257,6 +1241,10 @@ class Plots(object):
 
         x, y : array-like
             The data positions. *x* and *y* must be of the same length.
+            *x* can be a ``HexbinAccumulator`` instead, then *y* is not
+            used and its grid gives *gridsize* and *extent*. ``numpy.memmap``
+            or paths of ``.npy`` files are binned by chunks of
+            ``PLOTS_CHUNK_SIZE`` values, without *C* nor log scales.
 
         ax : matplotlib.Figure.Axis, (optional)
             A matplotlib axis.
@@ -271,11 +1259,26 @@ class Plots(object):
         """
         ax = fig.gca() if ax is None else ax
         hexbin_kws = {} if hexbin_kws is None else hexbin_kws
-        ax.hexbin(x, y, **hexbin_kws)
+        if not isinstance(x, HexbinAccumulator):
+            x, y, hexbin_kws = self._bin(
+                HexbinAccumulator, x, y, hexbin_kws, gridsize=100, extent=None
+            )
+        if isinstance(x, HexbinAccumulator):
+            x.draw(ax, **hexbin_kws)
+        else:
+            ax.hexbin(x, y, **hexbin_kws)
         return ax
 
     def scatter_hist2d(
-        self, fig, x, y, ax=None, hist2d_kws=None, scatter_kws=None
+        self,
+        fig,
+        x,
+        y,
+        ax=None,
+        hist2d_kws=None,
+        scatter_kws=None,
+        thin=None,
+        image=None,
     ):
         """
         Make a 2D histogram plot using Matplotlib.
@@ -297,6 +1300,16 @@ class Plots(object):
         scatter_kws : ``dict`` or ``None`` (optional)
             The parameters to send to the data plot in term scatter method.
 
+        thin : bool or int or ``None`` (optional)
+            Draw at most this number of points per pixel, the points of
+            the sparse regions are all drawn. ``True`` uses
+            ``PLOTS_SCATTER_THIN_THRESHOLD``, ``None`` uses
+            ``PLOTS_SCATTER_THIN``.
+
+        image : bool or ``None`` (optional)
+            Draw the bins as a single image, see ``hist2d_image``, instead
+            of a mesh. ``None`` uses ``PLOTS_HIST2D_IMAGE``.
+
         Returns
         -------
         ax : matplotlib.Figure.Axis
@@ -306,12 +1319,19 @@ class Plots(object):
         hist2d_kws = {} if hist2d_kws is None else hist2d_kws
         scatter_kws = {} if scatter_kws is None else scatter_kws
         hist2d_kws.setdefault("cmap", current_app.config["PLOTS_CMAP"])
-        ax.hist2d(x, y, **hist2d_kws)
-        ax.scatter(x, y, **scatter_kws)
+        self.hist2d(fig, x, y, ax=ax, hist2d_kws=hist2d_kws, image=image)
+        self._scatter(ax, x, y, scatter_kws, thin)
         return ax
 
     def scatter_hexbin(
-        self, fig, x, y, ax=None, hexbin_kws=None, scatter_kws=None
+        self,
+        fig,
+        x,
+        y,
+        ax=None,
+        hexbin_kws=None,
+        scatter_kws=None,
+        thin=None,
     ):
         """
         Make a 2D scatter-hexagonal binning plot of points *x*, *y*.
@@ -333,6 +1353,12 @@ class Plots(object):
         scatter_kws : ``dict`` or ``None`` (optional)
             The parameters to send to the data plot in term scatter method.
 
+        thin : bool or int or ``None`` (optional)
+            Draw at most this number of points per pixel, the points of
+            the sparse regions are all drawn. ``True`` uses
+            ``PLOTS_SCATTER_THIN_THRESHOLD``, ``None`` uses
+            ``PLOTS_SCATTER_THIN``.
+
         Returns
         -------
         ax : matplotlib.Figure.Axis
@@ -342,11 +1368,41 @@ class Plots(object):
         hexbin_kws = {} if hexbin_kws is None else hexbin_kws
         scatter_kws = {} if scatter_kws is None else scatter_kws
         hexbin_kws.setdefault("cmap", current_app.config["PLOTS_CMAP"])
-        ax.hexbin(x, y, **hexbin_kws)
-        ax.scatter(x, y, **scatter_kws)
+        self.hexbin(fig, x, y, ax=ax, hexbin_kws=hexbin_kws)
+        self._scatter(ax, x, y, scatter_kws, thin)
         return ax
 
-    def bar(self, fig, x, bar_height=None, ax=None, bar_kws=None):
+    def _scatter(self, ax, x, y, scatter_kws, thin):
+        """Draw the points over a density plot, thinned if requested."""
+        config = current_app.config
+        thin = config["PLOTS_SCATTER_THIN"] if thin is None else thin
+        if thin is True:
+            thin = config["PLOTS_SCATTER_THIN_THRESHOLD"]
+        if thin:
+            x, y = np.asarray(x), np.asarray(y)
+            keep = thin_points(ax, x, y, thin)
+            x, y = x[keep], y[keep]
+            # Per point parameters follow the points.
+            scatter_kws = {
+                key: (
+                    np.asarray(value)[keep]
+                    if np.shape(value)[:1] == keep.shape
+                    else value
+                )
+                for key, value in scatter_kws.items()
+            }
+        return ax.scatter(x, y, **scatter_kws)
+
+    def bar(
+        self,
+        fig,
+        x,
+        bar_height=None,
+        ax=None,
+        bar_kws=None,
+        collection=None,
+        top=None,
+    ):
         """
         Make a bar plot using Matplotlib.
 
@@ -369,6 +1425,17 @@ class Plots(object):
         bar_kws : ``dict`` or ``None`` (optional)
             The parameters to send to the data plot.
 
+        collection : bool or ``None`` (optional)
+            Draw the bars as a single collection, see ``bar_collection``,
+            instead of a patch per bar. ``None`` does it for more bars than
+            ``app.config["PLOTS_BAR_COLLECTION_THRESHOLD"]``. Only *width*,
+            *bottom*, *align*, the colors, *linewidth*, *alpha*, *label*
+            and *zorder* are allowed in *bar_kws* then.
+
+        top : int or ``None`` (optional)
+            Draw the *top* highest bars, by category, and a bar with the
+            sum of the others, see ``top_categories``.
+
         Returns
         -------
         ax : matplotlib.Figure.Axis
@@ -376,12 +1443,17 @@ class Plots(object):
         """
         ax = fig.gca() if ax is None else ax
         bar_kws = {} if bar_kws is None else bar_kws
-        bar_height = (
-            current_app.config["BAR_HEIGHT"]
-            if bar_height is None
-            else bar_height
-        )
-        ax.bar(x, bar_height, **bar_kws)
+        config = current_app.config
+        bar_height = config["BAR_HEIGHT"] if bar_height is None else bar_height
+        if top is not None:
+            x, bar_height = top_categories(x, bar_height, top)
+        if collection is None:
+            threshold = config["PLOTS_BAR_COLLECTION_THRESHOLD"]
+            collection = threshold is not None and np.size(x) > threshold
+        if collection and BAR_COLLECTION_KWS.issuperset(bar_kws):
+            bar_collection(ax, x, bar_height, **bar_kws)
+        else:
+            ax.bar(x, bar_height, **bar_kws)
         return ax
 
     def pie(self, fig, x, ax=None, pie_kws=None):
@@ -421,16 +1493,19 @@ class Plots(object):
         fig : matplotlib.Figure
             A instance of Figure Object.
 
-        x : Array or a sequence of vectors.
+        x : Array or a sequence of vectors or of statistics.
             The input data.  If a 2D array, a boxplot is drawn for each column
             in *x*.  If a sequence of 1D arrays, a boxplot is drawn for each
-            array in *x*.
+            array in *x*. A ``QuantileSketch``, a ``dict`` of the statistics
+            of ``ax.bxp`` or a sequence of them are drawn without the data.
 
         ax : matplotlib.Figure.Axis, (optional)
             A matplotlib axis.
 
         boxplot_kws : ``dict`` or ``None`` (optional)
-            The parameters to send to the data plot.
+            The parameters to send to the data plot. With statistics,
+            *bootstrap*, *usermedians*, *conf_intervals* and *autorange*
+            raise a ``ValueError``, they need the data.
 
         Returns
         -------
@@ -439,10 +1514,69 @@ class Plots(object):
         """
         ax = fig.gca() if ax is None else ax
         boxplot_kws = {} if boxplot_kws is None else boxplot_kws
-        ax.boxplot(x, **boxplot_kws)
+        stats = [x] if isinstance(x, (dict, QuantileSketch)) else x
+        if (
+            isinstance(stats, (list, tuple))
+            and stats
+            and all(isinstance(s, (dict, QuantileSketch)) for s in stats)
+        ):
+            self._bxp(ax, stats, boxplot_kws)
+        else:
+            ax.boxplot(x, **boxplot_kws)
         return ax
 
-    def quiver(self, fig, x, y, u, v, ax=None, quiver_kws=None):
+    def _bxp(self, ax, stats, boxplot_kws):
+        """Draw precomputed statistics with the parameters of boxplot."""
+        raw = BOXPLOT_RAW_KWS.intersection(boxplot_kws)
+        if raw:
+            raise ValueError(
+                f"{', '.join(sorted(raw))} can't be used with precomputed "
+                "statistics, only with the data"
+            )
+        kws = dict(boxplot_kws)
+        whis = kws.pop("whis", mpl.rcParams["boxplot.whiskers"])
+        labels = kws.pop("tick_labels", kws.pop("labels", None))
+        stats = [
+            s.stats(whis) if isinstance(s, QuantileSketch) else dict(s)
+            for s in stats
+        ]
+        if labels is not None:
+            for stat, label in zip(stats, labels):
+                stat["label"] = label
+        kws["shownotches"] = kws.pop("notch", mpl.rcParams["boxplot.notch"])
+        sym = kws.pop("sym", None)
+        if sym == "":  # Like ``ax.boxplot``, no fliers.
+            kws["flierprops"] = {"linestyle": "none", "marker": ""}
+            kws["showfliers"] = False
+        elif sym is not None:
+            _, marker, color = _process_plot_format(sym)
+            flierprops = dict(kws.get("flierprops") or {})
+            if marker is not None:
+                flierprops["marker"] = marker
+            if color is not None:
+                flierprops["color"] = color
+                flierprops["markerfacecolor"] = color
+                flierprops["markeredgecolor"] = color
+            kws["flierprops"] = flierprops
+        for key in [
+            "patch_artist",
+            "meanline",
+            "showmeans",
+            "showcaps",
+            "showbox",
+            "showfliers",
+        ]:
+            kws.setdefault(
+                key, mpl.rcParams["boxplot." + key.replace("_", "")]
+            )
+        if kws["patch_artist"]:  # Like ``ax.boxplot``.
+            boxprops = {"linestyle": "solid", **kws.get("boxprops", {})}
+            if "color" in boxprops:
+                boxprops["edgecolor"] = boxprops.pop("color")
+            kws["boxprops"] = boxprops
+        return ax.bxp(stats, **kws)
+
+    def quiver(self, fig, x, y, u, v, ax=None, quiver_kws=None, regrid=None):
         """
         Plot a 2D field of arrows using matplotlib.
 
@@ -465,12 +1599,22 @@ class Plots(object):
             They must have the same number of elements, matching the
             number of arrow locations. *u* and *v* may be masked. Only
             locations unmasked in *u*, *v*, and *C* will be drawn.
+
         ax : matplotlib.Figure.Axis, (optional)
             A matplotlib axis.
 
         quiver_kws : ``dict`` or ``None`` (optional)
             The parameters to send to the data plot.
 
+        regrid : bool or float or ``None`` (optional)
+            Average the blocks of a 2D field to draw at most a arrow every
+            this number of pixels of the axis, see ``downsample_grid``.
+            ``True`` uses ``PLOTS_QUIVER_SPACING``, ``False`` draws a arrow
+            per value and ``None`` regrids the fields of more than
+            ``PLOTS_QUIVER_REGRID_THRESHOLD`` values, ``None`` in the config
+            turns it off. The field is never regridded when *quiver_kws*
+            has a value per arrow, like a array of colors.
+
         Returns
         -------
         ax : matplotlib.Figure.Axis
@@ -478,6 +1622,21 @@ class Plots(object):
         """
         ax = fig.gca() if ax is None else ax
         quiver_kws = {} if quiver_kws is None else quiver_kws
+        config = current_app.config
+        if regrid is None:
+            threshold = config["PLOTS_QUIVER_REGRID_THRESHOLD"]
+            regrid = threshold is not None and np.size(u) > threshold
+        if regrid is True:
+            regrid = config["PLOTS_QUIVER_SPACING"]
+        per_arrow = any(
+            np.shape(value)[: np.ndim(u)] == np.shape(u)
+            or np.shape(value)[:1] == (np.size(u),)
+            for value in quiver_kws.values()
+        )
+        if regrid and np.ndim(u) == 2 and not per_arrow:
+            shape = (ax.bbox.height / regrid, ax.bbox.width / regrid)
+            v = downsample_grid(x, y, v, shape)[2]
+            x, y, u = downsample_grid(x, y, u, shape)
         ax.quiver(x, y, u, v, **quiver_kws)
         return ax
 
@@ -506,13 +1665,48 @@ class Plots(object):
         streamplot_kws : ``dict`` or ``None`` (optional)
             The parameters to send to the data plot.
 
+        Returns
+        -------
+        ax : matplotlib.Figure.Axis
+            A matplotlib axis.
+
+        Notes
+        -----
+        When the render cache is enabled, the streamlines are cached by
+        the fingerprint of the field and of the parameters of the
+        integration, like *density*. The same field is drawn again with
+        other colors, widths or arrows without integrating it. The
+        streamlines are only cached with Matplotlib 3.11, whose private
+        integrator they use.
         """
         ax = fig.gca() if ax is None else ax
         streamplot_kws = {} if streamplot_kws is None else streamplot_kws
-        ax.streamplot(x, y, u, v, **streamplot_kws)
+        if self.cache is None or not HAS_STREAM_INTEGRATOR:
+            ax.streamplot(x, y, u, v, **streamplot_kws)
+            return ax
+        integrate_kws = {
+            key: value
+            for key, value in streamplot_kws.items()
+            if key in TRAJECTORY_KWS
+        }
+        draw_kws = {
+            key: value
+            for key, value in streamplot_kws.items()
+            if key not in TRAJECTORY_KWS
+        }
+        key = ("streamplot", data_fingerprint(x, y, u, v, integrate_kws))
+        trajectories = self.cache.get(key)
+        if trajectories is None:
+            trajectories = StreamTrajectories.integrate(
+                x, y, u, v, **integrate_kws
+            )
+            self.cache.put(key, trajectories, size=trajectories.nbytes)
+        trajectories.draw(ax, **draw_kws)
         return ax
 
-    def contourf(self, fig, x, y, z, levels, ax=None, contourf_kws=None):
+    def contourf(
+        self, fig, x, y, z, levels, ax=None, contourf_kws=None, resample=None
+    ):
         """
         Plot contour lines using matplotlib.
 
@@ -550,12 +1744,71 @@ class Plots(object):
         contourf_kws: ``dict`` or ``None`` (optional)
             The parameters to send to the data plot.
 
+        resample : bool or ``None`` (optional)
+            Average the blocks of *z* to have at most a value per pixel of
+            the axis before contouring, see ``downsample_grid``. ``None``
+            uses ``PLOTS_CONTOURF_RESAMPLE``.
+
         Returns
         -------
         ax : matplotlib.Figure.Axis
             A matplotlib axis.
+
+        Notes
+        -----
+        When the render cache is enabled, the contour paths are cached by
+        the fingerprint of the grid, the *levels* and the parameters of
+        ``CONTOUR_KWS``, and drawn again without contouring with any style
+        of *contourf_kws*. Before Matplotlib 3.8 the paths are never
+        cached.
         """
         ax = fig.gca() if ax is None else ax
         contourf_kws = {} if contourf_kws is None else contourf_kws
-        ax.contourf(x, y, z, levels, **contourf_kws)
+        resample = self.contourf_resample if resample is None else resample
+        if resample:
+            x, y, z = downsample_grid(x, y, z, (ax.bbox.height, ax.bbox.width))
+        if (
+            self.cache is None
+            or not HAS_CONTOUR_PATHS
+            or contourf_kws.get("extend", "neither") != "neither"
+            or "transform" in contourf_kws
+        ):
+            ax.contourf(x, y, z, levels, **contourf_kws)
+            return ax
+        geometry = {
+            key: value
+            for key, value in contourf_kws.items()
+            if key in CONTOUR_KWS
+        }
+        # A log norm picks log spaced levels and masks the values <= 0.
+        norm = contourf_kws.get("norm")
+        log = isinstance(norm, mpl.colors.LogNorm) or (
+            isinstance(norm, str) and norm == "log"
+        )
+        key = ("contourf", data_fingerprint(x, y, z, levels, geometry, log))
+        cached = self.cache.get(key)
+        if cached is None:
+            cs = ax.contourf(x, y, z, levels, **contourf_kws)
+            paths = [(path.vertices, path.codes) for path in cs.get_paths()]
+            corners = [(np.min(x), np.min(y)), (np.max(x), np.max(y))]
+            size = sum(vertices.nbytes for vertices, _ in paths)
+            self.cache.put(key, (cs.levels, paths, corners), size=size)
+            return ax
+        # Draw the cached paths with the parameters of ``ax.contourf``.
+        levels, paths, corners = cached
+        kws = {
+            key: value
+            for key, value in contourf_kws.items()
+            if key not in ("corner_mask", "algorithm")
+        }
+        ContourSet(
+            ax,
+            levels,
+            [[vertices] for vertices, _ in paths],
+            [[codes] for _, codes in paths],
+            filled=True,
+            **kws,
+        )
+        ax.update_datalim(corners)
+        ax.autoscale_view(tight=True)
         return ax
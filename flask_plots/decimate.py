@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+#
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-Plots.
+
+Reduction of the data to what the output pixels can show.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import matplotlib as mpl
+import matplotlib.colors as mcolors
+from matplotlib.image import AxesImage
+
+import numpy as np
+
+# =============================================================================
+# POINTS
+# =============================================================================
+
+
+def thin_points(ax, x, y, threshold=1):
+    """
+    Return the mask of the points kept by a density-aware thinning.
+
+    The points are placed on the pixels of the axes, with its current
+    limits and scales. The first *threshold* points of every pixel are
+    kept, so the sparse regions keep all their points and only the
+    saturated regions lose some.
+
+    Parameters
+    ----------
+    ax : matplotlib.Figure.Axis
+        The axis where the points are drawn, with its final limits.
+
+    x, y : array-like, shape (n, )
+        The data positions.
+
+    threshold : int, default: 1
+        The number of points kept per pixel.
+
+    Returns
+    -------
+    keep : numpy.ndarray of bool, shape (n, )
+        ``True`` for the points to draw.
+
+    .. versionadded:: 0.0.2
+    """
+    ax.get_xlim()  # Applies the pending autoscaling to ``transData``.
+    xy = np.column_stack([np.ravel(x), np.ravel(y)]).astype(float)
+    pixels = np.floor(ax.transData.transform(xy))
+    # Non-finite points are dropped by ``ax.scatter`` anyway.
+    finite = np.isfinite(pixels).all(axis=1)
+    keep = np.zeros(len(xy), bool)
+    cells = pixels[finite].astype(np.int64)
+    cells -= cells.min(axis=0, initial=0)
+    cells = cells[:, 0] * (cells[:, 1].max(initial=0) + 1) + cells[:, 1]
+    # Rank of every point inside its pixel, in the input order.
+    order = np.argsort(cells, kind="stable")
+    cells = cells[order]
+    starts = np.flatnonzero(np.r_[True, cells[1:] != cells[:-1]])
+    sizes = np.diff(np.r_[starts, len(cells)])
+    rank = np.arange(len(cells)) - np.repeat(starts, sizes)
+    keep[np.flatnonzero(finite)[order[rank < threshold]]] = True
+    return keep
+
+
+# =============================================================================
+# LINES
+# =============================================================================
+
+
+def _first_index(values, extremes, starts, sizes):
+    """Return the first index of every extreme of the buckets."""
+    n = len(values)
+    index = np.arange(n)[:, None]
+    hits = np.where(values == np.repeat(extremes, sizes, axis=0), index, n)
+    return np.minimum.reduceat(hits, starts, axis=0)
+
+
+def m4(columns, y):
+    """
+    Return the samples of a M4 decimation of sorted series.
+
+    Every pixel column keeps its first and last samples, and the samples
+    of the minimum and the maximum of each series, so a line drawn with
+    them covers the same pixels as the full line.
+
+    Parameters
+    ----------
+    columns : array-like of int, shape (n, )
+        The pixel column of every sample, in increasing order.
+
+    y : array-like, shape (n, ) or (n, k)
+        The values of one or *k* series sharing the columns.
+
+    Returns
+    -------
+    index : numpy.ndarray of int
+        The sorted indices of the samples to draw, shared by the series.
+
+    .. versionadded:: 0.0.2
+    """
+    columns = np.asarray(columns)
+    n = len(columns)
+    y = np.asarray(y, float).reshape(n, -1)
+    starts = np.flatnonzero(np.r_[True, columns[1:] != columns[:-1]])
+    sizes = np.diff(np.r_[starts, n])
+    mins = np.fmin.reduceat(y, starts, axis=0)
+    maxs = np.fmax.reduceat(y, starts, axis=0)
+    index = np.concatenate(
+        [
+            starts,
+            starts + sizes - 1,
+            _first_index(y, mins, starts, sizes).ravel(),
+            _first_index(y, maxs, starts, sizes).ravel(),
+            # The missing values break the line, keep the gaps.
+            np.flatnonzero(np.isnan(y).any(axis=1)),
+        ]
+    )
+    return np.unique(index[index < n])
+
+
+def lttb(x, y, buckets):
+    """
+    Return the samples of a Largest-Triangle-Three-Buckets decimation.
+
+    The series are cut in buckets of the same number of samples, and
+    each bucket keeps the sample that makes the largest triangle with the
+    sample kept in the previous bucket and the mean of the next bucket.
+
+    Parameters
+    ----------
+    x : array-like, shape (n, )
+        The sorted positions, in pixels.
+
+    y : array-like, shape (n, ) or (n, k)
+        The values of one or *k* series sharing *x*.
+
+    buckets : int
+        The number of buckets, the first and last samples are always
+        kept.
+
+    Returns
+    -------
+    index : numpy.ndarray of int
+        The sorted indices of the samples to draw, shared by the series.
+
+    .. versionadded:: 0.0.2
+    """
+    x = np.asarray(x, float)
+    y = np.asarray(y, float).reshape(len(x), -1)
+    n = len(x)
+    if n <= buckets + 2:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, buckets + 1).astype(np.int64)
+    series = np.arange(y.shape[1])
+    kept = np.zeros(y.shape[1], np.int64)
+    index = [[0], [n - 1]]
+    afters = np.r_[edges[2:], n]
+    for start, stop, after in zip(edges[:-1], edges[1:], afters):
+        next_x = x[stop:after].mean()
+        next_y = y[stop:after].mean(axis=0)
+        px, py = x[kept], y[kept, series]
+        area = np.abs(
+            (px - next_x) * (y[start:stop] - py)
+            - (px - x[start:stop, None]) * (next_y - py)
+        )
+        kept = start + np.argmax(area, axis=0)
+        index.append(kept)
+    return np.unique(np.concatenate(index))
+
+
+# =============================================================================
+# EVENTS
+# =============================================================================
+
+
+def event_rows(positions):
+    """Return the rows of events of ``ax.eventplot`` as arrays."""
+    if not np.iterable(positions):
+        return [np.atleast_1d(positions)]
+    if any(np.iterable(position) for position in positions):
+        return [np.asarray(position) for position in positions]
+    return [np.asarray(positions)]
+
+
+def eventplot_density(
+    ax,
+    positions,
+    orientation="horizontal",
+    lineoffsets=1,
+    linelengths=1,
+    colors=None,
+    alpha=None,
+    bins=None,
+):
+    """
+    Draw the rows of events as images of their density per pixel.
+
+    Every row is a image one pixel tall with a column per pixel, whose
+    opacity is the one of *count* overlapping event lines:
+    ``1 - (1 - alpha) ** count``. The rows, limits and colors are the
+    ones of ``ax.eventplot``.
+
+    Parameters
+    ----------
+    ax : matplotlib.Figure.Axis
+        A matplotlib axis.
+
+    positions : array-like or list of array-like
+        The positions of the events, one array per row.
+
+    orientation, lineoffsets, linelengths, colors, alpha
+        The parameters of ``ax.eventplot``.
+
+    bins : int or None, default: None
+        The number of columns of the images, ``None`` uses the pixels of
+        the axis.
+
+    Returns
+    -------
+    images : list of matplotlib.image.AxesImage
+        A image per row.
+
+    .. versionadded:: 0.0.2
+    """
+    rows = event_rows(positions)
+    vertical = orientation == "vertical"
+    if bins is None:
+        bins = ax.bbox.height if vertical else ax.bbox.width
+    bins = max(int(bins), 1)
+    lineoffsets = np.atleast_1d(lineoffsets).astype(float)
+    if len(lineoffsets) == 1 and len(rows) != 1:
+        lineoffsets = np.r_[0, np.full(len(rows) - 1, lineoffsets[0])]
+        lineoffsets = np.cumsum(lineoffsets)
+    linelengths = np.resize(np.atleast_1d(linelengths), len(rows))
+    colors = mpl.rcParams["lines.color"] if colors is None else colors
+    colors = mcolors.to_rgba_array(colors)
+    colors = np.resize(colors, (len(rows), 4))
+    if alpha is not None:
+        colors[:, 3] = np.resize(np.atleast_1d(alpha), len(rows))
+    filled = [row for row in rows if len(row)]
+    if not filled:
+        return []
+    low = min(row.min() for row in filled)
+    high = max(row.max() for row in filled)
+    images = []
+    for row, offset, length, color in zip(
+        rows, lineoffsets, linelengths, colors
+    ):
+        counts = np.histogram(row, bins, (low, high))[0]
+        rgba = np.tile(color, (bins, 1))
+        rgba[:, 3] = 1 - (1 - color[3]) ** counts
+        extent = (low, high, offset - length / 2, offset + length / 2)
+        if vertical:
+            rgba, extent = rgba[:, None], extent[2:] + extent[:2]
+        else:
+            rgba = rgba[None]
+        image = AxesImage(
+            ax, extent=extent, origin="lower", interpolation="nearest"
+        )
+        image.set_data(rgba)
+        ax.add_image(image)
+        images.append(image)
+    # The data limits and margins of ``ax.eventplot``.
+    minline = (lineoffsets - linelengths).min()
+    maxline = (lineoffsets + linelengths).max()
+    corners = [(low, minline), (high, maxline)]
+    if vertical:
+        corners = [corner[::-1] for corner in corners]
+    ax.update_datalim(corners)
+    ax.autoscale(None)
+    return images
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+#
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-Plots.
+
+Incremental base64 encoding of the rendered images.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import binascii
+import io
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+#: Size of the raw blocks encoded at once, a multiple of 3 bytes.
+CHUNK_SIZE = 3 * 16 * 1024
+
+# =============================================================================
+# ENCODERS
+# =============================================================================
+
+
+class Base64Writer(io.RawIOBase):
+    """Write-only file object that base64-encodes its input on the fly.
+
+    ``fig.savefig`` writes straight into it, so the raw image is never
+    held in memory as a whole: only the encoded pieces are kept until
+    :meth:`getvalue` joins them in a single allocation.
+
+    Parameters
+    ----------
+    decode : str, default: "ascii"
+        The codec used to turn the encoded pieces into ``str``.
+
+    .. versionadded:: 0.0.2
+    """
+
+    def __init__(self, decode="ascii"):
+        super().__init__()
+        self.decode = decode
+        self._pieces = []
+        self._buffer = bytearray()
+        self._written = 0
+
+    def writable(self):
+        """Return ``True``, the writer only supports writing."""
+        return True
+
+    def tell(self):
+        """Return the number of raw bytes written so far."""
+        return self._written
+
+    def write(self, data):
+        """Buffer ``data`` and encode it by blocks of ``CHUNK_SIZE``."""
+        size = memoryview(data).nbytes
+        self._written += size
+        self._buffer += data
+        if len(self._buffer) >= CHUNK_SIZE:
+            cut = len(self._buffer) - len(self._buffer) % 3
+            self._append(self._buffer[:cut])
+            del self._buffer[:cut]
+        return size
+
+    def getvalue(self):
+        """Return the base64 text of everything written."""
+        if self._buffer:
+            self._append(self._buffer)
+            self._buffer = bytearray()
+        value = "".join(self._pieces)
+        self._pieces = [value]
+        return value
+
+    def _append(self, block):
+        encoded = binascii.b2a_base64(block, newline=False)
+        self._pieces.append(encoded.decode(self.decode))
+
+
+def iter_base64(data, decode="ascii", chunk_size=CHUNK_SIZE):
+    """
+    Yield the base64 text of ``data`` in chunks.
+
+    Parameters
+    ----------
+    data : bytes-like
+        The raw contents of the image.
+
+    decode : str, default: "ascii"
+        A buffer decode.
+
+    chunk_size : int, default: CHUNK_SIZE
+        The size of the raw blocks, rounded down to a multiple of 3 so the
+        chunks can be concatenated.
+
+    Yields
+    ------
+    chunk : str
+        A piece of the encoded image.
+    """
+    chunk_size = max(3, chunk_size - chunk_size % 3)
+    view = memoryview(data)
+    for start in range(0, view.nbytes, chunk_size):
+        block = view[start : start + chunk_size]  # noqa: E203
+        yield binascii.b2a_base64(block, newline=False).decode(decode)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+#
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-Plots.
+
+Render engines for the figures.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import atexit
+import collections
+import concurrent.futures
+import contextlib
+import io
+import pickle
+import threading
+import weakref
+
+from matplotlib.collections import QuadMesh
+
+#: Formats whose artists are written as vector primitives.
+VECTOR_FORMATS = frozenset(["svg", "svgz", "pdf", "eps", "ps"])
+
+#: Process pools started and not stopped yet, only weakly referenced.
+_running = weakref.WeakSet()
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def render_figure(fig, fmt):
+    """Render the figure in the current process and return the bytes."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt)
+    return buf.getvalue()
+
+
+def count_elements(artist):
+    """Return the number of primitives a artist writes in vector output."""
+    if isinstance(artist, QuadMesh):
+        rows, cols = artist.get_coordinates().shape[:2]
+        return (rows - 1) * (cols - 1)
+    if hasattr(artist, "get_xydata"):
+        return len(artist.get_xydata())
+    return max(len(artist.get_offsets()), len(artist.get_paths()))
+
+
+@contextlib.contextmanager
+def rasterized_dense(fig, fmt, threshold):
+    """
+    Rasterize the dense data artists while a vector format is written.
+
+    The lines and collections (scatter points, hexagons, meshes, stream
+    lines...) with more than *threshold* elements are rasterized, the
+    text, axes and ticks stay vectors. The artists get back their
+    setting at the end of the ``with`` block.
+
+    Parameters
+    ----------
+    fig : matplotlib.Figure
+        A instance of Figure Object.
+
+    fmt : str
+        The format of the output, raster formats are left untouched.
+
+    threshold : int or None
+        The number of elements above which a artist is rasterized,
+        ``None`` rasterizes nothing.
+
+    .. versionadded:: 0.0.2
+    """
+    changed = []
+    if threshold is not None and fmt in VECTOR_FORMATS:
+        for ax in fig.axes:
+            for artist in [*ax.lines, *ax.collections]:
+                if (
+                    not artist.get_rasterized()
+                    and count_elements(artist) > threshold
+                ):
+                    artist.set_rasterized(True)
+                    changed.append(artist)
+    try:
+        yield changed
+    finally:
+        for artist in changed:
+            artist.set_rasterized(False)
+
+
+def _shutdown_running():
+    """Stop the process pools still running, registered with ``atexit``."""
+    for pool in list(_running):
+        pool.shutdown()
+
+
+def _render_pickled(payload, fmt):
+    """Render a pickled figure, this runs in the worker processes."""
+    return render_figure(pickle.loads(payload), fmt)
+
+
+# =============================================================================
+# ENGINES
+# =============================================================================
+
+
+class RenderResult(
+    collections.namedtuple("RenderResult", ["data", "error", "elapsed"])
+):
+    """Outcome of the render of one figure of a batch.
+
+    Attributes
+    ----------
+    data : str or None
+        The data of ``Plots.get_data``, ``None`` when the render failed.
+
+    error : Exception or None
+        The exception raised by the render.
+
+    elapsed : float
+        Seconds spent rendering the figure.
+
+    .. versionadded:: 0.0.2
+    """
+
+    __slots__ = ()
+
+
+class LazyProcessPool(object):
+    """Pool of worker processes started on first use.
+
+    Base of the classes that hand work to other processes, the pool is
+    only started when :attr:`executor` is first read and can be stopped
+    and started again. A running pool is stopped at exit, without being
+    kept alive until then.
+
+    Parameters
+    ----------
+    workers : int or None, default: None
+        The number of processes, ``None`` uses ``os.cpu_count()``.
+
+    max_tasks_per_child : int or None, default: None
+        The number of tasks a worker runs before it's replaced by a new
+        process. Requires Python 3.11 or newer.
+
+    .. versionadded:: 0.0.2
+    """
+
+    def __init__(self, workers=None, max_tasks_per_child=None):
+        self.workers = workers
+        self.max_tasks_per_child = max_tasks_per_child
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self):
+        """The ``ProcessPoolExecutor``, started on first use."""
+        with self._lock:
+            if self._executor is None:
+                kwargs = {}
+                if self.max_tasks_per_child is not None:
+                    kwargs["max_tasks_per_child"] = self.max_tasks_per_child
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    self.workers, **kwargs
+                )
+                _running.add(self)
+                atexit.unregister(_shutdown_running)
+                atexit.register(_shutdown_running)
+            return self._executor
+
+    def shutdown(self, wait=True):
+        """Stop the worker processes, they are started again if needed."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            _running.discard(self)
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+class ProcessRenderEngine(LazyProcessPool):
+    """Render the figures in a pool of worker processes.
+
+    The Agg rasterization holds the GIL, a pool of processes lets a single
+    web worker render many figures at the same time. The figures are
+    pickled and sent to the workers, figures that can't be pickled are
+    rendered in the current process.
+
+    Parameters
+    ----------
+    workers : int or None, default: None
+        The number of processes, ``None`` uses ``os.cpu_count()``.
+
+    max_tasks_per_child : int or None, default: None
+        The number of figures a worker renders before it's replaced by a
+        new process. Requires Python 3.11 or newer.
+
+    .. versionadded:: 0.0.2
+    """
+
+    def submit(self, fig, fmt):
+        """Schedule the render of the figure and return a ``Future``."""
+        try:
+            payload = pickle.dumps(fig)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            future = concurrent.futures.Future()
+            future.set_result(render_figure(fig, fmt))
+            return future
+        return self.executor.submit(_render_pickled, payload, fmt)
+
+    def render(self, fig, fmt):
+        """Render the figure in a worker and wait for the bytes."""
+        return self.submit(fig, fmt).result()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+#
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-Plots.
+
+Averaging of dense grids to the pixels of the axis.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+# =============================================================================
+# GRIDS
+# =============================================================================
+
+
+def _block_sum(values, row_starts, col_starts):
+    """Return the sums of the blocks of a 2D array."""
+    values = np.add.reduceat(values, row_starts, axis=0)
+    return np.add.reduceat(values, col_starts, axis=1)
+
+
+def _mean(values, starts, axis):
+    """Return the means of the blocks of a axis."""
+    sizes = np.diff(np.r_[starts, values.shape[axis]])
+    shape = [1] * values.ndim
+    shape[axis] = -1
+    return np.add.reduceat(values, starts, axis) / sizes.reshape(shape)
+
+
+def _coarsen(coords, starts):
+    """Average the blocks of coordinates, the edges stay on the edges."""
+    result = coords
+    for axis, axis_starts in enumerate(starts):
+        result = _mean(result, axis_starts, axis)
+    for axis in range(coords.ndim):
+        for end in (0, -1):
+            edge = np.take(coords, [end], axis)
+            for other, other_starts in enumerate(starts):
+                if other != axis:
+                    edge = _mean(edge, other_starts, other)
+            index = [slice(None)] * coords.ndim
+            index[axis] = [end]
+            result[tuple(index)] = edge
+    if coords.ndim == 2:
+        corners = np.ix_([0, -1], [0, -1])
+        result[corners] = coords[corners]
+    return result
+
+
+def downsample_grid(x, y, z, shape):
+    """
+    Average the blocks of a grid to have at most *shape* values.
+
+    Every block of ``ceil(M / rows)`` by ``ceil(N / cols)`` values becomes
+    its mean, the masked and ``nan`` values are left out and the blocks
+    without values are masked. The coordinates are averaged the same way.
+
+    Parameters
+    ----------
+    x, y : array-like
+        The coordinates of ``ax.contourf``, 1D of lengths *N* and *M* or
+        2D of the shape of *z*.
+
+    z : array-like, shape (M, N)
+        The values of the grid.
+
+    shape : (float, float)
+        The maximum number of rows and columns, usually the size of the
+        axis in pixels.
+
+    Returns
+    -------
+    x, y, z
+        The averaged grid, or the arguments when it is small enough.
+
+    .. versionadded:: 0.0.2
+    """
+    rows, cols = np.shape(z)
+    row_step = int(np.ceil(rows / max(int(shape[0]), 1)))
+    col_step = int(np.ceil(cols / max(int(shape[1]), 1)))
+    if row_step == col_step == 1:
+        return x, y, z
+    z = np.ma.masked_invalid(np.ma.asarray(z, float))
+    row_starts = np.arange(0, rows, row_step)
+    col_starts = np.arange(0, cols, col_step)
+    weights = (~np.ma.getmaskarray(z)).astype(float)
+    counts = _block_sum(weights, row_starts, col_starts)
+    sums = _block_sum(z.filled(0) * weights, row_starts, col_starts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = np.ma.masked_where(counts == 0, sums / counts)
+    x, y = np.asarray(x, float), np.asarray(y, float)
+    grid = [row_starts, col_starts]
+    x = _coarsen(x, [col_starts] if x.ndim == 1 else grid)
+    y = _coarsen(y, [row_starts] if y.ndim == 1 else grid)
+    return x, y, z
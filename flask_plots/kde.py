@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+#
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-Plots.
+
+Binned kernel density estimation, for the violins of large datasets.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numbers
+
+from matplotlib import cbook, mlab
+
+import numpy as np
+
+#: The default number of grid points of the binned KDE.
+KDE_GRID_SIZE = 2**10
+
+#: The largest grid of the binned KDE.
+KDE_MAX_GRID_SIZE = 2**16
+
+# =============================================================================
+# KDE
+# =============================================================================
+
+
+def kde_factor(n, bw_method="scott"):
+    """Return the bandwidth factor of ``GaussianKDE`` for *n* samples."""
+    if isinstance(bw_method, numbers.Number):
+        return bw_method
+    if bw_method in (None, "scott"):
+        return n ** (-1 / 5)
+    if bw_method == "silverman":
+        return (n * 3 / 4) ** (-1 / 5)
+    raise ValueError(
+        "bw_method should be 'scott', 'silverman' or a scalar, "
+        f"not {bw_method!r}"
+    )
+
+
+def fft_kde(x, coords, bw_method="scott", grid_size=KDE_GRID_SIZE):
+    """
+    Evaluate a gaussian KDE of the samples by a binned FFT convolution.
+
+    The samples are linearly binned on a regular grid, which is convolved
+    with the gaussian kernel by FFT and interpolated at the *coords*. It
+    costs ``O(n + m log m)`` for *n* samples and a grid of *m* points,
+    instead of the ``O(n * len(coords))`` of ``matplotlib.mlab.GaussianKDE``,
+    with the same bandwidth.
+
+    Parameters
+    ----------
+    x : array-like, shape (n, )
+        The samples.
+
+    coords : array-like
+        The points where the density is evaluated.
+
+    bw_method : {'scott', 'silverman'} or float, default: 'scott'
+        The bandwidth factor, like in ``ax.violinplot``.
+
+    grid_size : int, default: KDE_GRID_SIZE
+        The minimum number of grid points, the grid grows up to
+        ``KDE_MAX_GRID_SIZE`` points to have four points per bandwidth.
+
+    Returns
+    -------
+    density : numpy.ndarray
+        The density at the *coords*.
+
+    .. versionadded:: 0.0.2
+    """
+    x = np.ravel(np.asarray(x, float))
+    n = len(x)
+    if n < 2:
+        raise ValueError("The KDE needs at least two samples")
+    bandwidth = kde_factor(n, bw_method) * np.std(x, ddof=1)
+    if not bandwidth > 0:
+        raise ValueError("The KDE needs samples with different values")
+    low = x.min() - 4 * bandwidth
+    high = x.max() + 4 * bandwidth
+    size = int(np.clip((high - low) / bandwidth * 4, grid_size, None))
+    size = min(size, KDE_MAX_GRID_SIZE)
+    step = (high - low) / (size - 1)
+    # Linear binning: every sample is shared by its two grid points.
+    position = (x - low) / step
+    index = np.minimum(position.astype(np.int64), size - 2)
+    weight = position - index
+    grid = np.bincount(index, 1 - weight, size)
+    grid += np.bincount(index + 1, weight, size)
+    # The kernel is cut where it is zero for the grid of float.
+    reach = min(int(np.ceil(8 * bandwidth / step)), size - 1)
+    offsets = np.arange(-reach, reach + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    kernel /= np.sqrt(2 * np.pi) * bandwidth * n
+    length = size + len(kernel) - 1
+    density = np.fft.irfft(
+        np.fft.rfft(grid, length) * np.fft.rfft(kernel, length), length
+    )
+    density = np.maximum(density[reach:][:size], 0)
+    return np.interp(coords, low + step * np.arange(size), density)
+
+
+def exact_kde(bw_method="scott"):
+    """
+    Return the gaussian KDE of ``ax.violinplot`` as a ``violin_stats`` method.
+
+    It evaluates ``matplotlib.mlab.GaussianKDE``, a dataset of a single
+    value has the density ``1`` at that value, like in ``ax.violinplot``.
+
+    .. versionadded:: 0.0.2
+    """
+
+    def method(x, coords):
+        x = np.asarray(x)
+        if np.all(x[0] == x):
+            return (x[0] == coords).astype(float)
+        return mlab.GaussianKDE(x, bw_method).evaluate(coords)
+
+    return method
+
+
+def violin_stats(
+    dataset, points=100, quantiles=None, bw_method="scott", kde="fft"
+):
+    """
+    Return the statistics of ``ax.violin`` for the dataset.
+
+    Parameters
+    ----------
+    dataset : Array or a sequence of vectors.
+        The input data.
+
+    points, quantiles, bw_method
+        The parameters of ``ax.violinplot``.
+
+    kde : {'fft', 'exact'}, default: 'fft'
+        The estimator of the densities: :func:`fft_kde` or the
+        ``GaussianKDE`` of Matplotlib, see :func:`exact_kde`. The groups of
+        a single value always use the latter.
+
+    Returns
+    -------
+    vpstats : list of dict
+        The statistics of ``matplotlib.cbook.violin_stats``.
+
+    .. versionadded:: 0.0.2
+    """
+    if kde == "fft":
+        kde_factor(2, bw_method)  # Fail before the statistics.
+        exact = exact_kde(bw_method)
+
+        def method(x, coords):
+            if np.all(np.asarray(x)[0] == x):  # No bandwidth for the FFT.
+                return exact(x, coords)
+            return fft_kde(x, coords, bw_method)
+
+    elif kde == "exact":
+        method = exact_kde(bw_method)
+    else:
+        raise ValueError(f"kde must be 'fft' or 'exact', not {kde!r}")
+    return cbook.violin_stats(
+        dataset, method, points=points, quantiles=quantiles
+    )
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+#
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-Plots.
+
+Figures refreshed by blitting the data artists over a cached background.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import base64
+import hashlib
+import io
+import itertools
+import operator
+import time
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.image import imsave
+
+import numpy as np
+
+# =============================================================================
+# LIVE FIGURE
+# =============================================================================
+
+
+class LiveFigure(object):
+    """Figure whose static artists are rasterized only once.
+
+    Everything already on the figure when the ``LiveFigure`` is created
+    is the background: axes, grid, labels, titles... It is rendered once
+    and kept as a Agg buffer. For every frame, add the data artists with
+    the plot methods and call :meth:`get_data`: the background is
+    restored and only the new artists are drawn, then they are removed
+    so the next frame starts from the background again.
+
+    The autoscale of the axes is turned off, set the limits of the axes
+    before creating the ``LiveFigure``. The property cycle of the axes is
+    reset after every frame, so the default colors don't change from one
+    frame to the next.
+
+    Parameters
+    ----------
+    fig : matplotlib.Figure
+        A instance of Figure Object with the static parts.
+
+    prop_cycle : cycler.Cycler or None, default: None
+        The property cycle of the axes, ``None`` uses
+        ``rcParams["axes.prop_cycle"]``.
+
+    Examples
+    --------
+    >>> live = LiveFigure(fig)
+    >>> plots.bar(live.figure, hosts, loads)
+    >>> data = live.get_data()
+
+    .. versionadded:: 0.0.2
+    """
+
+    def __init__(self, fig, prop_cycle=None):
+        self.figure = fig
+        self.prop_cycle = prop_cycle
+        if not isinstance(fig.canvas, FigureCanvasAgg):
+            FigureCanvasAgg(fig)
+        self.canvas = fig.canvas
+        self._background = None
+        self._static = {}
+        self.snapshot()
+
+    def snapshot(self):
+        """Render the background again, after changing the static parts."""
+        for ax in self.figure.axes:
+            ax.set_autoscale_on(False)
+            ax.set_prop_cycle(self.prop_cycle)
+        self.canvas.draw()
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._static = {
+            ax: (set(ax.get_children()), set(map(id, ax.containers)))
+            for ax in self.figure.axes
+        }
+
+    def data_artists(self):
+        """Return the artists added since the background was rendered."""
+        artists = []
+        for ax, (children, _) in self._static.items():
+            artists.extend(a for a in ax.get_children() if a not in children)
+        return sorted(artists, key=operator.methodcaller("get_zorder"))
+
+    def draw(self):
+        """Blit the data artists over the background."""
+        renderer = self.canvas.get_renderer()
+        self.canvas.restore_region(self._background)
+        for artist in self.data_artists():
+            artist.draw(renderer)
+
+    def clear(self):
+        """Remove the data artists."""
+        for ax, (_, containers) in self._static.items():
+            for container in ax.containers[:]:
+                if id(container) not in containers:
+                    container.remove()
+        for artist in self.data_artists():
+            artist.remove()
+        for ax in self._static:
+            ax.set_prop_cycle(self.prop_cycle)
+
+    def get_bytes(self, fmt="png"):
+        """
+        Render a frame and remove its data artists.
+
+        Parameters
+        ----------
+        fmt : str, default: "png"
+            A raster extension type for the images.
+
+        Returns
+        -------
+        data : bytes
+            The image file contents.
+        """
+        self.draw()
+        data = self.encode(fmt)
+        self.clear()
+        return data
+
+    def encode(self, fmt="png"):
+        """Encode what is on the canvas, call it after :meth:`draw`."""
+        buf = io.BytesIO()
+        imsave(
+            buf,
+            np.asarray(self.canvas.buffer_rgba()),
+            format=fmt,
+            origin="upper",
+            dpi=self.figure.dpi,
+        )
+        return buf.getvalue()
+
+    def get_data(self, fmt="png", decode="ascii"):
+        """Create the data of ``Plots.get_data`` for a frame."""
+        return base64.b64encode(self.get_bytes(fmt)).decode(decode)
+
+
+# =============================================================================
+# STREAMS
+# =============================================================================
+
+
+def iter_events(live, update, fmt="png", interval=1.0, max_frames=None):
+    """
+    Yield the frames of a live figure as Server-Sent Events.
+
+    The generator only renders a frame when the consumer asks for the
+    next event, a slow client slows down the rendering (backpressure).
+
+    Parameters
+    ----------
+    live : LiveFigure
+        The figure of the stream.
+
+    update : callable
+        Called with ``live.figure`` before every frame to add the data
+        artists.
+
+    fmt : str, default: "png"
+        A raster extension type for the images.
+
+    interval : float, default: 1.0
+        Seconds between two frames.
+
+    max_frames : int or None, default: None
+        Stop after this number of frames, ``None`` never stops.
+
+    Yields
+    ------
+    event : str
+        A ``frame`` event whose data is a ``data:`` url of the image.
+        Frames identical to the previous one are not sent, a keepalive
+        comment is sent instead so the server still writes to the client
+        and notices when it's gone.
+    """
+    last = None
+    frames = itertools.count() if max_frames is None else range(max_frames)
+    for frame in frames:
+        if frame:
+            time.sleep(interval)
+        update(live.figure)
+        live.draw()
+        digest = hashlib.blake2b(live.canvas.buffer_rgba()).digest()
+        if digest != last:
+            data = base64.b64encode(live.encode(fmt)).decode("ascii")
+            yield (
+                f"event: frame\nid: {frame}\n"
+                f"data: data:image/{fmt};base64,{data}\n\n"
+            )
+            last = digest
+        else:
+            yield ": keepalive\n\n"
+        live.clear()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+#
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-Plots.
+
+Binning of large arrays in a pool of worker processes.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import mmap
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .accumulators import BIN_CHUNK_SIZE, iter_chunks
+from .engine import LazyProcessPool
+
+#: Parameters of the plots that the parallel binning can't handle.
+UNSUPPORTED = frozenset(["weights", "C", "xscale", "yscale", "marginals"])
+
+# =============================================================================
+# WORKERS
+# =============================================================================
+
+
+def _share(array):
+    """Return how the workers find the array, and its shared memory."""
+    if isinstance(array, np.memmap) and isinstance(array.base, mmap.mmap):
+        source = ("file", array.filename, array.offset)
+        return source + (array.dtype.str, array.shape), None
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, array.dtype, buffer=shm.buf)[:] = array
+    return ("shm", shm.name, 0, array.dtype.str, array.shape), shm
+
+
+def _attach(source, handles):
+    """Open a array of :func:`_share`, this runs in the worker processes."""
+    kind, name, offset, dtype, shape = source
+    if kind == "file":
+        return np.memmap(name, dtype, "r", offset, shape)
+    shm = shared_memory.SharedMemory(name=name)
+    handles.append(shm)
+    return np.ndarray(shape, dtype, buffer=shm.buf)
+
+
+def _fill(acc, arrays, start, stop, chunk_size):
+    for chunk in iter_chunks(chunk_size, *(a[start:stop] for a in arrays)):
+        acc.add(*chunk)
+
+
+def _bin_part(acc, sources, start, stop, chunk_size):
+    """Bin a slice of the shared arrays and return the counts."""
+    acc.counts[:] = 0
+    handles = []
+    try:
+        arrays = [_attach(source, handles) for source in sources]
+        _fill(acc, arrays, start, stop, chunk_size)
+        del arrays
+    finally:
+        for shm in handles:
+            shm.close()
+    return acc.counts
+
+
+# =============================================================================
+# BINNER
+# =============================================================================
+
+
+class ParallelBinner(LazyProcessPool):
+    """Fill the accumulators of large arrays in a pool of processes.
+
+    Every worker bins a slice of the data and the parent sums the partial
+    count grids. The counts are whole numbers, their sum doesn't depend
+    on the order and the result is the one of the serial binning. In
+    memory arrays are copied once to shared memory, memory-mapped files
+    are opened again by the workers, the data are never pickled.
+
+    Parameters
+    ----------
+    workers : int or None, default: None
+        The number of processes, ``None`` uses ``os.cpu_count()``.
+
+    threshold : int, default: 5000000
+        The minimum number of points binned in parallel, smaller inputs
+        are left to Matplotlib.
+
+    chunk_size : int, default: BIN_CHUNK_SIZE
+        The number of points binned at once by a worker.
+
+    .. versionadded:: 0.0.2
+    """
+
+    def __init__(
+        self, workers=None, threshold=5_000_000, chunk_size=BIN_CHUNK_SIZE
+    ):
+        super().__init__(workers or os.cpu_count())
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+
+    def accepts(self, x, kws=()):
+        """Return ``True`` if *x* is large enough and *kws* are supported."""
+        return len(x) >= self.threshold and not UNSUPPORTED.intersection(kws)
+
+    def fill(self, acc, x, y):
+        """Add the points to a accumulator and return it."""
+        shared = [_share(x), _share(y)]
+        sources = [source for source, _ in shared]
+        bounds = np.linspace(0, len(x), self.workers + 1).astype(int)
+        try:
+            futures = [
+                self.executor.submit(
+                    _bin_part, acc, sources, start, stop, self.chunk_size
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:])
+                if stop > start
+            ]
+            for future in futures:
+                acc.counts += future.result()
+        finally:
+            for _, shm in shared:
+                if shm is not None:
+                    shm.close()
+                    shm.unlink()
+        return acc
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+#
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-Plots.
+
+Pool and templates of reusable figures.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import pickle
+import threading
+import weakref
+
+import matplotlib as mpl
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# =============================================================================
+# POOL
+# =============================================================================
+
+
+class FigurePool(object):
+    """Thread safe pool of figures with their Agg canvas and axes.
+
+    A released figure goes back to the pool only when its layout is the
+    one handed out: the same axes and no figure level artists (suptitle,
+    legends, colorbars, ...). Its axes are cleared and the properties
+    :meth:`matplotlib.axes.Axes.clear` keeps (position, aspect, anchor,
+    facecolor, frame, zorder, ...) are restored, as well as the size, dpi,
+    colors and subplot parameters of the figure. Any other figure is
+    dropped, so no state leaks between requests.
+
+    Parameters
+    ----------
+    size : int
+        The maximum number of idle figures kept in the pool.
+
+    figsize : (float, float) or None, default: None
+        The size in inches of the figures, ``None`` uses
+        ``rcParams["figure.figsize"]``.
+
+    dpi : float or None, default: None
+        The dots per inch of the figures, ``None`` uses
+        ``rcParams["figure.dpi"]``.
+
+    .. versionadded:: 0.0.2
+    """
+
+    def __init__(self, size, figsize=None, dpi=None):
+        self.size = size
+        self.figsize = figsize
+        self.dpi = dpi
+        self._idle = {}
+        self._layouts = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of idle figures."""
+        return sum(map(len, self._idle.values()))
+
+    def acquire(self, nrows=1, ncols=1):
+        """Return a clean figure with a grid of ``nrows`` x ``ncols`` axes."""
+        key = (nrows, ncols)
+        with self._lock:
+            if self._idle.get(key):
+                return self._idle[key].pop()
+        fig = Figure(figsize=self.figsize, dpi=self.dpi)
+        FigureCanvasAgg(fig)
+        fig.subplots(nrows, ncols, squeeze=False)
+        self._layouts[fig] = (
+            key,
+            tuple(fig.axes),
+            tuple(map(_axes_state, fig.axes)),
+            dict(vars(fig.subplotpars)),
+            tuple(fig.get_size_inches()),
+            fig.dpi,
+        )
+        return fig
+
+    def release(self, fig):
+        """Give back a figure from :meth:`acquire`."""
+        layout = self._layouts.get(fig)
+        if layout is None or not self._reset(fig, *layout[1:]):
+            return
+        with self._lock:
+            idle = self._idle.setdefault(layout[0], [])
+            if len(self) < self.size and fig not in idle:
+                idle.append(fig)
+
+    def clear(self):
+        """Drop all the idle figures."""
+        with self._lock:
+            self._idle.clear()
+
+    def _reset(self, fig, axes, states, subplotpars, figsize, dpi):
+        """Restore the figure, return ``False`` if it can't be reused."""
+        figure_artists = (
+            fig.artists,
+            fig.lines,
+            fig.patches,
+            fig.texts,
+            fig.images,
+            fig.legends,
+            fig.subfigs,
+        )
+        if tuple(fig.axes) != axes or any(figure_artists) or _has_layout(fig):
+            return False
+        for ax, state in zip(axes, states):
+            ax.clear()
+            ax.set(**state)
+            ax.set_axis_on()
+        fig.subplotpars.update(**subplotpars)
+        fig.set_size_inches(figsize)
+        fig.set_dpi(dpi)
+        fig.set_facecolor(mpl.rcParams["figure.facecolor"])
+        fig.set_edgecolor(mpl.rcParams["figure.edgecolor"])
+        fig.set_frameon(mpl.rcParams["figure.frameon"])
+        fig.patch.set_alpha(None)
+        return True
+
+
+def _axes_state(ax):
+    """Return the properties of the axes that ``ax.clear()`` keeps."""
+    return {
+        "position": ax.get_position(original=True),
+        "box_aspect": ax.get_box_aspect(),
+        "adjustable": ax.get_adjustable(),
+        "aspect": ax.get_aspect(),
+        "anchor": ax.get_anchor(),
+        "facecolor": ax.get_facecolor(),
+        "frame_on": ax.get_frame_on(),
+        "alpha": ax.get_alpha(),
+        "zorder": ax.get_zorder(),
+        "rasterization_zorder": ax.get_rasterization_zorder(),
+        "navigate": ax.get_navigate(),
+    }
+
+
+def _has_layout(fig):
+    """Return ``True`` if the figure has a tight or constrained layout."""
+    get_layout_engine = getattr(fig, "get_layout_engine", None)
+    if get_layout_engine is not None:
+        return get_layout_engine() is not None
+    # Before Matplotlib 3.6.
+    return fig.get_tight_layout() or fig.get_constrained_layout()
+
+
+# =============================================================================
+# TEMPLATES
+# =============================================================================
+
+
+class FigureTemplate(object):
+    """Figure built once and cloned for every request.
+
+    The builder runs on the first :meth:`clone` and the figure is kept
+    pickled, unpickling it is much cheaper than building and laying out
+    the static parts again.
+
+    Parameters
+    ----------
+    builder : callable
+        A function without arguments that returns a ``matplotlib.Figure``
+        with the static parts: size, axes, titles, labels, tick
+        formatting... It must be picklable, for example tick formatters
+        can't be ``lambda`` functions.
+
+    .. versionadded:: 0.0.2
+    """
+
+    def __init__(self, builder):
+        self.builder = builder
+        self._payload = None
+        self._lock = threading.Lock()
+
+    def clone(self):
+        """Return a new copy of the figure of the template."""
+        if self._payload is None:
+            with self._lock:
+                if self._payload is None:
+                    self._payload = pickle.dumps(self.builder())
+        return pickle.loads(self._payload)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+#
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-Plots.
+
+Mergeable quantile sketches, to summarize data that never fit in memory.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import math
+
+import numpy as np
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+
+class _Store(object):
+    """Dense counts of consecutive integer keys."""
+
+    def __init__(self):
+        self.offset = 0
+        self.counts = np.zeros(0, np.int64)
+
+    def add(self, keys, counts=None):
+        if not len(keys):
+            return
+        low, high = int(keys.min()), int(keys.max())
+        self._extend(low, high)
+        self.counts += np.bincount(
+            keys - self.offset, counts, minlength=len(self.counts)
+        ).astype(np.int64)
+
+    def merge(self, other):
+        keys = np.arange(len(other.counts)) + other.offset
+        self.add(keys[other.counts > 0], other.counts[other.counts > 0])
+
+    def _extend(self, low, high):
+        if not len(self.counts):
+            self.offset, self.counts = low, np.zeros(high - low + 1, np.int64)
+            return
+        start = min(low, self.offset)
+        stop = max(high + 1, self.offset + len(self.counts))
+        if (start, stop) != (self.offset, self.offset + len(self.counts)):
+            counts = np.zeros(stop - start, np.int64)
+            old = slice(self.offset - start, None)
+            counts[old][: len(self.counts)] = self.counts
+            self.offset, self.counts = start, counts
+
+    def items(self):
+        """Return the keys and counts of the non empty buckets."""
+        keys = np.flatnonzero(self.counts)
+        return keys + self.offset, self.counts[keys]
+
+
+# =============================================================================
+# SKETCH
+# =============================================================================
+
+
+class QuantileSketch(object):
+    """Streaming quantiles with a bounded relative error.
+
+    The values go to buckets growing geometrically, like DDSketch, so any
+    quantile is within *relative_accuracy* of the exact one, whatever the
+    distribution. Only the bucket counts are kept: the memory grows with
+    the logarithm of the range of the values, not with their number.
+    Sketches with the same accuracy merge exactly, fill one per chunk or
+    per worker and :meth:`merge` them.
+
+    Pass the sketches, or their :meth:`stats`, as ``x`` to
+    ``Plots.boxplot`` to draw them.
+
+    Parameters
+    ----------
+    relative_accuracy : float, default: 0.01
+        The maximum relative error of the quantiles.
+
+    .. versionadded:: 0.0.2
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive = _Store()
+        self._negative = _Store()
+        self.zeros = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, values):
+        """Add a chunk of values, the ``nan`` are ignored."""
+        values = np.ravel(np.asarray(values, float))
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return self
+        self._positive.add(self._key(values[values > 0]))
+        self._negative.add(self._key(-values[values < 0]))
+        self.zeros += int(np.count_nonzero(values == 0))
+        self.count += len(values)
+        self.sum += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        return self
+
+    def merge(self, other):
+        """Add the values of a sketch with the same accuracy."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Can't merge sketches with different accuracy")
+        self._positive.merge(other._positive)
+        self._negative.merge(other._negative)
+        self.zeros += other.zeros
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def _key(self, values):
+        return np.ceil(np.log(values) / self._log_gamma).astype(np.int64)
+
+    def _value(self, keys):
+        return 2 * self._gamma ** keys.astype(float) / (self._gamma + 1)
+
+    def _buckets(self):
+        """Return the values and counts of all the buckets, in order."""
+        neg_keys, neg_counts = self._negative.items()
+        pos_keys, pos_counts = self._positive.items()
+        values = np.r_[
+            -self._value(neg_keys[::-1]), 0.0, self._value(pos_keys)
+        ]
+        counts = np.r_[neg_counts[::-1], self.zeros, pos_counts]
+        return values, counts
+
+    def quantile(self, q):
+        """
+        Return the approximate quantiles of the values.
+
+        Parameters
+        ----------
+        q : float or array-like of float
+            The quantiles, between 0 and 1.
+        """
+        if not self.count:
+            raise ValueError("The sketch is empty")
+        values, counts = self._buckets()
+        ranks = np.asarray(q, float) * (self.count - 1)
+        index = np.searchsorted(np.cumsum(counts), ranks, side="right")
+        result = values[np.minimum(index, len(values) - 1)]
+        # The extreme values are known exactly.
+        result = np.where(ranks <= 0, self.min, result)
+        result = np.where(ranks >= self.count - 1, self.max, result)
+        return np.clip(result, self.min, self.max)
+
+    def stats(self, whis=1.5, label=None):
+        """
+        Return the statistics of ``ax.bxp`` for the values.
+
+        Parameters
+        ----------
+        whis : float or (float, float), default: 1.5
+            The whiskers reach the furthest value within *whis* times the
+            interquartile range from the box, or the two percentiles.
+
+        label : str or None, default: None
+            The label of the box.
+
+        Returns
+        -------
+        stats : dict
+            The keys of ``matplotlib.cbook.boxplot_stats``. The fliers are
+            a value per non empty bucket outside the whiskers.
+        """
+        q1, med, q3 = self.quantile([0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        values, counts = self._buckets()
+        values = np.clip(values[counts > 0], self.min, self.max)
+        if np.iterable(whis):
+            whislo, whishi = self.quantile(np.divide(whis, 100))
+        else:
+            inside = values[
+                (values >= q1 - whis * iqr) & (values <= q3 + whis * iqr)
+            ]
+            whislo = min(inside.min(initial=q1), q1)
+            whishi = max(inside.max(initial=q3), q3)
+        stats = {
+            "mean": self.sum / self.count,
+            "iqr": iqr,
+            "cilo": med - 1.57 * iqr / math.sqrt(self.count),
+            "cihi": med + 1.57 * iqr / math.sqrt(self.count),
+            "whislo": whislo,
+            "whishi": whishi,
+            "fliers": values[(values < whislo) | (values > whishi)],
+            "q1": q1,
+            "med": med,
+            "q3": q3,
+        }
+        if label is not None:
+            stats["label"] = label
+        return stats
@@ -0,0 +1,325 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This docstring was part of Matplotlib. All rights reserved.
+# Full Text:
+#    https://matplotlib.org/stable/users/project/license.html
+#
+# This file is part of the
+#   Flask-Plots Project https://github.com/juniors90/Flask-Plots/
+#
+# Copyright (c) 2021, Ferreira Juan David
+#       License: MIT
+# Full Text:
+#       https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+#
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-Plots.
+
+Streamlines of ``ax.streamplot`` integrated once and drawn many times.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import inspect
+
+import matplotlib as mpl
+import matplotlib.collections as mcollections
+import matplotlib.colors as mcolors
+import matplotlib.lines as mlines
+import matplotlib.patches as mpatches
+from matplotlib import streamplot as mstreamplot
+
+import numpy as np
+
+
+def _has_stream_integrator():
+    """Return ``True`` if the private integrator is the one of 3.11."""
+    if tuple(mpl.__version_info__[:2]) != (3, 11):
+        return False
+    try:
+        params = inspect.signature(mstreamplot._get_integrator).parameters
+    except (AttributeError, TypeError, ValueError):
+        return False
+    return list(params) == [
+        "u",
+        "v",
+        "dmap",
+        "minlength",
+        "maxlength",
+        "integration_direction",
+    ]
+
+
+#: ``True`` when the private integrator of ``matplotlib.streamplot`` is the
+#: one of Matplotlib 3.11, the only version tested with
+#: :meth:`StreamTrajectories.integrate`. Others draw with ``ax.streamplot``.
+HAS_STREAM_INTEGRATOR = _has_stream_integrator()
+
+#: Parameters of ``ax.streamplot`` that change the trajectories.
+TRAJECTORY_KWS = frozenset(
+    [
+        "density",
+        "minlength",
+        "maxlength",
+        "start_points",
+        "integration_direction",
+        "broken_streamlines",
+        "integration_max_step_scale",
+        "integration_max_error_scale",
+    ]
+)
+
+# =============================================================================
+# TRAJECTORIES
+# =============================================================================
+
+
+class StreamTrajectories(object):
+    """The integrated streamlines of a vector field.
+
+    Build it with :meth:`integrate`, the same field is drawn again with
+    :meth:`draw` without integrating it. Both use private parts of
+    ``matplotlib.streamplot`` and need Matplotlib 3.11, see
+    ``HAS_STREAM_INTEGRATOR``.
+
+    Parameters
+    ----------
+    grid : matplotlib.streamplot.Grid
+        The grid of the field.
+
+    dmap : matplotlib.streamplot.DomainMap
+        The map from the grid to the data coordinates.
+
+    trajectories : list of numpy.ndarray
+        The ``(n, 2)`` trajectories in grid coordinates.
+
+    .. versionadded:: 0.0.2
+    """
+
+    def __init__(self, grid, dmap, trajectories):
+        self.grid = grid
+        self.dmap = dmap
+        self.trajectories = trajectories
+
+    @property
+    def nbytes(self):
+        """The memory used by the trajectories."""
+        return sum(t.nbytes for t in self.trajectories)
+
+    @classmethod
+    def integrate(
+        cls,
+        x,
+        y,
+        u,
+        v,
+        density=1,
+        minlength=0.1,
+        start_points=None,
+        maxlength=4.0,
+        integration_direction="both",
+        broken_streamlines=True,
+        integration_max_step_scale=1.0,
+        integration_max_error_scale=1.0,
+    ):
+        """Integrate the streamlines, like ``ax.streamplot``."""
+        grid = mstreamplot.Grid(x, y)
+        mask = mstreamplot.StreamMask(density)
+        dmap = mstreamplot.DomainMap(grid, mask)
+        if integration_max_step_scale <= 0.0:
+            raise ValueError(
+                "The value of integration_max_step_scale must be > 0, "
+                f"got {integration_max_step_scale}"
+            )
+        if integration_max_error_scale <= 0.0:
+            raise ValueError(
+                "The value of integration_max_error_scale must be > 0, "
+                f"got {integration_max_error_scale}"
+            )
+        if integration_direction not in ("both", "forward", "backward"):
+            raise ValueError(
+                "integration_direction must be 'both', 'forward' or "
+                f"'backward', not {integration_direction!r}"
+            )
+        if integration_direction == "both":
+            maxlength /= 2.0
+        u, v = np.asanyarray(u), np.asanyarray(v)
+        if u.shape != grid.shape or v.shape != grid.shape:
+            raise ValueError(
+                "'u' and 'v' must match the shape of the (x, y) grid"
+            )
+        integrate = mstreamplot._get_integrator(
+            np.ma.masked_invalid(u),
+            np.ma.masked_invalid(v),
+            dmap,
+            minlength,
+            maxlength,
+            integration_direction,
+        )
+        if start_points is None:
+            seeds = (
+                dmap.mask2grid(xm, ym)
+                for xm, ym in mstreamplot._gen_starting_points(mask.shape)
+                if mask[ym, xm] == 0
+            )
+        else:
+            seeds = cls._seeds(grid, dmap, start_points)
+        trajectories = []
+        # The seeds are generated lazily, the mask is filled meanwhile.
+        for xg, yg in seeds:
+            t = integrate(
+                xg,
+                yg,
+                broken_streamlines,
+                integration_max_step_scale,
+                integration_max_error_scale,
+            )
+            if t is not None:
+                trajectories.append(np.asarray(t, float))
+        return cls(grid, dmap, trajectories)
+
+    @staticmethod
+    def _seeds(grid, dmap, start_points):
+        """Return the grid coordinates of the start points."""
+        sp2 = np.asanyarray(start_points, dtype=float).copy()
+        for xs, ys in sp2:
+            if not (
+                grid.x_origin <= xs <= grid.x_origin + grid.width
+                and grid.y_origin <= ys <= grid.y_origin + grid.height
+            ):
+                raise ValueError(
+                    f"Starting point ({xs}, {ys}) outside of data boundaries"
+                )
+        sp2[:, 0] -= grid.x_origin
+        sp2[:, 1] -= grid.y_origin
+        for xs, ys in sp2:
+            xg, yg = dmap.data2grid(xs, ys)
+            yield np.clip(xg, 0, grid.nx - 1), np.clip(yg, 0, grid.ny - 1)
+
+    def draw(
+        self,
+        ax,
+        linewidth=None,
+        color=None,
+        cmap=None,
+        norm=None,
+        arrowsize=1,
+        arrowstyle="-|>",
+        transform=None,
+        zorder=None,
+        num_arrows=1,
+    ):
+        """
+        Draw the streamlines, like ``ax.streamplot``.
+
+        Parameters
+        ----------
+        ax : matplotlib.Figure.Axis
+            A matplotlib axis.
+
+        linewidth, color, cmap, norm, arrowsize, arrowstyle, transform, \
+zorder, num_arrows
+            The styling parameters of ``ax.streamplot``.
+
+        Returns
+        -------
+        StreamplotSet
+            The lines and arrows.
+        """
+        grid, dmap = self.grid, self.dmap
+        if num_arrows < 0:
+            raise ValueError(
+                f"The value of num_arrows must be >= 0, got {num_arrows=}"
+            )
+        zorder = mlines.Line2D.zorder if zorder is None else zorder
+        transform = ax.transData if transform is None else transform
+        if color is None:
+            color = ax._get_lines.get_next_color()
+        if linewidth is None:
+            linewidth = mpl.rcParams["lines.linewidth"]
+        line_kw = {"zorder": zorder}
+        arrow_kw = {
+            "arrowstyle": arrowstyle,
+            "mutation_scale": 10 * arrowsize,
+            "zorder": zorder,
+        }
+        use_multicolor_lines = isinstance(color, np.ndarray)
+        if use_multicolor_lines:
+            if color.shape != grid.shape:
+                raise ValueError(
+                    "If 'color' is given, it must match the shape of "
+                    "the (x, y) grid"
+                )
+            line_colors = [[]]
+            color = np.ma.masked_invalid(color)
+            if norm is None:
+                norm = mcolors.Normalize(color.min(), color.max())
+            cmap = mpl.colormaps.get_cmap(cmap)
+        else:
+            line_kw["color"] = arrow_kw["color"] = color
+        multiwidth = isinstance(linewidth, np.ndarray)
+        if multiwidth:
+            if linewidth.shape != grid.shape:
+                raise ValueError(
+                    "If 'linewidth' is given, it must match the "
+                    "shape of the (x, y) grid"
+                )
+            line_kw["linewidth"] = []
+        else:
+            line_kw["linewidth"] = arrow_kw["linewidth"] = linewidth
+
+        streamlines = []
+        arrows = []
+        for t in self.trajectories:
+            tgx, tgy = t.T
+            tx, ty = dmap.grid2data(tgx, tgy)
+            tx += grid.x_origin
+            ty += grid.y_origin
+            if multiwidth or use_multicolor_lines:
+                points = np.transpose([tx, ty]).reshape(-1, 1, 2)
+                streamlines.extend(np.hstack([points[:-1], points[1:]]))
+            else:
+                streamlines.append(np.transpose([tx, ty]))
+            s = np.cumsum(np.hypot(np.diff(tx), np.diff(ty)))
+            if multiwidth:
+                line_widths = mstreamplot.interpgrid(linewidth, tgx, tgy)[:-1]
+                line_kw["linewidth"].extend(line_widths)
+            if use_multicolor_lines:
+                color_values = mstreamplot.interpgrid(color, tgx, tgy)[:-1]
+                line_colors.append(color_values)
+            for n in range(1, num_arrows + 1):
+                idx = np.searchsorted(s, s[-1] * (n / (num_arrows + 1)))
+                head = slice(idx, idx + 2)
+                arrow_tail = (tx[idx], ty[idx])
+                arrow_head = (np.mean(tx[head]), np.mean(ty[head]))
+                if multiwidth:
+                    arrow_kw["linewidth"] = line_widths[idx]
+                if use_multicolor_lines:
+                    arrow_kw["color"] = cmap(norm(color_values[idx]))
+                arrows.append(
+                    mpatches.FancyArrowPatch(
+                        arrow_tail, arrow_head, transform=transform, **arrow_kw
+                    )
+                )
+
+        lc = mcollections.LineCollection(
+            streamlines, transform=transform, **line_kw
+        )
+        lc.sticky_edges.x[:] = [grid.x_origin, grid.x_origin + grid.width]
+        lc.sticky_edges.y[:] = [grid.y_origin, grid.y_origin + grid.height]
+        if use_multicolor_lines:
+            lc.set_array(np.ma.hstack(line_colors))
+            lc.set_cmap(cmap)
+            lc.set_norm(norm)
+        ax.add_collection(lc)
+        ac = mcollections.PatchCollection(arrows)
+        for p in arrows:
+            ax.add_patch(p)
+        ax.autoscale_view()
+        return mstreamplot.StreamplotSet(lc, ac)
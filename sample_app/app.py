@@ -28,13 +28,12 @@ plots = Plots(app)
 # routes
 @app.route("/")
 def bar():
-    fig = Figure()
-    ax = fig.subplots()
-    countries = ["Argentina", "Brasil", "Colombia", "Chile"]
-    peoples = [14, 40, 16, 24]
-    ax = plots.bar(fig, countries, peoples)
-    ax.set_title("Bar Chart")
-    data = plots.get_data(fig)
+    with plots.pooled_figure() as fig:
+        countries = ["Argentina", "Brasil", "Colombia", "Chile"]
+        peoples = [14, 40, 16, 24]
+        ax = plots.bar(fig, countries, peoples)
+        ax.set_title("Bar Chart")
+        data = plots.get_data(fig)
     return render_template_string(
         """
         {% from 'plots/utils.html' import render_img %}
@@ -11,9 +11,39 @@
 
 from flask_plots import Plots
 
+from matplotlib.figure import Figure
+
 import pytest as pt
 
 
+@pt.fixture
+def plots_config():
+    """Config of the app, parametrize it to test other configs."""
+    return {}
+
+
+@pt.fixture(autouse=True)
+def app(app, plots_config):
+    app.config.update(plots_config)
+    yield app
+
+
 @pt.fixture(autouse=True)
 def plots(app):
-    yield Plots(app)
+    plots = Plots(app)
+    yield plots
+    plots.shutdown()
+
+
+@pt.fixture
+def make_fig():
+    """Return a factory of figures with a line of *data*."""
+
+    def make_fig(data=(1, 4)):
+        fig = Figure()
+        ax = fig.subplots()
+        ax.plot(data)
+        ax.set_title("Linear Function")
+        return fig
+
+    return make_fig
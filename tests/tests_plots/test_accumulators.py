@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+from flask_plots import (
+    HexbinAccumulator,
+    Hist2dAccumulator,
+    HistAccumulator,
+)
+
+from matplotlib.figure import Figure
+from matplotlib.testing.decorators import check_figures_equal
+
+import numpy as np
+
+import pytest as pt
+
+rng = np.random.default_rng(42)
+x = rng.normal(size=5000)
+y = rng.normal(size=5000)
+
+
+def chunks(*arrays, size=700):
+    for start in range(0, len(arrays[0]), size):
+        yield [array[start:][:size] for array in arrays]
+
+
+@check_figures_equal(extensions=["png"])
+def test_hist_accumulator(plots, fig_test, fig_ref):
+    acc = HistAccumulator(20, limits=(-4, 4))
+    for (chunk,) in chunks(x):
+        acc.add(chunk)
+    plots.hist(fig_test, acc, hist_kws={"color": "g"})
+    fig_ref.gca().hist(x, bins=np.linspace(-4, 4, 21), color="g")
+
+
+@check_figures_equal(extensions=["png"])
+def test_hist2d_accumulator(plots, fig_test, fig_ref):
+    bins = [np.linspace(-3, 3, 31), np.linspace(-2, 4, 16)]
+    acc = Hist2dAccumulator(bins)
+    for xs, ys in chunks(x, y):
+        acc.add(xs, ys)
+    plots.hist2d(fig_test, acc, hist2d_kws={"cmap": "inferno"})
+    fig_ref.gca().hist2d(x, y, bins=bins, cmap="inferno")
+
+
+@pt.mark.parametrize("mincnt", [None, 1, 5])
+@check_figures_equal(extensions=["png"])
+def test_hexbin_accumulator(plots, fig_test, fig_ref, mincnt):
+    extent = (-3, 3, -3, 3)
+    acc = HexbinAccumulator(extent, gridsize=25)
+    for xs, ys in chunks(x, y):
+        acc.add(xs, ys)
+    plots.hexbin(fig_test, acc, hexbin_kws={"mincnt": mincnt})
+    fig_ref.gca().hexbin(x, y, gridsize=25, extent=extent, mincnt=mincnt)
+
+
+def test_hexbin_accumulator_counts_out_of_extent():
+    acc = HexbinAccumulator((0, 1, 0, 1), gridsize=10)
+    acc.add([0.5, 2.0, -1.0], [0.5, 0.5, 0.5])
+    assert acc.counts.sum() == 1
+
+
+def test_merge():
+    whole = HistAccumulator(10, limits=(-4, 4)).add(x)
+    half = HistAccumulator(10, limits=(-4, 4)).add(x[:2500])
+    half.merge(HistAccumulator(10, limits=(-4, 4)).add(x[2500:]))
+    np.testing.assert_array_equal(half.counts, whole.counts)
+    with pt.raises(ValueError):
+        half.merge(HistAccumulator(5, limits=(-4, 4)))
+
+
+def test_hist_accumulator_needs_range():
+    with pt.raises(ValueError):
+        HistAccumulator(10)
+
+
+@pt.mark.parametrize("bins", [None, 15, np.linspace(-5, 5, 11)])
+@check_figures_equal(extensions=["png"])
+def test_hist_out_of_core(plots, tmp_path, fig_test, fig_ref, bins):
+    np.save(tmp_path / "x.npy", x)
+    plots.chunk_size = 1000
+    hist_kws = {} if bins is None else {"bins": bins}
+    plots.hist(fig_test, str(tmp_path / "x.npy"), hist_kws=hist_kws)
+    fig_ref.gca().hist(x, **hist_kws)
+
+
+@check_figures_equal(extensions=["png"])
+def test_hist2d_out_of_core(plots, tmp_path, fig_test, fig_ref):
+    xs = np.lib.format.open_memmap(tmp_path / "x.npy", "w+", float, x.shape)
+    xs[:] = x
+    plots.chunk_size = 1000
+    plots.hist2d(fig_test, xs, y, hist2d_kws={"bins": [20, 5]})
+    fig_ref.gca().hist2d(x, y, bins=[20, 5])
+
+
+@check_figures_equal(extensions=["png"])
+def test_hexbin_out_of_core(plots, tmp_path, fig_test, fig_ref):
+    np.save(tmp_path / "x.npy", x)
+    np.save(tmp_path / "y.npy", y)
+    plots.chunk_size = 1000
+    plots.hexbin(
+        fig_test,
+        tmp_path / "x.npy",
+        tmp_path / "y.npy",
+        hexbin_kws={"gridsize": 20},
+    )
+    fig_ref.gca().hexbin(x, y, gridsize=20)
+
+
+@pt.mark.parametrize(
+    "kws", [{}, {"bins": [40, 20], "cmin": 2, "cmap": "viridis"}]
+)
+@check_figures_equal(extensions=["png"], tol=1)
+def test_hist2d_image(app, plots, fig_test, fig_ref, kws):
+    with app.app_context():
+        plots.hist2d(fig_test, x, y, hist2d_kws=kws, image=True)
+    fig_ref.gca().hist2d(x, y, **{"cmap": "Greys", **kws})
+
+
+@check_figures_equal(extensions=["png"], tol=1)
+def test_hist2d_image_density(app, plots, fig_test, fig_ref):
+    acc = Hist2dAccumulator([20, 10], [[-3, 3], [-2, 2]]).add(x, y)
+    kws = {"density": True, "cmap": "viridis"}
+    with app.app_context():
+        plots.hist2d(fig_test, acc, hist2d_kws=kws, image=True)
+    fig_ref.gca().hist2d(x, y, bins=[20, 10], range=[[-3, 3], [-2, 2]], **kws)
+
+
+def test_hist2d_image_fallback(app, plots):
+    fig = Figure()
+    bins = [np.geomspace(1, 10, 11) - 5, 10]
+    acc = Hist2dAccumulator(10, [[-3, 3], [-3, 3]]).add(x, y)
+    with app.app_context():
+        plots.hist2d(fig, x, y, hist2d_kws={"bins": bins}, image=True)
+        plots.hist2d(fig, x, y, hist2d_kws={"edgecolors": "k"}, image=True)
+        assert len(fig.gca().collections) == 2
+        plots.scatter_hist2d(fig, x, y, image=True)
+        plots.hist2d(fig, acc, image=True)
+    assert len(fig.gca().images) == 2
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+import asyncio
+import threading
+
+from matplotlib.figure import Figure
+
+import pytest as pt
+
+
+def test_get_data_async(plots, make_fig):
+    async def view():
+        return await asyncio.gather(
+            *(plots.get_data_async(make_fig([1, end])) for end in range(3))
+        )
+
+    data = asyncio.run(view())
+    assert data == [plots.get_data(make_fig([1, end])) for end in range(3)]
+
+
+@pt.mark.parametrize("plots_config", [{"PLOTS_RENDER_THREADS": 1}])
+def test_get_bytes_async_cancel(plots):
+    release = threading.Event()
+    plots.executor.submit(release.wait)
+    rendered = []
+
+    class TrackedFigure(Figure):
+        def savefig(self, *args, **kwargs):
+            rendered.append(self)
+            return super().savefig(*args, **kwargs)
+
+    async def view():
+        task = asyncio.ensure_future(plots.get_bytes_async(TrackedFigure()))
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.sleep(0.1)
+        return task.cancelled()
+
+    try:
+        assert asyncio.run(view())
+    finally:
+        plots.shutdown()
+    assert rendered == []
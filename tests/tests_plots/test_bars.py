@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+from flask_plots import top_categories
+
+from matplotlib.figure import Figure
+from matplotlib.testing.decorators import check_figures_equal
+
+import numpy as np
+
+import pytest as pt
+
+
+def test_top_categories():
+    labels, heights = top_categories(["a", "b", "c", "d"], [1, 4, 4, 2], 2)
+    assert labels == ["b", "c", "others"]
+    np.testing.assert_array_equal(heights, [4, 4, 3])
+    labels, heights = top_categories(["a", "b"], 1, 5, others="rest")
+    assert labels == ["a", "b"]
+    np.testing.assert_array_equal(heights, [1, 1])
+
+
+@pt.mark.parametrize(
+    "kws",
+    [
+        {},
+        {"width": 1, "edgecolor": "white", "linewidth": 0.7},
+        {"color": ["r", "g", "b"], "bottom": 1, "align": "edge"},
+    ],
+)
+@check_figures_equal(extensions=["png"], tol=0.05)
+def test_bar_collection(app, plots, fig_test, fig_ref, kws):
+    bx = 0.5 + np.arange(30)
+    by = np.random.default_rng(3).uniform(-2, 7, len(bx))
+    with app.app_context():
+        plots.bar(fig_test, bx, by, bar_kws=kws, collection=True)
+    fig_ref.gca().bar(bx, by, **kws)
+    assert len(fig_test.gca().collections) == 1
+
+
+@check_figures_equal(extensions=["png"])
+def test_bar_top(app, plots, fig_test, fig_ref):
+    names = ["web1", "web2", "db1", "db2", "cache"]
+    with app.app_context():
+        plots.bar(fig_test, names, [5, 1, 9, 2, 3], top=2, collection=True)
+    fig_ref.gca().bar(["db1", "web1", "others"], [9, 5, 6])
+
+
+def test_bar_collection_threshold(app, plots):
+    ax = Figure().subplots()
+    with app.app_context():
+        plots.bar(ax.figure, np.arange(1001), 1.0, ax=ax)
+        plots.bar(ax.figure, np.arange(1000), ax=ax)
+        plots.bar(ax.figure, np.arange(2000), 1, ax=ax, bar_kws={"log": 1})
+    assert len(ax.collections) == 1
+    assert len(ax.patches) == 3000
+    assert ax.patches[0].get_height() == app.config["BAR_HEIGHT"]
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+from flask import Flask
+
+from flask_plots import Plots, RenderCache, fingerprint
+from flask_plots.cache import data_fingerprint
+
+import matplotlib as mpl
+
+import numpy as np
+
+import pytest as pt
+
+cache_enabled = pt.mark.parametrize(
+    "plots_config", [{"PLOTS_CACHE_ENABLED": True}]
+)
+
+
+def test_fingerprint(make_fig):
+    assert fingerprint(make_fig([1, 2])) == fingerprint(make_fig([1, 2]))
+    assert fingerprint(make_fig([1, 2])) != fingerprint(make_fig([1, 3]))
+
+
+def test_fingerprint_unpicklable_figure(make_fig):
+    fig = make_fig([1, 2])
+    fig.gca().xaxis.set_major_formatter(lambda x, pos: str(x))
+    assert fingerprint(fig) is None
+
+
+class Column(object):
+    def __init__(self, data):
+        self.data = data
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.data, dtype)
+
+
+def test_data_fingerprint():
+    a = np.arange(4.0)
+    assert data_fingerprint(a, {"k": 1}) == data_fingerprint(a, {"k": 1})
+    assert data_fingerprint(a) != data_fingerprint(a.astype(int))
+    assert data_fingerprint(Column(a)) == data_fingerprint(a)
+    assert data_fingerprint(Column(a)) != data_fingerprint(Column(a + 1))
+    assert data_fingerprint(range(3)) != data_fingerprint(range(4))
+
+
+def test_cache_lru_eviction():
+    cache = RenderCache(max_bytes=10)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    assert cache.get("a") == b"12345"
+    cache.put("c", b"12345")
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.currsize == 10
+    cache.put("d", b"12345678901")
+    assert "d" not in cache
+
+
+def test_cache_ttl():
+    cache = RenderCache(max_bytes=10, ttl=0)
+    cache.put("a", b"1")
+    assert cache.get("a") is None
+    assert cache.info()["misses"] == 1
+
+
+def test_cache_disabled_by_default(plots):
+    assert plots.cache is None
+
+
+def test_cache_per_app(make_fig):
+    plots = Plots()
+    cached, plain = Flask("cached"), Flask("plain")
+    cached.config["PLOTS_CACHE_ENABLED"] = True
+    plots.init_app(cached)
+    plots.init_app(plain)
+    with cached.app_context():
+        plots.get_data(make_fig())
+        assert plots.cache.info()["misses"] == 1
+    with plain.app_context():
+        assert plots.cache is None
+        plots.get_data(make_fig())
+    with cached.app_context():
+        plots.get_data(make_fig())
+        assert plots.cache.info()["hits"] == 1
+
+
+@cache_enabled
+def test_get_data_uses_cache(plots, make_fig):
+    first = plots.get_data(make_fig([1, 2]))
+    second = plots.get_data(make_fig([1, 2]))
+    assert first == second
+    assert plots.cache.info()["hits"] == 1
+    assert plots.cache.info()["misses"] == 1
+    plots.get_data(make_fig([1, 2]), fmt="svg")
+    assert plots.cache.info()["misses"] == 2
+
+
+@cache_enabled
+def test_get_data_same_figure_uses_cache(plots, make_fig):
+    fig = make_fig([1, 2])
+    first = plots.get_data(fig)
+    assert plots.get_data(fig) == first
+    assert plots.cache.info()["hits"] == 1
+    fig.gca().set_title("Other Title")
+    assert plots.get_data(fig) != first
+    assert plots.cache.info()["misses"] == 2
+
+
+@cache_enabled
+def test_get_data_cache_savefig_params(plots, make_fig):
+    first = plots.get_data(make_fig([1, 2]))
+    with mpl.rc_context({"savefig.facecolor": "red"}):
+        second = plots.get_data(make_fig([1, 2]))
+    assert first != second
+    assert plots.cache.info()["misses"] == 2
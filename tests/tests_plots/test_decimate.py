@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+from flask_plots import eventplot_density, lttb, m4, thin_points
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import numpy as np
+
+import pytest as pt
+
+rng = np.random.default_rng(3)
+x = np.r_[rng.normal(scale=0.01, size=50_000), np.linspace(-3, 3, 20)]
+y = np.r_[rng.normal(scale=0.01, size=50_000), np.linspace(-3, 3, 20)]
+
+
+def make_ax():
+    ax = Figure(dpi=50).subplots()
+    ax.set(xlim=(-3.5, 3.5), ylim=(-3.5, 3.5))
+    return ax
+
+
+def test_thin_points_keeps_sparse_points():
+    keep = thin_points(make_ax(), x, y, threshold=2)
+    assert keep[-20:].all()
+    assert keep[:50_000].sum() < 200
+
+
+def test_thin_points_keeps_first_points_of_a_pixel():
+    keep = thin_points(make_ax(), [0, 0, 0, 1], [0, 0, 0, 1], threshold=2)
+    np.testing.assert_array_equal(keep, [True, True, False, True])
+
+
+@pt.mark.parametrize("method", ["scatter_hist2d", "scatter_hexbin"])
+def test_scatter_thin(app, plots, method):
+    fig = Figure(dpi=50)
+    c = np.arange(len(x))
+    with app.app_context():
+        getattr(plots, method)(fig, x, y, scatter_kws={"c": c}, thin=True)
+    offsets = fig.gca().collections[-1]
+    assert len(offsets.get_offsets()) < len(x) / 10
+    assert len(offsets.get_array()) == len(offsets.get_offsets())
+
+
+@pt.mark.parametrize(
+    "plots_config",
+    [{"PLOTS_SCATTER_THIN": True, "PLOTS_SCATTER_THIN_THRESHOLD": 3}],
+)
+def test_scatter_thin_config(app, plots):
+    with app.app_context():
+        fig = Figure(dpi=50)
+        plots.scatter_hist2d(fig, x, y)
+        thinned = len(fig.gca().collections[-1].get_offsets())
+        fig = Figure(dpi=50)
+        plots.scatter_hist2d(fig, x, y, thin=False)
+        assert len(fig.gca().collections[-1].get_offsets()) == len(x)
+    assert thinned < len(x) / 10
+
+
+def test_m4():
+    columns = [0, 0, 0, 0, 0, 1, 1, 1]
+    y = [3, 9, 1, 5, 4, 2, 2, 7]
+    np.testing.assert_array_equal(m4(columns, y), [0, 1, 2, 4, 5, 7])
+
+
+def test_m4_many_series():
+    columns = np.repeat(np.arange(10), 100)
+    y = rng.normal(size=(1000, 3))
+    index = m4(columns, y)
+    for column in range(10):
+        block = y[columns == column]
+        for series in range(3):
+            values = y[index, series]
+            assert block[:, series].min() in values
+            assert block[:, series].max() in values
+    assert len(index) <= 10 * (2 + 2 * 3)
+
+
+def test_lttb():
+    x = np.arange(1000.0)
+    index = lttb(x, np.sin(x / 50), 100)
+    assert index[0] == 0 and index[-1] == 999
+    assert len(index) <= 102
+
+
+def render(fig):
+    FigureCanvasAgg(fig).draw()
+    return np.asarray(fig.canvas.buffer_rgba(), float)
+
+
+@pt.mark.parametrize("decimate", ["m4", "lttb"])
+def test_line(app, plots, decimate):
+    t = np.linspace(0, 10, 200_000)
+    y = np.cumsum(rng.normal(size=(200_000, 2)), axis=0)
+    kws = {"antialiased": False}
+    fig, ref = Figure(), Figure()
+    with app.app_context():
+        ax = plots.line(fig, t, y, decimate=decimate, line_kws=kws)
+    ref.gca().plot(t, y, **kws)
+    assert len(ax.lines) == 2
+    assert len(ax.lines[0].get_xdata()) < 4000
+    assert ax.get_xlim() == ref.gca().get_xlim()
+    if decimate == "m4":
+        # Without antialiasing only a few pixels of the line differ.
+        assert ax.get_ylim() == ref.gca().get_ylim()
+        diff = np.any(render(fig) != render(ref), axis=-1)
+        assert diff.mean() < 1e-3
+
+
+def test_line_fixed_limits_and_dates(app, plots):
+    t = np.arange("2021-01-01", "2021-03-01", dtype="datetime64[m]")
+    fig = Figure()
+    ax = fig.gca()
+    ax.set_xlim(t[1000], t[20_000])
+    with app.app_context():
+        plots.line(fig, t, np.arange(len(t)))
+    xdata = ax.lines[0].get_xdata()
+    assert xdata[0] == t[999] and xdata[-1] == t[20_000]
+    assert len(xdata) < 4000
+
+
+def test_line_not_decimated(app, plots):
+    fig = Figure()
+    with app.app_context():
+        ax = plots.line(fig, np.arange(100_000.0), decimate=False)
+    assert len(ax.lines[0].get_xdata()) == 100_000
+    with app.app_context(), pt.raises(ValueError):
+        plots.line(fig, np.arange(100_000.0), decimate="mean")
+    with app.app_context():
+        ax = plots.line(fig, np.arange(100_000.0), line_kws={"marker": "."})
+    assert len(ax.lines[1].get_xdata()) == 100_000
+
+
+events = [np.sort(rng.uniform(0, 10, size)) for size in (5000, 3000, 10)]
+
+
+@pt.mark.parametrize("orientation", ["horizontal", "vertical"])
+def test_eventplot_density(app, plots, orientation):
+    kws = {"orientation": orientation, "colors": ["C0", "C1", "C2"]}
+    fig, ref = Figure(dpi=20), Figure(dpi=20)
+    with app.app_context():
+        ax = plots.eventplot(fig, events, eventplot_kws=kws)
+    ref.gca().eventplot(events, **kws)
+    assert len(ax.images) == 3 and not ax.collections
+    assert ax.get_xlim() == ref.gca().get_xlim()
+    assert ax.get_ylim() == ref.gca().get_ylim()
+    alpha = ax.images[2].get_array()[..., 3]
+    assert 0 < alpha.sum() <= 10
+
+
+def test_eventplot_density_alpha():
+    ax = Figure(dpi=20).gca()
+    (image,) = eventplot_density(ax, [[0, 0, 0, 10]], alpha=0.5, bins=2)
+    np.testing.assert_allclose(image.get_array()[0, :, 3], [0.875, 0.5])
+
+
+@pt.mark.parametrize(
+    "kws", [{}, {"linestyles": "dashed"}], ids=["small", "unsupported"]
+)
+def test_eventplot_keeps_lines(app, plots, kws):
+    positions = events if kws else events[2]
+    fig = Figure(dpi=20)
+    with app.app_context():
+        ax = plots.eventplot(fig, positions, eventplot_kws=kws)
+    assert ax.collections and not ax.images
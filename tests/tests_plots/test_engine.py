@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+import gc
+import weakref
+
+from flask import Flask
+
+from flask_plots import (
+    Plots,
+    ProcessRenderEngine,
+    rasterized_dense,
+    render_figure,
+)
+from flask_plots import engine as engine_module
+from flask_plots.engine import count_elements
+
+from matplotlib.figure import Figure
+
+import numpy as np
+
+import pytest as pt
+
+
+def test_process_engine(make_fig):
+    engine = ProcessRenderEngine(workers=1)
+    try:
+        assert engine.render(make_fig(), "png") == render_figure(
+            make_fig(), "png"
+        )
+    finally:
+        engine.shutdown()
+    assert engine._executor is None
+
+
+def test_process_engine_stopped_at_exit():
+    engine = ProcessRenderEngine(workers=1)
+    assert engine not in engine_module._running
+    engine.executor
+    assert engine in engine_module._running
+    engine_module._shutdown_running()
+    assert engine._executor is None
+    assert engine not in engine_module._running
+
+
+def test_plots_not_kept_alive():
+    ref = weakref.ref(Plots(Flask(__name__)))
+    gc.collect()
+    assert ref() is None
+
+
+def test_process_engine_unpicklable_figure(make_fig):
+    engine = ProcessRenderEngine(workers=1)
+    fig = make_fig()
+    fig.gca().xaxis.set_major_formatter(lambda x, pos: str(x))
+    assert engine.render(fig, "png").startswith(b"\x89PNG")
+    assert engine._executor is None
+
+
+@pt.mark.parametrize(
+    "plots_config",
+    [{"PLOTS_RENDER_ENGINE": "process", "PLOTS_RENDER_WORKERS": 1}],
+)
+def test_get_data_with_process_engine(plots, make_fig):
+    assert plots.get_bytes(make_fig()) == render_figure(make_fig(), "png")
+
+
+def test_invalid_render_engine(app):
+    app.config["PLOTS_RENDER_ENGINE"] = "gpu"
+    with pt.raises(ValueError):
+        Plots(app)
+
+
+def test_render_many(plots, make_fig):
+    broken = make_fig()
+    broken.savefig = None
+    results = plots.render_many([make_fig(), broken, make_fig()])
+    assert [result.data for result in results[::2]] == [
+        plots.get_data(make_fig())
+    ] * 2
+    assert results[1].data is None
+    assert isinstance(results[1].error, TypeError)
+    assert all(result.elapsed > 0 for result in results)
+
+
+@pt.mark.parametrize(
+    "plots_config",
+    [{"PLOTS_BATCH_EXECUTOR": "process", "PLOTS_RENDER_WORKERS": 2}],
+)
+def test_render_many_with_processes(plots, make_fig):
+    assert plots.engine is None
+    try:
+        results = plots.render_many([make_fig(), make_fig()], fmt="svg")
+    finally:
+        plots.shutdown()
+    assert all(result.error is None for result in results)
+    assert plots.batch_engine._executor is None
+
+
+def make_dense_fig():
+    fig = Figure(dpi=50)
+    ax = fig.subplots()
+    points = np.random.default_rng(0).normal(size=(2, 20_000))
+    ax.scatter(*points)
+    ax.plot([0, 1])
+    ax.set_title("Dense")
+    return fig
+
+
+def test_rasterized_dense():
+    fig = make_dense_fig()
+    scatter = fig.gca().collections[0]
+    with rasterized_dense(fig, "svg", 1000) as changed:
+        assert changed == [scatter]
+        assert scatter.get_rasterized()
+    assert not scatter.get_rasterized()
+    with rasterized_dense(fig, "png", 1000) as changed:
+        assert changed == []
+
+
+def test_count_elements():
+    fig = make_dense_fig()
+    ax = fig.gca()
+    mesh = ax.pcolormesh(np.zeros((30, 40)))
+    assert count_elements(mesh) == 1200
+    assert count_elements(ax.lines[0]) == 2
+    assert count_elements(ax.collections[0]) == 20_000
+
+
+@pt.mark.parametrize("plots_config", [{"PLOTS_RASTERIZE_THRESHOLD": 1000}])
+def test_get_data_rasterizes_dense_artists(plots):
+    svg = plots.get_bytes(make_dense_fig(), "svg")
+    assert b"<image" in svg
+    assert b"Dense" in svg
+    plots.rasterize_threshold = None
+    vector = plots.get_bytes(make_dense_fig(), "svg")
+    assert b"<image" not in vector
+    assert len(svg) < len(vector) / 10
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+from flask_plots import core, downsample_grid
+
+from matplotlib.colors import LogNorm, Normalize
+from matplotlib.figure import Figure
+from matplotlib.testing.decorators import check_figures_equal
+
+import numpy as np
+
+import pytest as pt
+
+
+def test_downsample_grid():
+    gx, gy = np.linspace(0, 1, 10), np.linspace(0, 2, 7)
+    z = np.arange(70.0).reshape(7, 10)
+    z[0, 0] = np.nan
+    xs, ys, zs = downsample_grid(gx, gy, z, (3, 4))
+    assert zs.shape == (3, 4)
+    assert zs[0, 0] == np.mean([1, 2, 10, 11, 12, 20, 21, 22])
+    assert zs[2, 3] == 69
+    assert (xs[0], xs[-1], ys[0], ys[-1]) == (0, 1, 0, 2)
+    mx, my = np.meshgrid(gx, gy)
+    xs2, ys2, _ = downsample_grid(mx, my, z, (3, 4))
+    np.testing.assert_allclose(xs2, np.tile(xs, (3, 1)))
+    np.testing.assert_allclose(ys2, np.tile(ys, (4, 1)).T)
+    assert downsample_grid(gx, gy, z, (7, 10))[2] is z
+
+
+cache_enabled = pt.mark.parametrize(
+    "plots_config", [{"PLOTS_CACHE_ENABLED": True}]
+)
+
+
+@pt.mark.skipif(not core.HAS_CONTOUR_PATHS, reason="needs Matplotlib 3.8")
+@cache_enabled
+@check_figures_equal(extensions=["png"])
+def test_contourf_cache(plots, fig_test, fig_ref):
+    gx, gy = np.linspace(-3, 3, 60), np.linspace(-2, 2, 40)
+    z = np.ma.masked_greater(np.exp(-(gx**2) - gy[:, None] ** 2), 0.9)
+    kws = {"cmap": "viridis"}
+    plots.contourf(Figure(), gx, gy, z, 6, contourf_kws=kws)
+    plots.contourf(fig_test, gx, gy, z, 6, contourf_kws=kws)
+    fig_test.colorbar(fig_test.axes[0].collections[0])
+    fig_ref.colorbar(fig_ref.gca().contourf(gx, gy, z, 6, **kws))
+    assert plots.cache.info()["hits"] == 1
+
+
+@pt.mark.skipif(not core.HAS_CONTOUR_PATHS, reason="needs Matplotlib 3.8")
+@cache_enabled
+def test_contourf_cache_restyled(plots):
+    gx, gy = np.linspace(-3, 3, 60), np.linspace(-2, 2, 40)
+    z = np.exp(-(gx**2) - gy[:, None] ** 2)
+    for kws in [
+        {"cmap": "viridis", "norm": Normalize(0, 1)},
+        {"cmap": "magma", "norm": Normalize(0, 1), "alpha": 0.5},
+        {"corner_mask": False},
+        {"norm": LogNorm()},
+    ]:
+        plots.contourf(Figure(), gx, gy, z, 6, contourf_kws=kws)
+    assert plots.cache.info()["hits"] == 1
+    assert plots.cache.info()["entries"] == 3
+
+
+@cache_enabled
+def test_contourf_without_contour_paths(plots, monkeypatch):
+    monkeypatch.setattr(core, "HAS_CONTOUR_PATHS", False)
+    gx, gy = np.linspace(-3, 3, 60), np.linspace(-2, 2, 40)
+    plots.contourf(Figure(), gx, gy, np.cos(gx) * gy[:, None], 6)
+    assert plots.cache.info()["entries"] == 0
+
+
+def test_contourf_resample(app, plots):
+    gx, gy = np.linspace(-3, 3, 3000), np.linspace(-2, 2, 2000)
+    z = np.sin(gx) * np.cos(gy[:, None])
+    ax = Figure(dpi=50).subplots()
+    plots.contourf(ax.figure, gx, gy, z, 5, ax=ax, resample=True)
+    assert ax.get_xlim() == (-3, 3) and ax.get_ylim() == (-2, 2)
+
+
+@pt.mark.parametrize("regrid, shape", [(None, (9, 12)), (40, (4, 6))])
+def test_quiver_regrid(app, plots, regrid, shape):
+    gx, gy = np.meshgrid(np.linspace(-1, 1, 500), np.linspace(-1, 1, 400))
+    ax = Figure(dpi=50).subplots()
+    with app.app_context():
+        plots.quiver(ax.figure, gx, gy, -gy, gx, ax=ax, regrid=regrid)
+        plots.quiver(ax.figure, gx, gy, -gy, gx, ax=ax, regrid=False)
+    regridded, full = ax.collections
+    assert regridded.N == np.prod(shape)
+    assert full.N == gx.size
+    # The means of the blocks, the edges are moved to the edges of the grid.
+    inner = (-regridded.U / regridded.Y).reshape(shape)[1:-1]
+    np.testing.assert_allclose(inner, 1)
+
+
+@pt.mark.parametrize(
+    "size, kws",
+    [(32, {}), (500, {"color": np.zeros((500 * 500, 4))})],
+)
+def test_quiver_no_regrid(app, plots, size, kws):
+    gx, gy = np.meshgrid(np.linspace(-1, 1, size), np.linspace(-1, 1, size))
+    ax = Figure().subplots()
+    with app.app_context():
+        plots.quiver(ax.figure, gx, gy, -gy, gx, ax=ax, quiver_kws=kws)
+    assert ax.collections[0].N == gx.size
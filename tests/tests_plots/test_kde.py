@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+from flask_plots.kde import exact_kde, fft_kde, violin_stats
+
+from matplotlib import mlab
+from matplotlib.figure import Figure
+from matplotlib.testing.decorators import check_figures_equal
+
+import numpy as np
+
+import pytest as pt
+
+rng = np.random.default_rng(42)
+x = np.r_[rng.normal(size=3000), rng.normal(5, 0.3, size=1000)]
+dataset = [x, rng.lognormal(size=2000)]
+
+
+@pt.mark.parametrize("bw_method", ["scott", "silverman", 0.2])
+def test_fft_kde(bw_method):
+    coords = np.linspace(x.min(), x.max(), 200)
+    expected = mlab.GaussianKDE(x, bw_method).evaluate(coords)
+    result = fft_kde(x, coords, bw_method)
+    np.testing.assert_allclose(result, expected, atol=1e-3 * expected.max())
+
+
+def test_fft_kde_errors():
+    with pt.raises(ValueError):
+        fft_kde([1.0], [1.0])
+    with pt.raises(ValueError):
+        fft_kde([1.0, 1.0], [1.0])
+    with pt.raises(ValueError):
+        violin_stats(dataset, bw_method="other")
+
+
+@check_figures_equal(extensions=["png"])
+def test_violinplot_stats(plots, fig_test, fig_ref):
+    vpstats = violin_stats(dataset, kde="exact")
+    plots.violinplot(fig_test, vpstats, [1, 3], violinplot_kws={"widths": 1})
+    fig_ref.gca().violinplot(dataset, [1, 3], widths=1)
+
+
+@pt.mark.parametrize(
+    "plots_config",
+    [{"PLOTS_VIOLIN_FFT_THRESHOLD": 0, "PLOTS_CACHE_ENABLED": True}],
+)
+def test_violinplot_fft(app, plots):
+    with app.app_context():
+        vp = plots.violinplot(Figure(), dataset, [1, 2])
+        plots.violinplot(Figure(), dataset, [1, 2])
+    expected = Figure().gca().violinplot(dataset, [1, 2])
+    for body, ref in zip(vp["bodies"], expected["bodies"]):
+        np.testing.assert_allclose(
+            body.get_paths()[0].vertices,
+            ref.get_paths()[0].vertices,
+            atol=1e-3,
+        )
+    assert plots.cache.info()["hits"] == 1
+
+
+def test_exact_kde():
+    coords = np.linspace(0, 2, 5)
+    expected = mlab.GaussianKDE(x, 0.3).evaluate(coords)
+    np.testing.assert_array_equal(exact_kde(0.3)(x, coords), expected)
+    np.testing.assert_array_equal(
+        exact_kde()(np.ones(5), coords), [0, 0, 1, 0, 0]
+    )
+
+
+@pt.mark.parametrize("plots_config", [{"PLOTS_VIOLIN_FFT_THRESHOLD": 0}])
+@check_figures_equal(extensions=["png"], tol=0.05)
+def test_violinplot_fft_constant(app, plots, fig_test, fig_ref):
+    data = [np.ones(100), x]
+    with app.app_context():
+        plots.violinplot(fig_test, data, [1, 2])
+    fig_ref.gca().violinplot(data, [1, 2])
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+import io
+
+from matplotlib.figure import Figure
+from matplotlib.image import imread
+
+import numpy as np
+
+
+def make_background():
+    fig = Figure(figsize=(4, 3), dpi=50)
+    ax = fig.subplots()
+    ax.set(xlim=(0, 8), ylim=(0, 8), title="Live Chart")
+    return fig
+
+
+def pixels(data):
+    return imread(io.BytesIO(data))
+
+
+def test_live_figure(app, plots):
+    live = plots.live(make_background())
+    frames = []
+    for heights in ([3, 5, 4], [6, 2, 1]):
+        with app.app_context():
+            plots.errorbar(
+                live.figure,
+                [2, 4, 6],
+                heights,
+                errorbar_kws={"yerr": [0.5, 1, 0.5], "fmt": "o"},
+            )
+            plots.bar(live.figure, [2, 4, 6], heights)
+        assert len(live.data_artists()) > 0
+        frames.append(live.get_bytes())
+        assert live.data_artists() == []
+        assert live.figure.gca().containers == []
+
+        expected = make_background()
+        ax = expected.gca()
+        ax.errorbar([2, 4, 6], heights, yerr=[0.5, 1, 0.5], fmt="o")
+        ax.bar([2, 4, 6], heights)
+        assert np.array_equal(
+            pixels(frames[-1]), pixels(plots.get_bytes(expected))
+        )
+    assert frames[0] != frames[1]
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+from flask_plots import HexbinAccumulator, Hist2dAccumulator, ParallelBinner
+
+from matplotlib.figure import Figure
+
+import numpy as np
+
+import pytest as pt
+
+rng = np.random.default_rng(7)
+x = rng.normal(size=20_000)
+y = rng.normal(size=20_000)
+
+
+@pt.fixture
+def binner():
+    binner = ParallelBinner(workers=3, threshold=1000, chunk_size=4096)
+    yield binner
+    binner.shutdown()
+
+
+@pt.mark.parametrize("memmap", [False, True])
+def test_parallel_hist2d(binner, tmp_path, memmap):
+    xs, ys = x, y
+    if memmap:
+        np.save(tmp_path / "x.npy", x)
+        np.save(tmp_path / "y.npy", y)
+        xs = np.load(tmp_path / "x.npy", mmap_mode="r")
+        ys = np.load(tmp_path / "y.npy", mmap_mode="r")
+    acc = binner.fill(Hist2dAccumulator.for_data(xs, ys, bins=17), xs, ys)
+    serial = Hist2dAccumulator.from_array(x, y, bins=17)
+    np.testing.assert_array_equal(acc.counts, serial.counts)
+
+
+def test_parallel_hexbin(binner):
+    acc = binner.fill(HexbinAccumulator.for_data(x, y, gridsize=30), x, y)
+    serial = HexbinAccumulator.from_array(x, y, gridsize=30)
+    np.testing.assert_array_equal(acc.counts, serial.counts)
+    assert binner._executor is not None
+
+
+def test_accepts(binner):
+    assert binner.accepts(x, {"cmap": "Greys"})
+    assert not binner.accepts(x, {"C": y})
+    assert not binner.accepts(x[:10])
+
+
+parallel_binning = pt.mark.parametrize(
+    "plots_config",
+    [
+        {
+            "PLOTS_PARALLEL_BINNING": True,
+            "PLOTS_PARALLEL_WORKERS": 2,
+            "PLOTS_PARALLEL_THRESHOLD": 1000,
+        }
+    ],
+)
+
+
+@parallel_binning
+def test_plots_parallel_binning(plots):
+    fig_test, fig_ref = Figure(), Figure()
+    plots.hexbin(fig_test, x, y, hexbin_kws={"gridsize": 20})
+    fig_ref.gca().hexbin(x, y, gridsize=20)
+    assert plots.get_bytes(fig_test) == plots.get_bytes(fig_ref)
+    plots.shutdown()
+    assert plots.binner._executor is None
+
+
+@parallel_binning
+@pt.mark.parametrize("path", [False, True])
+def test_plots_parallel_hist2d(plots, tmp_path, path):
+    xs, ys = x, y
+    if path:
+        xs, ys = tmp_path / "x.npy", tmp_path / "y.npy"
+        np.save(xs, x)
+        np.save(ys, y)
+    fig_test, fig_ref = Figure(), Figure()
+    plots.hist2d(fig_test, xs, ys, hist2d_kws={"bins": 20})
+    fig_ref.gca().hist2d(x, y, bins=20)
+    assert plots.get_bytes(fig_test) == plots.get_bytes(fig_ref)
+    assert plots.binner._executor is not None
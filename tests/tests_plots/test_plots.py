@@ -14,8 +14,12 @@
 # =====================================================================
 
 
+import base64
+
 from flask import current_app
 
+from flask_plots import render_figure
+
 from matplotlib.figure import Figure
 
 import pytest as pt
@@ -35,3 +39,23 @@ class TestPlots:
         ax.plot([1, 2])
         data = plots.get_data(fig)
         assert data is not None
+
+    @pt.mark.parametrize("fmt", ["png", "svg", "pdf", "jpg", "tif"])
+    def test_get_data_matches_base64(self, plots, fmt):
+        fig = Figure(dpi=50)
+        ax = fig.subplots()
+        ax.plot([1, 2])
+        data = plots.get_data(fig, fmt=fmt)
+        expected = base64.b64encode(render_figure(fig, fmt)).decode()
+        if fmt in ("png", "jpg", "tif"):
+            assert data == expected
+        else:
+            assert base64.b64decode(data)[:4] == base64.b64decode(expected)[:4]
+
+    def test_iter_data(self, plots):
+        fig = Figure()
+        ax = fig.subplots()
+        ax.plot([1, 2])
+        chunks = list(plots.iter_data(fig, chunk_size=1000))
+        assert len(chunks) > 1
+        assert "".join(chunks) == plots.get_data(fig)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+from flask_plots import FigurePool
+from flask_plots.pool import _has_layout
+
+from matplotlib.figure import Figure
+
+import pytest as pt
+
+
+def draw(fig):
+    ax = fig.gca()
+    ax.bar(["Argentina", "Brasil", "Colombia"], [14, 40, 16])
+    ax.set_title("Bar Chart")
+
+
+def test_pooled_figure_is_reused(app, plots):
+    with plots.pooled_figure() as fig:
+        draw(fig)
+        first = plots.get_bytes(fig)
+    assert len(plots.figure_pool) == 1
+    with plots.pooled_figure() as other:
+        draw(other)
+        assert other is fig
+        assert plots.get_bytes(other) == first
+
+
+def test_pool_reset_does_not_leak_state(plots):
+    pool = FigurePool(size=2)
+    fig = pool.acquire()
+    ax = fig.gca()
+    ax.plot([1, 100])
+    ax.set_yscale("log")
+    ax.set_xlim(0, 5)
+    ax.grid(True)
+    ax.set_position([0.3, 0.3, 0.4, 0.4])
+    fig.set_size_inches(2, 2)
+    fig.set_dpi(20)
+    fig.set_facecolor("red")
+    plots.get_bytes(fig)
+    pool.release(fig)
+
+    reused = pool.acquire()
+    assert reused is fig
+    draw(reused)
+    fresh = FigurePool(size=1).acquire()
+    draw(fresh)
+    assert plots.get_bytes(reused) == plots.get_bytes(fresh)
+
+
+def test_pooled_figure_pie_then_bar(app, plots):
+    with plots.pooled_figure() as fig:
+        ax = fig.gca()
+        ax.pie([14, 40, 16], labels=["Argentina", "Brasil", "Colombia"])
+        ax.set(facecolor="red", anchor="N", box_aspect=0.5, zorder=3)
+        ax.set_rasterization_zorder(1)
+        ax.axis("off")
+        fig.subplots_adjust(left=0.3, wspace=0.5)
+        plots.get_bytes(fig)
+
+    with plots.pooled_figure() as reused:
+        assert reused is fig
+        draw(reused)
+        bars = plots.get_bytes(reused)
+    fresh = FigurePool(size=1).acquire()
+    draw(fresh)
+    assert bars == plots.get_bytes(fresh)
+    assert vars(reused.subplotpars) == vars(fresh.subplotpars)
+
+
+def test_pool_drops_figures_with_other_layout():
+    pool = FigurePool(size=2)
+    fig = pool.acquire()
+    fig.suptitle("Title")
+    pool.release(fig)
+    fig = pool.acquire()
+    fig.colorbar(fig.gca().imshow([[1, 2]]))
+    pool.release(fig)
+    pool.release(Figure())
+    assert len(pool) == 0
+
+
+class OldFigure(object):
+    """The layout getters of a figure before Matplotlib 3.6."""
+
+    def __init__(self, tight=False, constrained=False):
+        self.tight, self.constrained = tight, constrained
+
+    def get_tight_layout(self):
+        return self.tight
+
+    def get_constrained_layout(self):
+        return self.constrained
+
+
+def test_has_layout():
+    assert not _has_layout(Figure())
+    assert _has_layout(Figure(layout="tight"))
+    assert not _has_layout(OldFigure())
+    assert _has_layout(OldFigure(tight=True))
+    assert _has_layout(OldFigure(constrained=True))
+
+
+def test_pool_size():
+    pool = FigurePool(size=1)
+    figures = [pool.acquire(), pool.acquire(), pool.acquire(2, 1)]
+    for fig in figures:
+        pool.release(fig)
+    assert len(pool) == 1
+    assert pool.acquire() is figures[0]
+    assert len(pool.acquire(2, 1).axes) == 2
+
+
+def make_template():
+    fig = Figure(figsize=(4, 3))
+    ax = fig.subplots()
+    ax.set_title("Bar Chart")
+    ax.set_ylim(0, 50)
+    return fig
+
+
+def test_from_template(plots):
+    built = []
+
+    @plots.figure_template()
+    def bars():
+        built.append(True)
+        return make_template()
+
+    fig = plots.from_template("bars")
+    other = plots.from_template("bars")
+    assert fig is not other
+    assert built == [True]
+    draw(fig)
+    expected = make_template()
+    draw(expected)
+    assert plots.get_bytes(fig) == plots.get_bytes(expected)
+    assert plots.get_bytes(other) == plots.get_bytes(make_template())
+
+
+@pt.mark.parametrize(
+    "plots_config", [{"PLOTS_FIGURE_TEMPLATES": {"bars": make_template}}]
+)
+def test_templates_from_config(plots):
+    assert plots.from_template("bars").get_size_inches().tolist() == [4, 3]
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+
+from flask import render_template_string, request
+
+from matplotlib.figure import Figure
+
+
+def test_serve_figure(app, plots):
+    @plots.figure("linear")
+    def linear():
+        fig = Figure()
+        ax = fig.subplots()
+        ax.plot([1, int(request.args.get("end", 4))])
+        return fig
+
+    client = app.test_client()
+    response = client.get("/plots/linear.png")
+    assert response.status_code == 200
+    assert response.mimetype == "image/png"
+    assert response.data.startswith(b"\x89PNG")
+
+    response = client.get("/plots/linear.svg?end=2")
+    assert response.mimetype == "image/svg+xml"
+    assert b"<svg" in response.data
+
+    assert client.get("/plots/linear.txt").status_code == 404
+    assert client.get("/plots/missing.png").status_code == 404
+
+
+def test_render_img_url(app, plots):
+    plots.register_figure("linear", Figure)
+
+    @app.route("/render-image-url")
+    def render_image_url():
+        return render_template_string(
+            """{% from 'plots/utils.html' import render_img_url %}
+            {{ render_img_url('linear', 'some_img', fmt='svg',
+                              params={'end': 2}, class_img='ui') }}
+            """
+        )
+
+    data = app.test_client().get("/render-image-url").get_data(as_text=True)
+    assert (
+        '<img src="/plots/linear.svg?end=2" alt="some_img" class="ui"/>'
+        in data
+    )
+
+
+def test_serve_figure_conditional_get(app, plots, monkeypatch):
+    data = {"end": 4}
+
+    @plots.figure("linear")
+    def linear():
+        fig = Figure()
+        ax = fig.subplots()
+        ax.plot([1, data["end"]])
+        return fig
+
+    client = app.test_client()
+    response = client.get("/plots/linear.png")
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+    assert response.status_code == 200
+    assert response.cache_control.max_age == 0
+
+    rendered = []
+    monkeypatch.setattr(
+        Figure, "savefig", lambda *args, **kws: rendered.append(args)
+    )
+    response = client.get("/plots/linear.png", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+    response = client.get(
+        "/plots/linear.png", headers={"If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 304
+    assert rendered == []
+    monkeypatch.undo()
+
+    data["end"] = 2
+    response = client.get("/plots/linear.png", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+from flask_plots import QuantileSketch
+
+from matplotlib import cbook
+from matplotlib.figure import Figure
+from matplotlib.testing.decorators import check_figures_equal
+
+import numpy as np
+
+import pytest as pt
+
+rng = np.random.default_rng(42)
+data = [rng.lognormal(size=3000), rng.normal(size=2000) * 10]
+
+
+@pt.mark.parametrize("values", data)
+def test_quantile_relative_accuracy(values):
+    sketch = QuantileSketch(0.01)
+    for chunk in np.array_split(values, 7):
+        sketch.add(chunk)
+    q = np.linspace(0, 1, 41)
+    expected = np.quantile(values, q, method="lower")
+    np.testing.assert_allclose(sketch.quantile(q), expected, rtol=0.0101)
+    assert sketch.count == len(values)
+    assert sketch.min == values.min() and sketch.max == values.max()
+
+
+def test_merge():
+    whole = QuantileSketch().add(data[1])
+    half = QuantileSketch().add(data[1][:1000])
+    half.merge(QuantileSketch().add(data[1][1000:]))
+    q = [0.1, 0.5, 0.9]
+    np.testing.assert_array_equal(half.quantile(q), whole.quantile(q))
+    with pt.raises(ValueError):
+        half.merge(QuantileSketch(0.05))
+
+
+def test_stats():
+    sketch = QuantileSketch().add(data[0])
+    stats = sketch.stats(label="a")
+    (expected,) = cbook.boxplot_stats(data[0], labels=["a"])
+    for key in ["med", "q1", "q3", "whislo", "whishi"]:
+        assert stats[key] == pt.approx(expected[key], rel=0.02)
+    assert stats["label"] == "a"
+    assert stats["mean"] == pt.approx(expected["mean"])
+    assert (stats["fliers"] > stats["whishi"]).any()
+    stats = sketch.stats(whis=(0, 100))
+    assert (stats["whislo"], stats["whishi"]) == (sketch.min, sketch.max)
+    assert not len(stats["fliers"])
+
+
+@check_figures_equal(extensions=["png"])
+def test_boxplot_stats(plots, fig_test, fig_ref):
+    stats = cbook.boxplot_stats(data)
+    kws = {"notch": True, "patch_artist": True, "tick_labels": ["a", "b"]}
+    plots.boxplot(fig_test, stats, boxplot_kws=kws)
+    fig_ref.gca().boxplot(data, **kws)
+
+
+def test_boxplot_sketches(plots):
+    sketches = [QuantileSketch().add(values) for values in data]
+    ax = plots.boxplot(Figure(), sketches, boxplot_kws={"whis": 2})
+    assert len(ax.lines) == 2 * 7
+    ax = plots.boxplot(Figure(), sketches[0])
+    assert len(ax.lines) == 7
+
+
+@pt.mark.parametrize(
+    "kws", [{"sym": "g+"}, {"sym": "d", "flierprops": {"alpha": 0.5}}]
+)
+@check_figures_equal(extensions=["png"])
+def test_boxplot_stats_sym(plots, fig_test, fig_ref, kws):
+    plots.boxplot(fig_test, cbook.boxplot_stats(data), boxplot_kws=kws)
+    fig_ref.gca().boxplot(data, **kws)
+
+
+def test_boxplot_stats_no_fliers(plots):
+    stats = cbook.boxplot_stats(data)
+    ax = plots.boxplot(Figure(), stats, boxplot_kws={"sym": ""})
+    assert len(ax.lines) == 2 * 6
+
+
+@pt.mark.parametrize(
+    "kws", [{"bootstrap": 100}, {"usermedians": [1, 2]}, {"autorange": True}]
+)
+def test_boxplot_stats_raw_data_kws(plots, kws):
+    with pt.raises(ValueError, match="precomputed"):
+        plots.boxplot(Figure(), cbook.boxplot_stats(data), boxplot_kws=kws)
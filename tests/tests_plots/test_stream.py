@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+
+from flask import render_template_string
+
+from matplotlib.figure import Figure
+
+import pytest as pt
+
+
+def setup():
+    fig = Figure(figsize=(4, 3), dpi=50)
+    ax = fig.subplots()
+    ax.set(xlim=(0, 8), ylim=(0, 8), title="Live Chart")
+    return fig
+
+
+def register_load(plots):
+    heights = iter([[3, 5, 4], [3, 5, 4], [6, 2, 1]])
+
+    def update(fig):
+        plots.bar(fig, [2, 4, 6], next(heights, [1, 1, 1]))
+
+    plots.register_stream("load", setup, update)
+
+
+@pt.mark.parametrize(
+    "plots_config",
+    [{"PLOTS_STREAM_INTERVAL": 0, "PLOTS_STREAM_MAX_FRAMES": 3}],
+)
+def test_stream_skips_unchanged_frames(app, plots):
+    register_load(plots)
+    response = app.test_client().get("/plots/load/stream")
+    assert response.mimetype == "text/event-stream"
+    assert response.cache_control.no_cache
+    events = response.get_data(as_text=True).split("\n\n")[:-1]
+    assert [event.split("\n")[:2] for event in events] == [
+        ["event: frame", "id: 0"],
+        [": keepalive"],
+        ["event: frame", "id: 2"],
+    ]
+    assert (
+        events[0]
+        .split("\n")[2]
+        .startswith("data: data:image/png;base64,iVBORw0KGgo")
+    )
+
+
+@pt.mark.parametrize(
+    "plots_config", [{"PLOTS_STREAM_INTERVAL": 0, "PLOTS_STREAM_MAX": 1}]
+)
+def test_stream_limit(app, plots):
+    register_load(plots)
+    client = app.test_client()
+    first = client.get("/plots/load/stream", buffered=False)
+    assert next(first.response).startswith(b"event: frame")
+    assert client.get("/plots/load/stream").status_code == 503
+    first.close()
+    second = client.get("/plots/load/stream", buffered=False)
+    assert second.status_code == 200
+    second.close()
+    assert client.get("/plots/missing/stream").status_code == 404
+
+
+@pt.mark.parametrize(
+    "plots_config", [{"PLOTS_STREAM_INTERVAL": 0, "PLOTS_STREAM_MAX": 1}]
+)
+def test_stream_keepalive_releases_slot(app, plots):
+    plots.register_stream("still", setup, lambda fig: None)
+    client = app.test_client()
+    gone = client.get("/plots/still/stream", buffered=False)
+    assert next(gone.response).startswith(b"event: frame")
+    assert next(gone.response) == b": keepalive\n\n"
+    # The server closes the response when the keepalive can't be sent.
+    gone.close()
+    other = client.get("/plots/still/stream", buffered=False)
+    assert other.status_code == 200
+    other.close()
+
+
+def test_render_img_stream(app, plots):
+    plots.register_stream("load", setup, lambda fig: None)
+
+    @app.route("/render-image-stream")
+    def render_image_stream():
+        return render_template_string(
+            """{% from 'plots/utils.html' import render_img_stream %}
+            {{ render_img_stream('load', 'some_img') }}
+            """
+        )
+
+    data = app.test_client().get("/render-image-stream").get_data(True)
+    assert (
+        '<img data-plots-stream="/plots/load/stream" alt="some_img"/>' in data
+    )
+    assert "new EventSource" in data
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of the
+#   Flask-Plots Project
+#                      https://github.com/juniors90/Flask-Plots/
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-Plots/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+from flask_plots import StreamTrajectories, core, streamlines
+
+import matplotlib as mpl
+from matplotlib import streamplot as mstreamplot
+from matplotlib.figure import Figure
+from matplotlib.testing.decorators import check_figures_equal
+
+import numpy as np
+
+import pytest as pt
+
+w = 3
+gy, gx = np.mgrid[-w:w:60j, -w:w:40j]
+u = -1 - gx**2 + gy
+v = 1 + gx - gy**2
+speed = np.sqrt(u**2 + v**2)
+
+cache_enabled = pt.mark.parametrize(
+    "plots_config", [{"PLOTS_CACHE_ENABLED": True}]
+)
+needs_integrator = pt.mark.skipif(
+    not core.HAS_STREAM_INTEGRATOR, reason="needs Matplotlib 3.11"
+)
+
+
+@cache_enabled
+@needs_integrator
+@pt.mark.parametrize(
+    "kws",
+    [
+        {},
+        {"density": [0.5, 1], "color": speed, "cmap": "autumn"},
+        {"linewidth": 5 * speed / speed.max(), "num_arrows": 3},
+        {"start_points": [[0, 0], [1, 1]], "integration_direction": "forward"},
+    ],
+)
+@check_figures_equal(extensions=["png"])
+def test_streamplot_cache(plots, fig_test, fig_ref, kws):
+    plots.streamplot(Figure(), gx, gy, u, v, streamplot_kws=kws)
+    plots.streamplot(fig_test, gx, gy, u, v, streamplot_kws=kws)
+    fig_ref.gca().streamplot(gx, gy, u, v, **kws)
+    assert plots.cache.info()["hits"] == 1
+
+
+@cache_enabled
+@needs_integrator
+def test_streamplot_cache_restyled(plots):
+    plots.streamplot(Figure(), gx, gy, u, v)
+    kws = {"color": "k", "linewidth": 2, "arrowstyle": "->"}
+    plots.streamplot(Figure(), gx, gy, u, v, streamplot_kws=kws)
+    plots.streamplot(Figure(), gx, gy, u, v, streamplot_kws={"density": 2})
+    assert plots.cache.info()["hits"] == 1
+    assert plots.cache.info()["entries"] == 2
+
+
+@needs_integrator
+def test_stream_trajectories_errors():
+    with pt.raises(ValueError):
+        StreamTrajectories.integrate(gx, gy, u[1:], v[1:])
+    with pt.raises(ValueError):
+        StreamTrajectories.integrate(gx, gy, u, v, start_points=[[9, 9]])
+
+
+@cache_enabled
+@check_figures_equal(extensions=["png"])
+def test_streamplot_without_integrator(plots, monkeypatch, fig_test, fig_ref):
+    monkeypatch.setattr(core, "HAS_STREAM_INTEGRATOR", False)
+    plots.streamplot(fig_test, gx, gy, u, v)
+    fig_ref.gca().streamplot(gx, gy, u, v)
+    assert plots.cache.info()["entries"] == 0
+
+
+def get_integrator(u, v, dmap, minlength, maxlength, integration_direction):
+    """The private integrator of Matplotlib 3.11."""
+
+
+@pt.mark.parametrize(
+    "version, integrator, expected",
+    [
+        ((3, 11, 2), get_integrator, True),
+        ((3, 10, 0), get_integrator, False),
+        ((3, 12, 0), get_integrator, False),
+        ((3, 11, 2), lambda u, v, dmap, minlength: None, False),
+    ],
+)
+def test_has_stream_integrator(monkeypatch, version, integrator, expected):
+    monkeypatch.setattr(mpl, "__version_info__", version)
+    monkeypatch.setattr(mstreamplot, "_get_integrator", integrator)
+    assert streamlines._has_stream_integrator() is expected